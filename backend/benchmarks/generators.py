@@ -0,0 +1,263 @@
+"""
+Deterministic synthetic Moodle and CS50 exports for sizing the import paths.
+
+All three files are generated from one roster, so the emails of the participant
+list, the GitHub names of the assignment worksheet and the usernames of the CS50
+export refer to the same students. The quirks of the real exports are kept: a
+UTF-8 BOM and German headers in the Moodle CSVs, empty cells that pandas reads
+as NaN, duplicate rows with differently cased emails, GitHub names with trailing
+blanks and CS50 exports spanning several slugs with null check results.
+
+Usage (from ``backend/``)::
+
+    PYTHONPATH=src uv run python -m benchmarks.generators --students 10000 --out /tmp/sizing
+"""
+
+import argparse
+import csv
+import io
+import json
+import random
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from repositories.mongo.submission_codec import archive_url, github_url
+from services.moodle_worksheet_export import (
+    BOM,
+    MOODLE_TIMEZONE,
+    WORKSHEET_HEADER,
+    format_moodle_date,
+)
+
+PARTICIPANTS_HEADER = (
+    "Vorname",
+    "Nachname",
+    "ID-Nummer",
+    "Institution",
+    "Abteilung",
+    "E-Mail-Adresse",
+)
+
+FIRST_NAMES = (
+    "Max",
+    "Maxina",
+    "Jürgen",
+    "Ömer",
+    "Anna-Lena",
+    "Lukas",
+    "Sophie",
+    "Zoë",
+    "Finn",
+    "Hannah",
+    "Noah",
+    "Leonie",
+)
+LAST_NAMES = (
+    "Mustermann",
+    "Müller",
+    "Schmidt",
+    "Groß",
+    "Weber",
+    "van der Berg",
+    "Öztürk",
+    "Becker",
+    "Hoffmann",
+    "Schäfer",
+)
+DOMAINS = ("hs-duesseldorf.de", "study.hs-duesseldorf.de", "mail.de")
+STATUSES = (
+    "Zur Bewertung abgegeben - Bewertet -  - ",
+    "Zur Bewertung abgegeben - 3 Tage 2 Stunden zu spät -  - ",
+    "Kein Versuch - Nicht bewertet -  - ",
+)
+GRADES = ("", "bestanden", "nicht bestanden")
+SCALE = "nicht bestanden    bestanden"
+SLUG_PREFIX = "hsddigitallabor/problems/adg2025"
+CHECKS_RUN = 13
+START = datetime(2025, 10, 1, tzinfo=UTC)
+
+TRANSLITERATION = str.maketrans({
+    "ä": "ae",
+    "ö": "oe",
+    "ü": "ue",
+    "ß": "ss",
+    "ë": "e",
+    " ": "",
+    "-": "",
+})
+
+
+@dataclass(frozen=True)
+class Person:
+    participant_id: int
+    first_name: str
+    last_name: str
+    email: str
+    github_username: str | None
+    github_id: int | None
+
+
+def _ascii(name: str) -> str:
+    return name.lower().translate(TRANSLITERATION)
+
+
+def roster(students: int, seed: int, github_rate: float = 0.9) -> list[Person]:
+    """Students with unique emails; ``github_rate`` of them have a GitHub account."""
+    rng = random.Random(seed)
+    people = []
+    for i in range(students):
+        first = rng.choice(FIRST_NAMES)
+        last = rng.choice(LAST_NAMES)
+        has_github = rng.random() < github_rate
+        people.append(
+            Person(
+                participant_id=1_000_000 + i,
+                first_name=first,
+                last_name=last,
+                email=f"{_ascii(first)}.{_ascii(last)}{i}@{rng.choice(DOMAINS)}",
+                github_username=f"{_ascii(first)}-{_ascii(last)}{i}" if has_github else None,
+                github_id=10_000_000 + i if has_github else None,
+            )
+        )
+    return people
+
+
+def _render_csv(header: tuple[str, ...], rows: list[list[str]], bom: bool) -> bytes:
+    buffer = io.StringIO()
+    if bom:
+        buffer.write(BOM)
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(header)
+    writer.writerows(rows)
+    return buffer.getvalue().encode()
+
+
+def participants_csv(
+    people: list[Person],
+    seed: int,
+    duplicate_rate: float = 0.02,
+    missing_email_rate: float = 0.01,
+    bom: bool = True,
+) -> bytes:
+    """Moodle participant export, the input of ``POST /enroll/{course_id}``."""
+    rng = random.Random(seed)
+    rows = []
+    for person in people:
+        email = "" if rng.random() < missing_email_rate else person.email
+        row = [
+            person.first_name,
+            person.last_name,
+            str(person.participant_id) if rng.random() < 0.8 else "",
+            "HSD" if rng.random() < 0.5 else "",
+            "",
+            email,
+        ]
+        rows.append(row)
+        if email and rng.random() < duplicate_rate:
+            # the same participant listed twice, typed with a different casing
+            rows.append([*row[:-1], f" {email.capitalize()} "])
+    return _render_csv(PARTICIPANTS_HEADER, rows, bom)
+
+
+def assignment_csv(
+    people: list[Person], seed: int, missing_rate: float = 0.1, bom: bool = True
+) -> bytes:
+    """Moodle assignment worksheet whose online text holds the student's GitHub name."""
+    rng = random.Random(seed)
+    rows = []
+    for person in people:
+        submitted = START + timedelta(minutes=rng.randint(0, 60 * 24 * 60))
+        github_name = person.github_username
+        if github_name is None or rng.random() < missing_rate:
+            github_name = ""
+        elif rng.random() < 0.3:
+            github_name += "   "
+        rows.append([
+            f"Teilnehmer/in{person.participant_id}",
+            f"{person.first_name} {person.last_name}",
+            person.email,
+            rng.choice(STATUSES),
+            rng.choice(GRADES),
+            SCALE,
+            "Ja",
+            format_moodle_date(submitted),
+            github_name,
+            format_moodle_date(submitted),
+            "",
+        ])
+    return _render_csv(WORKSHEET_HEADER, rows, bom)
+
+
+def slugs(count: int) -> list[str]:
+    return [f"{SLUG_PREFIX}/problem{i}" for i in range(count)]
+
+
+def _cs50_timestamp(value: datetime) -> str:
+    # the format of submit.cs50.io, e.g. "Mon, 01 Dec 2025 08:53:16PM CET"
+    local = value.astimezone(MOODLE_TIMEZONE)
+    return f"{local:%a, %d %b %Y %I:%M:%S%p} {local.tzname()}"
+
+
+def cs50_export(
+    people: list[Person],
+    problem_slugs: list[str],
+    seed: int,
+    submissions_per_student: int = 3,
+) -> dict[str, list[dict]]:
+    """CS50 export keyed by slug, one to ``2 * submissions_per_student - 1`` per student."""
+    rng = random.Random(seed)
+    export: dict[str, list[dict]] = {slug: [] for slug in problem_slugs}
+    for person in people:
+        if person.github_username is None:
+            continue
+        for slug in problem_slugs:
+            for _ in range(rng.randint(1, submissions_per_student * 2 - 1)):
+                commit = f"{rng.getrandbits(160):040x}"
+                checked = rng.random() < 0.9
+                export[slug].append({
+                    "archive": archive_url(person.github_username, commit),
+                    "checks_passed": rng.randint(0, CHECKS_RUN) if checked else None,
+                    "checks_run": CHECKS_RUN if checked else None,
+                    "github_id": person.github_id,
+                    "github_url": github_url(person.github_username, commit),
+                    "github_username": person.github_username,
+                    "name": f"{person.first_name} {person.last_name}"
+                    if rng.random() < 0.3
+                    else None,
+                    "slug": slug,
+                    "style50_score": round(rng.random(), 2),
+                    "timestamp": _cs50_timestamp(
+                        START + timedelta(seconds=rng.randint(0, 60 * 60 * 24 * 60))
+                    ),
+                })
+    return export
+
+
+def cs50_json(export: dict[str, list[dict]]) -> bytes:
+    return json.dumps(export, indent=4).encode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--students", type=int, default=1000)
+    parser.add_argument("--slugs", type=int, default=5)
+    parser.add_argument("--submissions-per-student", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=50)
+    parser.add_argument("--out", type=Path, required=True)
+    args = parser.parse_args()
+
+    people = roster(args.students, args.seed)
+    export = cs50_export(people, slugs(args.slugs), args.seed, args.submissions_per_student)
+
+    args.out.mkdir(parents=True, exist_ok=True)
+    (args.out / "participants.csv").write_bytes(participants_csv(people, args.seed))
+    (args.out / "assignment.csv").write_bytes(assignment_csv(people, args.seed))
+    (args.out / "cs50.json").write_bytes(cs50_json(export))
+
+    submissions = sum(len(s) for s in export.values())
+    print(f"{len(people)} students, {len(export)} slugs, {submissions} submissions -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Measures lookups by the application ``id`` field before and after the declared
+course indexes are applied. Needs a running mongod; the scratch database is
+dropped afterwards.
+
+Usage (from ``backend/``)::
+
+    PYTHONPATH=src uv run python -m benchmarks.id_lookup --uri mongodb://localhost:27017
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from pymongo import MongoClient
+
+from models.course import Course
+from repositories.mongo.course_repository import MongoCourseRepository
+from repositories.mongo.migration import init_course_collection
+
+
+def measure(repository: MongoCourseRepository, ids: list[str]) -> list[float]:
+    durations = []
+    for item_id in ids:
+        start = time.perf_counter()
+        repository.get(item_id)
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+def summary(label: str, durations: list[float]) -> str:
+    quantiles = statistics.quantiles(durations, n=100)
+    return (
+        f"{label:<12} mean={statistics.fmean(durations):8.3f}ms "
+        f"p50={quantiles[49]:8.3f}ms p99={quantiles[98]:8.3f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--uri", default="mongodb://localhost:27017")
+    parser.add_argument("--database", default="cs50-moodle-bridge-benchmark")
+    parser.add_argument("--documents", type=int, default=100_000)
+    parser.add_argument("--lookups", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=50)
+    args = parser.parse_args()
+
+    client = MongoClient(args.uri)
+    client.drop_database(args.database)
+    collection = client[args.database]["courses"]
+    repository = MongoCourseRepository(collection)
+
+    try:
+        courses = [Course(name=f"Course {i}", cs50_id=i) for i in range(args.documents)]
+        for start in range(0, len(courses), 10_000):
+            collection.insert_many([c.model_dump() for c in courses[start : start + 10_000]])
+
+        rng = random.Random(args.seed)
+        ids = [rng.choice(courses).id for _ in range(args.lookups)]
+
+        print(f"{args.documents} documents, {args.lookups} lookups by id")
+        print(summary("no index", measure(repository, ids)))
+
+        report = init_course_collection(collection)
+        print(f"index migration: created={report.created} rebuilt={report.rebuilt}")
+        print(summary("indexed", measure(repository, ids)))
+    finally:
+        client.drop_database(args.database)
+
+
+if __name__ == "__main__":
+    main()
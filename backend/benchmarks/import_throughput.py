@@ -0,0 +1,178 @@
+"""
+Runs the enrollment, GitHub-name and CS50 imports end to end on synthetic
+exports and reports rows per second and the peak RSS of the process.
+
+The enrollment and CS50 imports are posted through FastAPI's TestClient, so
+multipart parsing, dependency injection and the caches are part of the
+measurement. The GitHub-name import has no endpoint; it runs on
+``GitHubService`` with the container's repositories and a resolver that answers
+from the generated roster instead of calling the GitHub API. The ``mongo``
+backend drops its scratch database before and after the run.
+
+Usage (from ``backend/``)::
+
+    PYTHONPATH=src uv run python -m benchmarks.import_throughput --students 10000
+    PYTHONPATH=src uv run python -m benchmarks.import_throughput --backend mongo \\
+        --uri mongodb://localhost:27017 --students 50000 --json import.json
+"""
+
+import argparse
+import io
+import json
+import resource
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from pymongo import MongoClient
+
+from api.app import app, container
+from benchmarks.generators import (
+    Person,
+    assignment_csv,
+    cs50_export,
+    cs50_json,
+    participants_csv,
+    roster,
+    slugs,
+)
+from interfaces.resolver.github_client_resolver import IGitHubClientResolver
+from services.github_service import GitHubService
+
+
+@dataclass(frozen=True)
+class PhaseResult:
+    phase: str
+    rows: int
+    seconds: float
+    rows_per_second: float
+    peak_rss_mb: float
+
+
+class RosterGitHubResolver(IGitHubClientResolver):
+    """Resolves the GitHub names of the generated roster without network access."""
+
+    def __init__(self, people: list[Person]):
+        self._ids = {p.github_username: p.github_id for p in people if p.github_username}
+
+    def get_user_id(self, username: str) -> int | None:
+        return self._ids.get(username)
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+def phase(name: str, rows: int, run: Callable[[], object]) -> PhaseResult:
+    start = time.perf_counter()
+    run()
+    seconds = time.perf_counter() - start
+    return PhaseResult(name, rows, seconds, rows / seconds, peak_rss_mb())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backend", choices=["memory", "mongo"], default="memory")
+    parser.add_argument("--students", type=int, default=5000)
+    parser.add_argument("--slugs", type=int, default=5)
+    parser.add_argument("--submissions-per-student", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=50)
+    parser.add_argument("--uri", default="mongodb://localhost:27017")
+    parser.add_argument("--database", default="cs50-moodle-bridge-benchmark")
+    parser.add_argument("--json", type=Path, help="write the results to this file")
+    args = parser.parse_args()
+
+    people = roster(args.students, args.seed)
+    problem_slugs = slugs(args.slugs)
+    participants = participants_csv(people, args.seed)
+    assignment = assignment_csv(people, args.seed)
+    export = cs50_export(people, problem_slugs, args.seed, args.submissions_per_student)
+    submissions = cs50_json(export)
+    inputs_rss = peak_rss_mb()
+
+    container.config.repository.backend.override(args.backend)
+    container.config.mongo.uri.override(args.uri)
+    container.config.mongo.database.override(args.database)
+    container.config.mongo.sweep_orphans_on_startup.override(False)
+    if args.backend == "mongo":
+        MongoClient(args.uri).drop_database(args.database)
+
+    try:
+        with TestClient(app) as client:
+            response = client.post(
+                "/api/v1/courses", json={"name": "Sizing", "exercise_ids": problem_slugs}
+            )
+            response.raise_for_status()
+            course_id = response.json()["id"]
+
+            def enroll() -> None:
+                client.post(
+                    f"/api/v1/enroll/{course_id}",
+                    files={"file": ("participants.csv", participants, "text/csv")},
+                ).raise_for_status()
+
+            github = GitHubService(
+                container.student_repository(),
+                RosterGitHubResolver(people),
+                container.roster_indexes(),
+            )
+
+            def import_cs50() -> None:
+                for slug in problem_slugs:
+                    client.post(
+                        f"/api/v1/cs50/submissions/{slug}/import",
+                        files={"file": ("cs50.json", submissions, "application/json")},
+                    ).raise_for_status()
+
+            # the participant CSV has a header line and no line breaks inside fields
+            results = [
+                phase("enrollment csv", participants.count(b"\n") - 1, enroll),
+                phase(
+                    "github names csv",
+                    len(people),
+                    lambda: github.import_github_names(io.BytesIO(assignment)),
+                ),
+                phase("cs50 json", sum(len(s) for s in export.values()), import_cs50),
+            ]
+    finally:
+        if args.backend == "mongo":
+            MongoClient(args.uri).drop_database(args.database)
+
+    print(
+        f"{args.backend} backend, {len(people)} students, "
+        f"peak RSS {inputs_rss:.1f} MB after generating the inputs"
+    )
+    print(
+        "{:<18} {:>9} {:>9} {:>11} {:>13}".format(
+            "phase", "rows", "seconds", "rows/s", "peak RSS MB"
+        )
+    )
+    for r in results:
+        print(
+            f"{r.phase:<18} {r.rows:>9} {r.seconds:>9.2f} {r.rows_per_second:>11.0f} "
+            f"{r.peak_rss_mb:>13.1f}"
+        )
+
+    if args.json:
+        args.json.write_text(
+            json.dumps(
+                {
+                    "backend": args.backend,
+                    "students": len(people),
+                    "slugs": len(problem_slugs),
+                    "seed": args.seed,
+                    "inputs_peak_rss_mb": inputs_rss,
+                    "results": [asdict(r) for r in results],
+                },
+                indent=2,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,334 @@
+"""
+Load test for the v1 API: concurrent clients run a weighted mix of reads and
+imports against a running server and report latency percentiles and histograms.
+
+The server is started separately, with either backend::
+
+    REPOSITORY_BACKEND=memory uv run uvicorn api.app:app --app-dir src
+    REPOSITORY_BACKEND=mongo MONGO_URI=mongodb://localhost:27017 \\
+        uv run uvicorn api.app:app --app-dir src --workers 4
+
+The load test seeds one course with a synthetic roster and CS50 export first
+(see ``benchmarks.generators``), so it should get an empty database. Requests
+that finish during the warm-up are not counted. ``--json`` writes the report and
+``--baseline`` prints the change of p50/p99 per operation against an earlier one.
+
+Usage (from ``backend/``)::
+
+    PYTHONPATH=src uv run python -m benchmarks.load_test --scenario mixed \\
+        --concurrency 32 --duration 60 --json load.json
+"""
+
+import argparse
+import asyncio
+import bisect
+import json
+import random
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from urllib.parse import quote
+
+import httpx
+
+from benchmarks.generators import (
+    cs50_export,
+    cs50_json,
+    participants_csv,
+    roster,
+    slugs,
+)
+
+# upper bounds of the histogram buckets in ms: 0.5, 1, 2, ... 16384
+BUCKETS_MS = [0.5 * 2**i for i in range(16)]
+
+SCENARIOS: dict[str, dict[str, int]] = {
+    "read": {
+        "list courses": 2,
+        "get course": 4,
+        "course overview": 2,
+        "course students": 2,
+        "get submissions": 2,
+    },
+    "mixed": {
+        "list courses": 2,
+        "get course": 4,
+        "course overview": 2,
+        "course students": 2,
+        "get submissions": 2,
+        "patch course": 1,
+        "import enrollments": 1,
+        "import submissions": 1,
+    },
+    "import": {
+        "import enrollments": 1,
+        "import submissions": 1,
+    },
+}
+
+type Operation = Callable[[httpx.AsyncClient, random.Random], Awaitable[httpx.Response]]
+
+
+@dataclass(frozen=True)
+class Fixture:
+    """What the seeding created and the payloads the write operations post."""
+
+    course_id: str
+    slugs: list[str]
+    participants: bytes
+    submissions: bytes
+
+
+@dataclass(frozen=True)
+class OperationReport:
+    operation: str
+    requests: int
+    errors: int
+    p50_ms: float
+    p90_ms: float
+    p99_ms: float
+    max_ms: float
+    histogram: list[int]
+
+
+def operations(fixture: Fixture) -> dict[str, Operation]:
+    course = f"/api/v1/courses/{fixture.course_id}"
+
+    def submissions_path(rng: random.Random) -> str:
+        return f"/api/v1/cs50/submissions/{quote(rng.choice(fixture.slugs))}"
+
+    return {
+        "list courses": lambda client, _: client.get("/api/v1/courses"),
+        "get course": lambda client, _: client.get(course),
+        "course overview": lambda client, _: client.get(f"{course}/overview"),
+        "course students": lambda client, rng: client.get(
+            f"{course}/students", params={"offset": rng.randrange(0, 1000), "limit": 100}
+        ),
+        "get submissions": lambda client, rng: client.get(submissions_path(rng)),
+        "patch course": lambda client, rng: client.patch(
+            course, json={"name": f"Load test {rng.randrange(1000)}"}
+        ),
+        "import enrollments": lambda client, _: client.post(
+            f"/api/v1/enroll/{fixture.course_id}",
+            files={"file": ("participants.csv", fixture.participants, "text/csv")},
+        ),
+        "import submissions": lambda client, rng: client.post(
+            f"{submissions_path(rng)}/import",
+            files={"file": ("cs50.json", fixture.submissions, "application/json")},
+        ),
+    }
+
+
+async def seed_fixture(
+    client: httpx.AsyncClient, students: int, slug_count: int, seed: int
+) -> Fixture:
+    people = roster(students, seed)
+    problem_slugs = slugs(slug_count)
+
+    response = await client.post(
+        "/api/v1/courses", json={"name": "Load test", "exercise_ids": problem_slugs}
+    )
+    response.raise_for_status()
+    course_id = response.json()["id"]
+
+    submissions = cs50_json(cs50_export(people, problem_slugs, seed))
+    (
+        await client.post(
+            f"/api/v1/enroll/{course_id}",
+            files={"file": ("participants.csv", participants_csv(people, seed), "text/csv")},
+        )
+    ).raise_for_status()
+    for slug in problem_slugs:
+        (
+            await client.post(
+                f"/api/v1/cs50/submissions/{quote(slug)}/import",
+                files={"file": ("cs50.json", submissions, "application/json")},
+            )
+        ).raise_for_status()
+
+    # the write operations re-post a small slice so they stay comparable to the reads
+    small = people[:50]
+    return Fixture(
+        course_id,
+        problem_slugs,
+        participants_csv(small, seed),
+        cs50_json(cs50_export(small, problem_slugs, seed)),
+    )
+
+
+class Recorder:
+    def __init__(self, warmup_until: float):
+        self._warmup_until = warmup_until
+        self.latencies: dict[str, list[float]] = {}
+        self.errors: dict[str, int] = {}
+
+    def record(self, operation: str, started: float, ok: bool) -> None:
+        if started < self._warmup_until:
+            return
+        self.latencies.setdefault(operation, []).append((time.perf_counter() - started) * 1000)
+        if not ok:
+            self.errors[operation] = self.errors.get(operation, 0) + 1
+
+
+async def worker(
+    client: httpx.AsyncClient,
+    ops: dict[str, Operation],
+    weights: dict[str, int],
+    recorder: Recorder,
+    deadline: float,
+    rng: random.Random,
+) -> None:
+    names = list(weights)
+    while time.perf_counter() < deadline:
+        [name] = rng.choices(names, weights=[weights[n] for n in names])
+        started = time.perf_counter()
+        try:
+            response = await ops[name](client, rng)
+            ok = response.status_code < 400
+        except httpx.HTTPError:
+            ok = False
+        recorder.record(name, started, ok)
+
+
+def histogram(latencies: list[float]) -> list[int]:
+    counts = [0] * (len(BUCKETS_MS) + 1)
+    for latency in latencies:
+        counts[bisect.bisect_left(BUCKETS_MS, latency)] += 1
+    return counts
+
+
+def report(operation: str, latencies: list[float], errors: int) -> OperationReport:
+    quantiles = (
+        statistics.quantiles(latencies, n=100, method="inclusive")
+        if len(latencies) > 1
+        else latencies * 99
+    )
+    return OperationReport(
+        operation=operation,
+        requests=len(latencies),
+        errors=errors,
+        p50_ms=quantiles[49],
+        p90_ms=quantiles[89],
+        p99_ms=quantiles[98],
+        max_ms=max(latencies),
+        histogram=histogram(latencies),
+    )
+
+
+def print_histogram(counts: list[int], width: int = 50) -> None:
+    largest = max(counts) or 1
+    labels = [f"<= {bound:g} ms" for bound in BUCKETS_MS] + [f"> {BUCKETS_MS[-1]:g} ms"]
+    # skip the empty buckets before the first and after the last request
+    filled = [i for i, count in enumerate(counts) if count]
+    for i in range(filled[0], filled[-1] + 1):
+        bar = "#" * round(counts[i] / largest * width)
+        print(f"  {labels[i]:>14} {counts[i]:>8} {bar}")
+
+
+def print_comparison(reports: list[OperationReport], baseline: Path) -> None:
+    previous = {r["operation"]: r for r in json.loads(baseline.read_text())["operations"]}
+    print(f"\nagainst {baseline}:")
+    for r in reports:
+        before = previous.get(r.operation)
+        if before is None:
+            continue
+        print(
+            f"  {r.operation:<20} p50 {before['p50_ms']:8.1f} -> {r.p50_ms:8.1f} ms "
+            f"({r.p50_ms / before['p50_ms'] - 1:+6.1%})  "
+            f"p99 {before['p99_ms']:8.1f} -> {r.p99_ms:8.1f} ms "
+            f"({r.p99_ms / before['p99_ms'] - 1:+6.1%})"
+        )
+
+
+async def run(args: argparse.Namespace) -> tuple[list[OperationReport], float]:
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=args.timeout) as client:
+        fixture = await seed_fixture(client, args.students, args.slugs, args.seed)
+        ops = operations(fixture)
+
+        start = time.perf_counter()
+        recorder = Recorder(warmup_until=start + args.warmup)
+        deadline = start + args.warmup + args.duration
+        await asyncio.gather(
+            *(
+                worker(
+                    client,
+                    ops,
+                    SCENARIOS[args.scenario],
+                    recorder,
+                    deadline,
+                    random.Random(args.seed + i),
+                )
+                for i in range(args.concurrency)
+            )
+        )
+        elapsed = time.perf_counter() - start - args.warmup
+
+    reports = [
+        report(name, latencies, recorder.errors.get(name, 0))
+        for name, latencies in sorted(recorder.latencies.items())
+    ]
+    return reports, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="mixed")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=30, help="seconds measured")
+    parser.add_argument("--warmup", type=float, default=5, help="seconds not measured")
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--students", type=int, default=2000)
+    parser.add_argument("--slugs", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=50)
+    parser.add_argument("--json", type=Path, help="write the report to this file")
+    parser.add_argument("--baseline", type=Path, help="report of an earlier run to compare to")
+    args = parser.parse_args()
+
+    reports, elapsed = asyncio.run(run(args))
+    total = sum(r.requests for r in reports)
+    errors = sum(r.errors for r in reports)
+
+    print(
+        f"{args.scenario}: {total} requests in {elapsed:.1f}s "
+        f"({total / elapsed:.1f} req/s, {errors} errors, concurrency {args.concurrency})"
+    )
+    header = ("operation", "requests", "errors", "p50 ms", "p90 ms", "p99 ms", "max ms")
+    print("{:<20} {:>9} {:>7} {:>9} {:>9} {:>9} {:>9}".format(*header))
+    for r in reports:
+        print(
+            f"{r.operation:<20} {r.requests:>9} {r.errors:>7} {r.p50_ms:>9.1f} "
+            f"{r.p90_ms:>9.1f} {r.p99_ms:>9.1f} {r.max_ms:>9.1f}"
+        )
+
+    if total:
+        print("\nlatency histogram, all operations:")
+        print_histogram([
+            sum(counts) for counts in zip(*(r.histogram for r in reports), strict=True)
+        ])
+
+    if args.json:
+        args.json.write_text(
+            json.dumps(
+                {
+                    "scenario": args.scenario,
+                    "url": args.url,
+                    "concurrency": args.concurrency,
+                    "duration_seconds": elapsed,
+                    "requests_per_second": total / elapsed,
+                    "buckets_ms": BUCKETS_MS,
+                    "operations": [asdict(r) for r in reports],
+                },
+                indent=2,
+            )
+        )
+
+    if args.baseline:
+        print_comparison(reports, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
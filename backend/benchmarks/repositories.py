@@ -0,0 +1,330 @@
+"""
+Times the hot repository methods on the in-memory store, mongomock and
+optionally a local mongod, at several data sizes.
+
+The in-memory backend is the baseline: every row also shows how much slower
+the same operation is than in memory. ``--json`` writes the results in a
+machine-readable form and ``--baseline`` compares a run against such a file,
+exiting with status 1 if the median of an operation got slower than
+``--tolerance`` allows. The ``mongo`` backend drops its scratch database before
+and after the run. mongomock checks unique indexes with a linear scan per
+write, so keep it to the smaller sizes.
+
+Usage (from ``backend/``)::
+
+    PYTHONPATH=src uv run python -m benchmarks.repositories --json benchmark.json
+    PYTHONPATH=src uv run python -m benchmarks.repositories --backends memory mongo \\
+        --sizes 1000 10000 100000 --uri mongodb://localhost:27017 --baseline benchmark.json
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import mongomock
+from pymongo import MongoClient
+from pymongo.database import Database
+
+from interfaces.repositories.course_repository_interface import ICourseRepository
+from interfaces.repositories.cs50_submission_problem_repository_interface import (
+    ICS50SubmissionProblemRepository,
+)
+from interfaces.repositories.enrollment_repository_interface import IEnrollmentRepository
+from interfaces.repositories.student_repository_interface import IStudentRepository
+from models.course import Course
+from models.cs50_submission_problem import CS50SubmissionProblemModel
+from models.enrollment import EnrollmentModel
+from models.student import StudentModel
+from models.submission import SubmissionModel
+from repositories.memory.course_repository import MemoryCourseRepository
+from repositories.memory.cs50_submission_problem_repository import (
+    MemorySubmissionProblemRepository,
+)
+from repositories.memory.enrollment_repository import MemoryEnrollmentRepository
+from repositories.memory.student_repository import MemoryStudentRepository
+from repositories.mongo.course_repository import MongoCourseRepository
+from repositories.mongo.cs50_submission_problem_repository import (
+    MongoSubmissionProblemRepository,
+)
+from repositories.mongo.enrollment_repository import MongoEnrollmentRepository
+from repositories.mongo.migration import (
+    init_course_collection,
+    init_cs50_submission_problem_collection,
+    init_enrollment_collection,
+    init_student_collection,
+)
+from repositories.mongo.student_repository import MongoStudentRepository
+from repositories.mongo.submission_codec import archive_url, github_url
+
+BACKENDS = ("memory", "mongomock", "mongo")
+STUDENTS_PER_COURSE = 100
+SUBMISSIONS_PER_PROBLEM = 100
+BATCH_SIZE = 1000
+REPEAT_FULL_SCANS = 3
+
+
+@dataclass(frozen=True)
+class Result:
+    backend: str
+    size: int
+    operation: str
+    calls: int
+    mean_ms: float
+    p50_ms: float
+    p99_ms: float
+
+    @property
+    def key(self) -> tuple[str, int, str]:
+        return self.backend, self.size, self.operation
+
+
+@dataclass
+class Backend:
+    students: IStudentRepository
+    courses: ICourseRepository
+    enrollments: IEnrollmentRepository
+    problems: ICS50SubmissionProblemRepository
+    close: Callable[[], None] = field(default=lambda: None)
+
+
+def memory_backend() -> Backend:
+    enrollments = MemoryEnrollmentRepository()
+    return Backend(
+        students=MemoryStudentRepository(enrollment_repository=enrollments),
+        courses=MemoryCourseRepository(enrollment_repository=enrollments),
+        enrollments=enrollments,
+        problems=MemorySubmissionProblemRepository(),
+    )
+
+
+def mongo_backend(database: Database, close: Callable[[], None] = lambda: None) -> Backend:
+    init_student_collection(database["students"])
+    init_course_collection(database["courses"])
+    init_enrollment_collection(database["enrollments"])
+    init_cs50_submission_problem_collection(database["cs50_submissions"])
+    return Backend(
+        students=MongoStudentRepository(database["students"]),
+        courses=MongoCourseRepository(database["courses"]),
+        enrollments=MongoEnrollmentRepository(database["enrollments"]),
+        problems=MongoSubmissionProblemRepository(database["cs50_submissions"]),
+        close=close,
+    )
+
+
+def create_backend(name: str, uri: str, database: str) -> Backend:
+    if name == "memory":
+        return memory_backend()
+    if name == "mongomock":
+        return mongo_backend(mongomock.MongoClient()[database])
+
+    client = MongoClient(uri)
+    client.drop_database(database)
+
+    def close() -> None:
+        client.drop_database(database)
+        client.close()
+
+    return mongo_backend(client[database], close)
+
+
+def chunks(items: list, size: int) -> Iterator[list]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def timed(backend: str, size: int, operation: str, calls: list, fn: Callable[[Any], Any]) -> Result:
+    durations = []
+    for argument in calls:
+        start = time.perf_counter()
+        fn(argument)
+        durations.append((time.perf_counter() - start) * 1000)
+
+    p50, p99 = (
+        (statistics.median(durations), statistics.quantiles(durations, n=100)[98])
+        if len(durations) > 1
+        else (durations[0], durations[0])
+    )
+    return Result(backend, size, operation, len(durations), statistics.fmean(durations), p50, p99)
+
+
+def make_submissions(slug: str, count: int, rng: random.Random) -> list[SubmissionModel]:
+    start = datetime(2025, 10, 1, tzinfo=UTC)
+    submissions = []
+    for _ in range(count):
+        github_id = rng.randint(1_000_000, 250_000_000)
+        username = f"user{github_id}"
+        commit = f"{rng.getrandbits(160):040x}"
+        submissions.append(
+            SubmissionModel(
+                archive=archive_url(username, commit),
+                checks_passed=rng.randint(0, 13),
+                checks_run=13,
+                github_id=github_id,
+                github_url=github_url(username, commit),
+                github_username=username,
+                name=None,
+                slug=slug,
+                timestamp=start + timedelta(seconds=rng.randint(0, 60 * 60 * 24 * 90)),
+            )
+        )
+    return submissions
+
+
+def run(name: str, backend: Backend, size: int, lookups: int, seed: int) -> list[Result]:
+    """Fills an empty backend with ``size`` students, enrollments and submissions."""
+    rng = random.Random(seed)
+    results = []
+
+    def measure(operation: str, calls: list, fn: Callable[[Any], Any]) -> None:
+        results.append(timed(name, size, operation, calls, fn))
+
+    students = [
+        StudentModel(email=f"Student.{i}@example.com", github_id=i, name=f"Student {i}")
+        for i in range(size)
+    ]
+    courses = [
+        Course(name=f"Course {i}", cs50_id=i) for i in range(max(1, size // STUDENTS_PER_COURSE))
+    ]
+    enrollments = [
+        EnrollmentModel(student_id=s.id, course_id=courses[i % len(courses)].id)
+        for i, s in enumerate(students)
+    ]
+    slugs = [f"benchmark/problems/{i}" for i in range(max(1, size // SUBMISSIONS_PER_PROBLEM))]
+    problems = [
+        CS50SubmissionProblemModel(
+            slug=slug, submissions=make_submissions(slug, SUBMISSIONS_PER_PROBLEM, rng)
+        )
+        for slug in slugs
+    ]
+
+    sample = rng.choices(students, k=lookups)
+    course_sample = rng.choices(courses, k=lookups)
+
+    measure("student.create", students, backend.students.create)
+    measure("student.get", [s.id for s in sample], backend.students.get)
+    measure(
+        "student.get_by_email", [s.email.lower() for s in sample], backend.students.get_by_email
+    )
+    measure(
+        "student.get_many",
+        list(chunks([s.id for s in sample], STUDENTS_PER_COURSE)),
+        backend.students.get_many,
+    )
+    measure("student.get_all", [None] * REPEAT_FULL_SCANS, lambda _: backend.students.get_all())
+
+    measure("course.create", courses, backend.courses.create)
+    measure("course.get", [c.id for c in course_sample], backend.courses.get)
+    measure("course.get_all", [None] * REPEAT_FULL_SCANS, lambda _: backend.courses.get_all())
+
+    measure(
+        "enrollment.add_bulk_enrollments",
+        list(chunks(enrollments, BATCH_SIZE)),
+        backend.enrollments.add_bulk_enrollments,
+    )
+    measure(
+        "enrollment.get_students_for_course",
+        [c.id for c in course_sample],
+        backend.enrollments.get_students_for_course,
+    )
+    measure(
+        "enrollment.get_courses_for_students",
+        list(chunks([s.id for s in sample], STUDENTS_PER_COURSE)),
+        backend.enrollments.get_courses_for_students,
+    )
+
+    measure("submission.upload", problems, backend.problems.upload_submissions)
+    measure("submission.get", rng.choices(slugs, k=lookups), backend.problems.get_submissions)
+    measure(
+        "submission.get_for_slugs",
+        list(chunks(slugs, 10)),
+        backend.problems.get_submissions_for_slugs,
+    )
+
+    return results
+
+
+def print_table(results: list[Result]) -> None:
+    memory = {(r.size, r.operation): r.mean_ms for r in results if r.backend == "memory"}
+
+    header = ("backend", "size", "operation", "calls", "mean ms", "p50 ms", "p99 ms", "x memory")
+    print("{:<10} {:>7} {:<36} {:>6} {:>9} {:>9} {:>9} {:>9}".format(*header))
+    for r in results:
+        baseline = memory.get((r.size, r.operation))
+        ratio = f"{r.mean_ms / baseline:>9.1f}" if baseline else f"{'-':>9}"
+        print(
+            f"{r.backend:<10} {r.size:>7} {r.operation:<36} {r.calls:>6} "
+            f"{r.mean_ms:>9.4f} {r.p50_ms:>9.4f} {r.p99_ms:>9.4f} {ratio}"
+        )
+
+
+def regressions(results: list[Result], baseline: Path, tolerance: float) -> list[str]:
+    previous = {
+        (r["backend"], r["size"], r["operation"]): r["p50_ms"]
+        for r in json.loads(baseline.read_text())["results"]
+    }
+    slower = []
+    for r in results:
+        before = previous.get(r.key)
+        if before is not None and r.p50_ms > before * (1 + tolerance):
+            slower.append(
+                f"{r.backend} {r.size} {r.operation}: p50 {before:.4f}ms -> {r.p50_ms:.4f}ms"
+            )
+    return slower
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=["memory", "mongomock"])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000])
+    parser.add_argument("--lookups", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=50)
+    parser.add_argument("--uri", default="mongodb://localhost:27017")
+    parser.add_argument("--database", default="cs50-moodle-bridge-benchmark")
+    parser.add_argument("--json", type=Path, help="write the results to this file")
+    parser.add_argument("--baseline", type=Path, help="results of an earlier run to compare to")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    results = []
+    for size in args.sizes:
+        for name in args.backends:
+            backend = create_backend(name, args.uri, args.database)
+            try:
+                results += run(name, backend, size, args.lookups, args.seed)
+            finally:
+                backend.close()
+
+    print_table(results)
+
+    if args.json:
+        args.json.write_text(
+            json.dumps(
+                {
+                    "created_at": datetime.now(UTC).isoformat(),
+                    "python": sys.version.split()[0],
+                    "lookups": args.lookups,
+                    "seed": args.seed,
+                    "results": [asdict(r) for r in results],
+                },
+                indent=2,
+            )
+        )
+
+    if args.baseline:
+        slower = regressions(results, args.baseline, args.tolerance)
+        for line in slower:
+            print(f"regression: {line}")
+        if slower:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Compares the stored BSON size of CS50 submission problems in the legacy layout
+(one full SubmissionModel dict per submission) and the compact columnar layout.
+
+Usage (from ``backend/``)::
+
+    PYTHONPATH=src uv run python -m benchmarks.submission_document_size
+"""
+
+import argparse
+import random
+import string
+from datetime import UTC, datetime, timedelta
+
+import bson
+
+from models.cs50_submission_problem import CS50SubmissionProblemModel
+from models.submission import SubmissionModel
+from repositories.mongo.submission_codec import archive_url, encode_problem, github_url
+
+SLUG = "hsddigitallabor/problems/adg2025/intervals"
+
+
+def generate_problem(
+    students: int, submissions_per_student: int, seed: int
+) -> CS50SubmissionProblemModel:
+    rng = random.Random(seed)
+    start = datetime(2025, 10, 1, tzinfo=UTC)
+
+    submissions = []
+    for student in range(students):
+        username = "".join(
+            rng.choices(string.ascii_lowercase + string.digits, k=rng.randint(5, 14))
+        )
+        github_id = rng.randint(1_000_000, 250_000_000)
+        name = f"Student {student}" if rng.random() < 0.3 else None
+
+        for _ in range(rng.randint(1, submissions_per_student * 2 - 1)):
+            commit = "".join(rng.choices("0123456789abcdef", k=40))
+            checks_run = rng.choice([None, 13])
+            submissions.append(
+                SubmissionModel(
+                    archive=archive_url(username, commit),
+                    checks_passed=rng.randint(0, 13) if checks_run else None,
+                    checks_run=checks_run,
+                    github_id=github_id,
+                    github_url=github_url(username, commit),
+                    github_username=username,
+                    name=name,
+                    slug=SLUG,
+                    timestamp=start + timedelta(seconds=rng.randint(0, 60 * 60 * 24 * 90)),
+                )
+            )
+
+    return CS50SubmissionProblemModel(slug=SLUG, submissions=submissions)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--students", type=int, nargs="+", default=[50, 500, 2000])
+    parser.add_argument("--submissions-per-student", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=50)
+    args = parser.parse_args()
+
+    header = ("students", "submissions", "legacy B/sub", "compact B/sub", "saved")
+    print("{:>9} {:>12} {:>13} {:>14} {:>7}".format(*header))
+    for students in args.students:
+        problem = generate_problem(students, args.submissions_per_student, args.seed)
+        count = len(problem.submissions)
+
+        legacy = len(bson.encode(problem.model_dump()))
+        compact = len(bson.encode(encode_problem(problem)))
+
+        print(
+            f"{students:>9} {count:>12} {legacy / count:>13.1f} {compact / count:>14.1f} "
+            f"{1 - compact / legacy:>7.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class ApiSettings(BaseSettings):
+    # Server-Timing header with Mongo, GitHub and serialization times of each request
+    server_timing: bool = True
+
+    model_config = SettingsConfigDict(
+        env_prefix="API_",
+        env_file=".env",
+        extra="ignore",
+    )
@@ -1,11 +1,40 @@
+from contextlib import asynccontextmanager
+
+import anyio.to_thread
 from fastapi import FastAPI
 
 from api.router import main_router
-from api.v1.controllers import course, cs50_submission_problem, enrollment
+from api.timing import ServerTimingMiddleware
+from api.v1.controllers import course, cs50_submission_problem, enrollment, grading
 from dependencies import DependencyContainer
 
-app = FastAPI()
-app.include_router(main_router)
-
 container = DependencyContainer()
-container.wire(modules=[course, enrollment, cs50_submission_problem])
+container.wire(modules=[course, enrollment, cs50_submission_problem, grading])
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    # the in-memory backend has no collections to migrate or sweep
+    mongo = container.config.repository.backend() == "mongo"
+    migrate = mongo and container.config.mongo.migrate_on_startup()
+    sweep = mongo and container.config.mongo.sweep_orphans_on_startup()
+    if migrate:
+        # index builds block, keep them off the event loop
+        await anyio.to_thread.run_sync(container.mongo.init_resources)
+        container.mongo.migration_runner().run_in_background()
+    if sweep:
+        container.mongo.orphan_sweeper().run_in_background()
+    try:
+        yield
+    finally:
+        if migrate:
+            container.mongo.migration_runner().stop()
+        if sweep:
+            container.mongo.orphan_sweeper().stop()
+        if mongo:
+            container.mongo.shutdown_resources()
+
+
+app = FastAPI(lifespan=lifespan)
+app.add_middleware(ServerTimingMiddleware, header=container.config.api.server_timing())
+app.include_router(main_router)
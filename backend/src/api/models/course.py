@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from pydantic import BaseModel, ConfigDict, Field
 
 
@@ -9,6 +11,7 @@ class CourseCreate(BaseModel):
     exercise_ids: list[str] | None = Field(
         default_factory=list, description="List of exercise document IDs"
     )
+    deadline: datetime | None = Field(default=None, description="Submission deadline")
 
 
 class CourseUpdate(BaseModel):
@@ -19,6 +22,13 @@ class CourseUpdate(BaseModel):
     exercise_ids: list[str] | None = Field(
         default=None, description="List of exercise document IDs"
     )
+    add_exercise_ids: list[str] | None = Field(
+        default=None, description="Exercise document IDs to add to the course"
+    )
+    remove_exercise_ids: list[str] | None = Field(
+        default=None, description="Exercise document IDs to remove from the course"
+    )
+    deadline: datetime | None = Field(default=None, description="Submission deadline")
 
 
 class CourseOut(BaseModel):
@@ -28,5 +38,38 @@ class CourseOut(BaseModel):
     name: str
     cs50_id: int | None = None
     exercise_ids: list[str] = []
+    deadline: datetime | None = None
 
     model_config = ConfigDict(populate_by_name=True)  # Allows using both id and _id
+
+
+class StudentProgressOut(BaseModel):
+    student_id: str
+    email: str
+    name: str = ""
+    github_id: int | None = None
+    passed_count: int
+    passed_exercise_ids: list[str]
+
+
+class CourseOverviewOut(BaseModel):
+    """Every enrolled student with the exercises they passed."""
+
+    course_id: str
+    exercise_ids: list[str]
+    students: list[StudentProgressOut]
+
+
+class StudentOut(BaseModel):
+    id: str
+    email: str
+    name: str = ""
+    github_id: int | None = None
+    github_username: str | None = None
+
+
+class StudentPageOut(BaseModel):
+    total: int
+    offset: int
+    limit: int
+    items: list[StudentOut]
@@ -0,0 +1,168 @@
+import functools
+import inspect
+import logging
+import time
+from collections.abc import Callable
+from contextvars import ContextVar
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from request_timing import RequestTiming, record, start_request_timing, stop_request_timing
+
+logger = logging.getLogger(__name__)
+
+# descriptions of the Server-Timing entries, in the order they are emitted
+SEGMENTS = {
+    "mongo": "Mongo commands",
+    "github": "GitHub API calls",
+    "endpoint": "endpoint",
+    "serialization": "response serialization",
+}
+
+# the end of the endpoint, set by the endpoint wrapper for the route handler
+_endpoint_finished: ContextVar[list[float] | None] = ContextVar("endpoint_finished", default=None)
+
+
+def _mark_endpoint(started: float) -> None:
+    finished = time.perf_counter()
+    record("endpoint", finished - started)
+    marks = _endpoint_finished.get()
+    if marks is not None:
+        marks.append(finished)
+
+
+def _timed_endpoint(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    if inspect.iscoroutinefunction(endpoint):
+
+        @functools.wraps(endpoint)
+        async def timed_async(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                _mark_endpoint(started)
+
+        return timed_async
+
+    @functools.wraps(endpoint)
+    def timed(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return endpoint(*args, **kwargs)
+        finally:
+            _mark_endpoint(started)
+
+    return timed
+
+
+class TimedRoute(APIRoute):
+    """
+    Route that records the time of the endpoint function and of the response
+    serialization after it (response model validation, encoding, rendering).
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        super().__init__(path, _timed_endpoint(endpoint), **kwargs)
+
+    def get_route_handler(self) -> Callable[[Request], Any]:
+        handler = super().get_route_handler()
+
+        async def timed_handler(request: Request) -> Response:
+            marks: list[float] = []
+            token = _endpoint_finished.set(marks)
+            try:
+                response = await handler(request)
+            finally:
+                _endpoint_finished.reset(token)
+            if marks:
+                record("serialization", time.perf_counter() - marks[-1])
+            return response
+
+        return timed_handler
+
+
+def server_timing(timing: RequestTiming) -> str:
+    segments = timing.segments()
+    entries = []
+    for name, description in SEGMENTS.items():
+        segment = segments.get(name)
+        if segment is None:
+            continue
+        if name in ("mongo", "github"):
+            description = f"{segment.count} {description}"
+        entries.append(f'{name};dur={segment.seconds * 1000:.2f};desc="{description}"')
+    entries.append(f"total;dur={timing.elapsed() * 1000:.2f}")
+    return ", ".join(entries)
+
+
+class ServerTimingMiddleware:
+    """
+    Attributes the Mongo commands, GitHub calls and serialization of each request
+    to it and reports them as a ``Server-Timing`` header and a log record.
+
+    The log record carries the same numbers in ``request_timing`` together with the
+    Mongo commands by name, so an N+1 pattern (one ``find`` per imported row) shows
+    up as a high count of a single command. The header can be turned off with
+    ``API_SERVER_TIMING=false`` to keep the numbers out of browsers.
+    """
+
+    def __init__(self, app: ASGIApp, header: bool = True) -> None:
+        self.app = app
+        self.header = header
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing, token = start_request_timing()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.header:
+                    MutableHeaders(scope=message).append("Server-Timing", server_timing(timing))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            stop_request_timing(token)
+            _log(scope, status_code, timing)
+
+
+def _log(scope: Scope, status_code: int, timing: RequestTiming) -> None:
+    segments = timing.segments()
+    total_ms = timing.elapsed() * 1000
+    fields = {
+        "method": scope["method"],
+        "path": scope["path"],
+        "status": status_code,
+        "total_ms": round(total_ms, 2),
+    }
+    for name, segment in segments.items():
+        fields[f"{name}_count"] = segment.count
+        fields[f"{name}_ms"] = round(segment.seconds * 1000, 2)
+    fields["mongo_commands"] = timing.operations("mongo")
+
+    summary = " ".join(
+        f"{name}={segment.count}x{segment.seconds * 1000:.1f}ms"
+        if name in ("mongo", "github")
+        else f"{name}={segment.seconds * 1000:.1f}ms"
+        for name, segment in segments.items()
+    )
+    logger.info(
+        "%s %s %s total=%.1fms %s",
+        scope["method"],
+        scope["path"],
+        status_code,
+        total_ms,
+        summary,
+        extra={"request_timing": fields},
+    )
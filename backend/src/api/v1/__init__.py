@@ -1,9 +1,10 @@
 from fastapi import APIRouter
 
-from .controllers import course, cs50_submission_problem, enrollment
+from .controllers import course, cs50_submission_problem, enrollment, grading
 
 router = APIRouter(prefix="/v1")
 
 router.include_router(course.router)
 router.include_router(enrollment.router)
 router.include_router(cs50_submission_problem.router)
+router.include_router(grading.router)
@@ -1,14 +1,23 @@
 from typing import Annotated
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
-from api.models.course import CourseCreate, CourseOut, CourseUpdate
+from api.models.course import (
+    CourseCreate,
+    CourseOut,
+    CourseOverviewOut,
+    CourseUpdate,
+    StudentOut,
+    StudentPageOut,
+    StudentProgressOut,
+)
+from api.timing import TimedRoute
 from dependencies import DependencyContainer
 from interfaces.services.course_service import ICourseService
 from models.course import Course
 
-router = APIRouter(prefix="/courses", tags=["courses"])
+router = APIRouter(prefix="/courses", tags=["courses"], route_class=TimedRoute)
 
 
 @router.get("/{course_id}", response_model=CourseOut)
@@ -26,6 +35,50 @@ def get_course(
     return CourseOut(**result.model_dump())
 
 
+@router.get("/{course_id}/overview", response_model=CourseOverviewOut)
+@inject
+def get_course_overview(
+    course_id: str,
+    course_service: Annotated[ICourseService, Depends(Provide(DependencyContainer.course_service))],
+):
+    overview = course_service.get_course_overview(course_id)
+    if not overview:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Course with id {course_id} not found"
+        )
+
+    return CourseOverviewOut(
+        course_id=overview.course_id,
+        exercise_ids=overview.exercise_ids,
+        students=[
+            StudentProgressOut(**student.model_dump(), passed_count=student.passed_count)
+            for student in overview.students
+        ],
+    )
+
+
+@router.get("/{course_id}/students", response_model=StudentPageOut)
+@inject
+def get_course_students(
+    course_id: str,
+    course_service: Annotated[ICourseService, Depends(Provide(DependencyContainer.course_service))],
+    offset: Annotated[int, Query(ge=0)] = 0,
+    limit: Annotated[int, Query(ge=1, le=500)] = 100,
+):
+    page = course_service.get_students_in_course(course_id, offset=offset, limit=limit)
+    if page is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Course with id {course_id} not found"
+        )
+
+    return StudentPageOut(
+        total=page.total,
+        offset=offset,
+        limit=limit,
+        items=[StudentOut(**student.model_dump()) for student in page.students],
+    )
+
+
 @router.get("", response_model=list[CourseOut])
 @inject
 def get_courses(
@@ -45,6 +98,7 @@ def create_course(
         name=data.name,
         cs50_id=data.cs50_id,
         exercise_ids=list(data.exercise_ids) if data.exercise_ids else [],
+        deadline=data.deadline,
     )
     created_course = course_service.create_course(course)
     return CourseOut(**created_course.model_dump())
@@ -57,22 +111,27 @@ def update_course(
     data: CourseUpdate,
     course_service: Annotated[ICourseService, Depends(Provide(DependencyContainer.course_service))],
 ):
-    # get existing course
-    existing_course = course_service.get_course(course_id)
-    if not existing_course:
+    changes = data.model_dump(exclude_unset=True, exclude_defaults=True)
+    add_exercise_ids = changes.pop("add_exercise_ids", None)
+    remove_exercise_ids = changes.pop("remove_exercise_ids", None)
+
+    try:
+        saved_course = course_service.patch_course(
+            course_id,
+            changes,
+            add_exercise_ids=add_exercise_ids,
+            remove_exercise_ids=remove_exercise_ids,
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from None
+
+    if not saved_course:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=f"Course with id {course_id} not found"
         )
-    # merge fields
-    updated_data = data.model_dump(exclude_unset=True, exclude_defaults=True)
-    updated_course = Course(
-        id=existing_course.id,
-        name=updated_data.get("name", existing_course.name),
-        cs50_id=updated_data.get("cs50_id", existing_course.cs50_id),
-        exercise_ids=updated_data.get("exercise_ids", existing_course.exercise_ids),
-    )
-
-    saved_course = course_service.update_course(course_id, updated_course)
     return CourseOut(**saved_course.model_dump())
 
 
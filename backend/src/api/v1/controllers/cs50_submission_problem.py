@@ -3,11 +3,12 @@ from typing import Annotated
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, status
 
+from api.timing import TimedRoute
 from dependencies import DependencyContainer
 from exceptions.exceptions import InvalidJsonFormat
 from interfaces.services.cs50_submission_problem_service import ICS50SubmissionProblemService
 
-router = APIRouter(prefix="/cs50/submissions", tags=["cs50"])
+router = APIRouter(prefix="/cs50/submissions", tags=["cs50"], route_class=TimedRoute)
 
 
 @router.post("/{slug:path}/import")
@@ -3,11 +3,12 @@ from typing import Annotated
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, status
 
+from api.timing import TimedRoute
 from dependencies import DependencyContainer
 from exceptions.exceptions import CourseDoesNotExistException
 from interfaces.services.enrollment_service import IEnrollmentService
 
-router = APIRouter(prefix="/enroll", tags=["enrollment"])
+router = APIRouter(prefix="/enroll", tags=["enrollment"], route_class=TimedRoute)
 
 
 @router.post("/{course_id}")
@@ -0,0 +1,77 @@
+import csv
+from typing import Annotated
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, status
+from fastapi.responses import StreamingResponse
+
+from api.timing import TimedRoute
+from dependencies import DependencyContainer
+from exceptions.exceptions import (
+    CourseDoesNotExistException,
+    InvalidCsvFormat,
+    MissingMoodleParticipant,
+)
+from interfaces.services.grading_service import IGradingService
+from services.moodle_worksheet_export import (
+    iter_worksheet_csv,
+    read_participant_ids,
+    worksheet_filename,
+)
+
+router = APIRouter(prefix="/grading", tags=["grading"], route_class=TimedRoute)
+
+
+@router.post("/{course_id}/moodle-worksheet")
+@inject
+def export_moodle_worksheet(
+    course_id: str,
+    worksheet: UploadFile,
+    grading_service: Annotated[
+        IGradingService, Depends(Provide(DependencyContainer.grading_service))
+    ],
+):
+    """Fills in the grades of the worksheet downloaded from the Moodle assignment."""
+    try:
+        participant_ids = read_participant_ids(worksheet.file)
+    except (InvalidCsvFormat, UnicodeDecodeError, csv.Error):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid CSV format. Upload the grading worksheet of the Moodle assignment.",
+        ) from None
+
+    try:
+        rows = grading_service.iter_course_grades(course_id, participant_ids)
+    except CourseDoesNotExistException:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Course does not exist",
+        ) from None
+    except MissingMoodleParticipant as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Students missing from the Moodle worksheet: {exc}",
+        ) from None
+
+    return StreamingResponse(
+        iter_worksheet_csv(rows),
+        media_type="text/csv; charset=utf-8",
+        headers={"Content-Disposition": f'attachment; filename="{worksheet_filename(course_id)}"'},
+    )
+
+
+@router.post("/{course_id}/regrade")
+@inject
+def regrade_course(
+    course_id: str,
+    grading_service: Annotated[
+        IGradingService, Depends(Provide(DependencyContainer.grading_service))
+    ],
+):
+    try:
+        return grading_service.regrade_course(course_id)
+    except CourseDoesNotExistException:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Course does not exist",
+        ) from None
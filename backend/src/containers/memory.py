@@ -0,0 +1,52 @@
+from dependency_injector import containers, providers
+
+from repositories.memory.best_submission_repository import MemoryBestSubmissionRepository
+from repositories.memory.course_overview_repository import MemoryCourseOverviewRepository
+from repositories.memory.course_repository import MemoryCourseRepository
+from repositories.memory.cs50_submission_problem_repository import (
+    MemorySubmissionProblemRepository,
+)
+from repositories.memory.enrollment_import_repository import MemoryEnrollmentImportRepository
+from repositories.memory.enrollment_repository import MemoryEnrollmentRepository
+from repositories.memory.grade_fingerprint_repository import MemoryGradeFingerprintRepository
+from repositories.memory.student_repository import MemoryStudentRepository
+
+
+class MemoryContainer(containers.DeclarativeContainer):
+    """Same repository providers as ``MongoContainer``, backed by process memory."""
+
+    config = providers.Configuration()
+
+    enrollment_repository = providers.Singleton(MemoryEnrollmentRepository)
+
+    grade_fingerprint_repository = providers.Singleton(MemoryGradeFingerprintRepository)
+
+    course_repository = providers.Singleton(
+        MemoryCourseRepository,
+        enrollment_repository=enrollment_repository,
+        grade_fingerprint_repository=grade_fingerprint_repository,
+    )
+
+    student_repository = providers.Singleton(
+        MemoryStudentRepository,
+        enrollment_repository=enrollment_repository,
+        grade_fingerprint_repository=grade_fingerprint_repository,
+    )
+
+    enrollment_import_repository = providers.Singleton(
+        MemoryEnrollmentImportRepository,
+        student_repository=student_repository,
+        enrollment_repository=enrollment_repository,
+    )
+
+    cs50_submission_problem_repository = providers.Singleton(MemorySubmissionProblemRepository)
+
+    best_submission_repository = providers.Singleton(MemoryBestSubmissionRepository)
+
+    course_overview_repository = providers.Singleton(
+        MemoryCourseOverviewRepository,
+        course_repository=course_repository,
+        enrollment_repository=enrollment_repository,
+        student_repository=student_repository,
+        best_submission_repository=best_submission_repository,
+    )
@@ -1,25 +1,50 @@
 from dependency_injector import containers, providers
-from pymongo import MongoClient
 
+from repositories.mongo.best_submission_repository import MongoBestSubmissionRepository
+from repositories.mongo.client import create_mongo_client, read_collection
+from repositories.mongo.command_timing import CommandTiming
+from repositories.mongo.course_overview_repository import MongoCourseOverviewRepository
 from repositories.mongo.course_repository import MongoCourseRepository
 from repositories.mongo.cs50_submission_problem_repository import (
     MongoSubmissionProblemRepository,
 )
+from repositories.mongo.enrollment_import_repository import MongoEnrollmentImportRepository
 from repositories.mongo.enrollment_repository import MongoEnrollmentRepository
+from repositories.mongo.grade_fingerprint_repository import MongoGradeFingerprintRepository
 from repositories.mongo.migration import (
+    init_best_submission_collection,
+    init_course_collection,
     init_cs50_submission_problem_collection,
     init_enrollment_collection,
+    init_enrollment_import_collection,
+    init_grade_fingerprint_collection,
     init_student_collection,
 )
+from repositories.mongo.migration_runner import MigrationRunner
+from repositories.mongo.orphan_sweeper import OrphanSweeper
+from repositories.mongo.pool_metrics import PoolMetrics
+from repositories.mongo.schema_migrations import SCHEMA_MIGRATIONS
 from repositories.mongo.student_repository import MongoStudentRepository
 
 
 class MongoContainer(containers.DeclarativeContainer):
     config = providers.Configuration()
 
+    pool_metrics = providers.Singleton(PoolMetrics)
+
+    command_timing = providers.Singleton(CommandTiming)
+
     mongo_client = providers.Singleton(
-        MongoClient,
-        config.mongo.uri,
+        create_mongo_client,
+        uri=config.mongo.uri,
+        max_pool_size=config.mongo.max_pool_size,
+        min_pool_size=config.mongo.min_pool_size,
+        max_idle_time_ms=config.mongo.max_idle_time_ms,
+        wait_queue_timeout_ms=config.mongo.wait_queue_timeout_ms,
+        server_selection_timeout_ms=config.mongo.server_selection_timeout_ms,
+        compressors=config.mongo.compressors,
+        read_preference=config.mongo.read_preference,
+        event_listeners=providers.List(pool_metrics, command_timing),
     )
 
     mongo_database = providers.Singleton(
@@ -28,14 +53,55 @@ class MongoContainer(containers.DeclarativeContainer):
         name=config.mongo.database,
     )
 
+    migration_runner = providers.Singleton(
+        MigrationRunner,
+        database=mongo_database,
+        migrations=providers.Object(SCHEMA_MIGRATIONS),
+        batch_size=config.mongo.migration_batch_size,
+        throttle_seconds=config.mongo.migration_throttle_seconds,
+    )
+
+    orphan_sweeper = providers.Singleton(
+        OrphanSweeper,
+        database=mongo_database,
+        batch_size=config.mongo.migration_batch_size,
+        throttle_seconds=config.mongo.migration_throttle_seconds,
+    )
+
+    enrollment_collection = providers.Singleton(
+        lambda db: db["enrollments"],
+        mongo_database,
+    )
+
+    grade_fingerprint_collection = providers.Singleton(
+        lambda db: db["grade_fingerprints"],
+        mongo_database,
+    )
+
     course_collection = providers.Singleton(
         lambda db: db["courses"],
         mongo_database,
     )
 
+    course_collection_init = providers.Resource(
+        init_course_collection,
+        collection=course_collection,
+    )
+
+    course_read_collection = providers.Singleton(
+        read_collection,
+        course_collection,
+        read_preference=config.mongo.heavy_read_preference,
+        max_staleness_seconds=config.mongo.max_staleness_seconds,
+    )
+
     course_repository = providers.Singleton(
         MongoCourseRepository,
         collection=course_collection,
+        enrollment_collection=enrollment_collection,
+        transactions=config.mongo.use_transactions,
+        read_collection=course_read_collection,
+        grade_fingerprint_collection=grade_fingerprint_collection,
     )
 
     student_collection = providers.Singleton(
@@ -48,14 +114,29 @@ class MongoContainer(containers.DeclarativeContainer):
         collection=student_collection,
     )
 
+    student_read_collection = providers.Singleton(
+        read_collection,
+        student_collection,
+        read_preference=config.mongo.heavy_read_preference,
+        max_staleness_seconds=config.mongo.max_staleness_seconds,
+    )
+
     student_repository = providers.Singleton(
         MongoStudentRepository,
         collection=student_collection,
+        enrollment_collection=enrollment_collection,
+        transactions=config.mongo.use_transactions,
+        read_collection=student_read_collection,
+        grade_fingerprint_collection=grade_fingerprint_collection,
     )
 
-    enrollment_collection = providers.Singleton(
-        lambda db: db["enrollments"],
-        mongo_database,
+    # rosters are read right after an import, so they must not lag behind the primary
+    student_primary_repository = providers.Singleton(
+        MongoStudentRepository,
+        collection=student_collection,
+        enrollment_collection=enrollment_collection,
+        transactions=config.mongo.use_transactions,
+        grade_fingerprint_collection=grade_fingerprint_collection,
     )
 
     enrollment_collection_init = providers.Resource(
@@ -67,6 +148,24 @@ class MongoContainer(containers.DeclarativeContainer):
         MongoEnrollmentRepository, collection=enrollment_collection
     )
 
+    enrollment_import_collection = providers.Singleton(
+        lambda db: db["enrollment_imports"],
+        mongo_database,
+    )
+
+    enrollment_import_collection_init = providers.Resource(
+        init_enrollment_import_collection,
+        collection=enrollment_import_collection,
+    )
+
+    enrollment_import_repository = providers.Singleton(
+        MongoEnrollmentImportRepository,
+        collection=enrollment_import_collection,
+        student_collection=student_collection,
+        enrollment_collection=enrollment_collection,
+        transactions=config.mongo.use_transactions,
+    )
+
     cs50_submission_problem_collection = providers.Singleton(
         lambda db: db["cs50_submissions"],
         mongo_database,
@@ -77,7 +176,48 @@ class MongoContainer(containers.DeclarativeContainer):
         collection=cs50_submission_problem_collection,
     )
 
+    cs50_submission_problem_read_collection = providers.Singleton(
+        read_collection,
+        cs50_submission_problem_collection,
+        read_preference=config.mongo.heavy_read_preference,
+        max_staleness_seconds=config.mongo.max_staleness_seconds,
+    )
+
     cs50_submission_problem_repository = providers.Singleton(
         MongoSubmissionProblemRepository,
         collection=cs50_submission_problem_collection,
+        read_collection=cs50_submission_problem_read_collection,
+    )
+
+    best_submission_collection = providers.Singleton(
+        lambda db: db["best_submissions"],
+        mongo_database,
+    )
+
+    best_submission_collection_init = providers.Resource(
+        init_best_submission_collection,
+        collection=best_submission_collection,
+    )
+
+    best_submission_repository = providers.Singleton(
+        MongoBestSubmissionRepository,
+        collection=best_submission_collection,
+    )
+
+    grade_fingerprint_collection_init = providers.Resource(
+        init_grade_fingerprint_collection,
+        collection=grade_fingerprint_collection,
+    )
+
+    grade_fingerprint_repository = providers.Singleton(
+        MongoGradeFingerprintRepository,
+        collection=grade_fingerprint_collection,
+    )
+
+    course_overview_repository = providers.Singleton(
+        MongoCourseOverviewRepository,
+        collection=course_read_collection,
+        enrollment_collection="enrollments",
+        student_collection="students",
+        best_submission_collection="best_submissions",
     )
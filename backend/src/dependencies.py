@@ -1,12 +1,19 @@
-import requests
 from dependency_injector import containers, providers
 
+from containers.memory import MemoryContainer
 from containers.mongo import MongoContainer
+from repositories.cache.course_repository import CachedCourseRepository
+from repositories.cache.student_repository import CachedStudentRepository
 from resolvers.github.auth import AnonymousGitHubAuth, GitHubAppAuth
 from resolvers.github.client import GitHubClient
+from resolvers.github.session import create_github_session
 from services.course import CourseService
 from services.cs50_submission_problem import CS50SubmissionProblemService
 from services.enrollment import EnrollmentService
+from services.grading import GradingService
+from services.grading_strategies.registry import create_strategy
+from services.roster_index import RosterIndexRegistry
+from services.student import StudentService
 from settings import Settings
 
 
@@ -15,13 +22,101 @@ class DependencyContainer(containers.DeclarativeContainer):
     config.from_pydantic(Settings())
 
     mongo = providers.Container(MongoContainer, config=config)
+    memory = providers.Container(MemoryContainer, config=config)
+
+    # every repository comes from the backend selected by REPOSITORY_BACKEND
+    course_repository_backend = providers.Selector(
+        config.repository.backend,
+        mongo=mongo.course_repository,
+        memory=memory.course_repository,
+    )
+
+    student_repository_backend = providers.Selector(
+        config.repository.backend,
+        mongo=mongo.student_repository,
+        memory=memory.student_repository,
+    )
+
+    student_primary_repository_backend = providers.Selector(
+        config.repository.backend,
+        mongo=mongo.student_primary_repository,
+        memory=memory.student_repository,
+    )
+
+    enrollment_repository_backend = providers.Selector(
+        config.repository.backend,
+        mongo=mongo.enrollment_repository,
+        memory=memory.enrollment_repository,
+    )
+
+    enrollment_import_repository_backend = providers.Selector(
+        config.repository.backend,
+        mongo=mongo.enrollment_import_repository,
+        memory=memory.enrollment_import_repository,
+    )
+
+    cs50_submission_problem_repository_backend = providers.Selector(
+        config.repository.backend,
+        mongo=mongo.cs50_submission_problem_repository,
+        memory=memory.cs50_submission_problem_repository,
+    )
+
+    best_submission_repository_backend = providers.Selector(
+        config.repository.backend,
+        mongo=mongo.best_submission_repository,
+        memory=memory.best_submission_repository,
+    )
+
+    grade_fingerprint_repository_backend = providers.Selector(
+        config.repository.backend,
+        mongo=mongo.grade_fingerprint_repository,
+        memory=memory.grade_fingerprint_repository,
+    )
+
+    course_overview_repository_backend = providers.Selector(
+        config.repository.backend,
+        mongo=mongo.course_overview_repository,
+        memory=memory.course_overview_repository,
+    )
+
+    course_repository = providers.Singleton(
+        CachedCourseRepository,
+        repository=course_repository_backend,
+        max_size=config.cache.max_size,
+        ttl_seconds=config.cache.ttl_seconds,
+    )
+
+    student_repository = providers.Singleton(
+        CachedStudentRepository,
+        repository=student_repository_backend,
+        max_size=config.cache.max_size,
+        ttl_seconds=config.cache.ttl_seconds,
+    )
+
+    roster_indexes = providers.Singleton(
+        RosterIndexRegistry,
+        enrollment_repository=enrollment_repository_backend,
+        student_repository=student_primary_repository_backend,
+        ttl_seconds=config.cache.ttl_seconds,
+    )
 
     course_service = providers.Singleton(
         CourseService,
-        course_repository=mongo.course_repository,
+        course_repository=course_repository,
+        course_overview_repository=course_overview_repository_backend,
+        pass_threshold=config.grading.pass_threshold,
+        enrollment_repository=enrollment_repository_backend,
+        student_repository=student_repository,
+        roster_indexes=roster_indexes,
+    )
+
+    student_service = providers.Singleton(
+        StudentService,
+        student_repository=student_repository,
+        roster_indexes=roster_indexes,
     )
 
-    github_session = providers.Singleton(requests.Session)
+    github_session = providers.Singleton(create_github_session)
 
     github_auth = providers.Selector(
         config.github.use_auth,
@@ -43,14 +138,37 @@ class DependencyContainer(containers.DeclarativeContainer):
 
     enrollment_service = providers.Singleton(
         EnrollmentService,
-        student_repository=mongo.student_repository,
-        course_repository=mongo.course_repository,
-        enrollment_repository=mongo.enrollment_repository,
+        student_repository=student_repository,
+        course_repository=course_repository,
+        enrollment_repository=enrollment_repository_backend,
+        roster_indexes=roster_indexes,
+        import_repository=enrollment_import_repository_backend,
+        import_batch_size=config.mongo.import_batch_size,
     )
 
     cs50_submission_problem_service = providers.Singleton(
         CS50SubmissionProblemService,
-        cs50_submission_problem_repository=mongo.cs50_submission_problem_repository,
+        cs50_submission_problem_repository=cs50_submission_problem_repository_backend,
+        best_submission_repository=best_submission_repository_backend,
+    )
+
+    grading_strategy = providers.Singleton(
+        create_strategy,
+        config.grading.strategy,
+        pass_threshold=config.grading.pass_threshold,
+        late_penalty_per_day=config.grading.late_penalty_per_day,
+    )
+
+    grading_service = providers.Singleton(
+        GradingService,
+        course_repository=course_repository,
+        student_repository=student_repository,
+        enrollment_repository=enrollment_repository_backend,
+        cs50_submission_problem_repository=cs50_submission_problem_repository_backend,
+        strategy=grading_strategy,
+        best_submission_repository=best_submission_repository_backend,
+        grade_fingerprint_repository=grade_fingerprint_repository_backend,
+        roster_indexes=roster_indexes,
     )
 
 
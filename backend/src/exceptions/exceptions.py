@@ -7,3 +7,11 @@ class InvalidCsvFormat(Exception):
 
 class InvalidJsonFormat(Exception):
     """Raised when the JSON format is not recognized"""
+
+
+class MissingMoodleParticipant(Exception):
+    """Raised when enrolled students have no participant identifier in the Moodle worksheet"""
+
+    def __init__(self, emails: list[str]):
+        super().__init__(", ".join(emails))
+        self.emails = emails
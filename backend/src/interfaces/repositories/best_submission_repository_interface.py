@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+
+from models.best_submission import BestSubmissionModel
+from models.submission import SubmissionModel
+
+
+class IBestSubmissionRepository(ABC):
+    @abstractmethod
+    def record(self, slug: str, submissions: list[SubmissionModel]) -> int:
+        """
+        Folds imported submissions into the stored best submission per student.
+
+        :return: the number of (slug, github_id) entries that were created or changed
+        """
+        ...
+
+    @abstractmethod
+    def get_for_slugs(
+        self, slugs: list[str], github_ids: list[int] | None = None
+    ) -> list[BestSubmissionModel]: ...
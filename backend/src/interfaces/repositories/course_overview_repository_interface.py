@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+
+from models.course_overview import CourseOverviewModel
+
+
+class ICourseOverviewRepository(ABC):
+    @abstractmethod
+    def get_overview(
+        self, course_id: str, pass_threshold: float = 1.0
+    ) -> CourseOverviewModel | None:
+        """
+        Returns every enrolled student with the course exercises they passed.
+
+        :param pass_threshold: minimum best-submission score that counts as passed
+        """
+        ...
@@ -1,7 +1,25 @@
-from abc import ABC
+from abc import ABC, abstractmethod
+from typing import Any
 
 from interfaces.repositories.repository_interface import IRepository
 from models.course import Course
 
 
-class ICourseRepository(IRepository[Course], ABC): ...
+class ICourseRepository(IRepository[Course], ABC):
+    @abstractmethod
+    def patch(
+        self,
+        item_id: str,
+        fields: dict[str, Any],
+        add_exercise_ids: list[str] | None = None,
+        remove_exercise_ids: list[str] | None = None,
+    ) -> Course | None:
+        """
+        Updates only the given fields of a course and returns the updated course.
+
+        :param fields: course fields to overwrite, ``id`` cannot be changed
+        :param add_exercise_ids: exercise ids to add if not already present
+        :param remove_exercise_ids: exercise ids to remove
+        :raises ValueError: if the requested changes conflict with each other
+        """
+        ...
@@ -1,12 +1,16 @@
 from abc import ABC, abstractmethod
 
 from models.cs50_submission_problem import CS50SubmissionProblemModel
-from models.submission import SubmissionModel
 
 
 class ICS50SubmissionProblemRepository(ABC):
     @abstractmethod
-    def upload_submissions(self, slug: str, submissions: list[SubmissionModel]) -> None: ...
+    def upload_submissions(self, submission_problem: CS50SubmissionProblemModel) -> None: ...
 
     @abstractmethod
     def get_submissions(self, slug: str) -> CS50SubmissionProblemModel | None: ...
+
+    @abstractmethod
+    def get_submissions_for_slugs(self, slugs: list[str]) -> list[CS50SubmissionProblemModel]:
+        """Returns the stored problems for the given slugs in one query."""
+        ...
@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from models.student import StudentModel
+
+
+@dataclass(frozen=True)
+class ImportBatchResult:
+    # every student of the batch as stored, including existing ones
+    students: list[StudentModel]
+    students_created: int
+    enrollments_created: int
+
+
+class IEnrollmentImportRepository(ABC):
+    @abstractmethod
+    def get_checkpoint(self, import_id: str) -> int:
+        """Returns the number of CSV rows of an unfinished import that are committed."""
+        ...
+
+    @abstractmethod
+    def import_batch(
+        self, import_id: str, course_id: str, students: list[StudentModel], rows_done: int
+    ) -> ImportBatchResult:
+        """
+        Creates the missing students, enrolls all of them and moves the checkpoint
+        to ``rows_done`` as one unit of work. Repeating a batch has no effect.
+        """
+        ...
+
+    @abstractmethod
+    def finish(self, import_id: str) -> None: ...
@@ -13,6 +13,16 @@ class IEnrollmentRepository(ABC):
     @abstractmethod
     def get_students_for_course(self, course_id: str) -> list[str]: ...
 
+    @abstractmethod
+    def get_courses_for_students(self, student_ids: list[str]) -> dict[str, list[str]]:
+        """Returns the course ids of every given student, in one query."""
+        ...
+
+    @abstractmethod
+    def get_students_for_courses(self, course_ids: list[str]) -> dict[str, list[str]]:
+        """Returns the student ids of every given course, in one query."""
+        ...
+
     @abstractmethod
     def remove_enrollment(self, enrollment: EnrollmentModel) -> bool: ...
 
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+
+from models.grade_fingerprint import GradeFingerprintModel
+
+
+class IGradeFingerprintRepository(ABC):
+    @abstractmethod
+    def get_for_course(self, course_id: str) -> list[GradeFingerprintModel]: ...
+
+    @abstractmethod
+    def save(self, fingerprints: list[GradeFingerprintModel]) -> None: ...
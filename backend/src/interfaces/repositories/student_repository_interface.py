@@ -1,4 +1,5 @@
-from abc import ABC
+from abc import ABC, abstractmethod
+from typing import Any
 
 from interfaces.repositories.repository_interface import IRepository
 from models.student import StudentModel
@@ -6,3 +7,18 @@ from models.student import StudentModel
 
 class IStudentRepository(IRepository[StudentModel], ABC):
     def get_by_email(self, email: str) -> StudentModel: ...
+
+    @abstractmethod
+    def get_many(self, item_ids: list[str]) -> list[StudentModel]:
+        """Returns the students with the given ids in one query; unknown ids are left out."""
+        ...
+
+    @abstractmethod
+    def patch(self, item_id: str, fields: dict[str, Any]) -> StudentModel | None:
+        """
+        Updates only the given fields of a student and returns the updated student.
+
+        :param fields: student fields to overwrite, ``id`` cannot be changed
+        :raises ValueError: if a field is unknown or immutable
+        """
+        ...
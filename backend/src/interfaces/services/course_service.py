@@ -1,6 +1,16 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any
 
 from models.course import Course
+from models.course_overview import CourseOverviewModel
+from models.student import StudentModel
+
+
+@dataclass(frozen=True)
+class StudentPage:
+    total: int
+    students: list[StudentModel]
 
 
 class ICourseService(ABC):
@@ -16,5 +26,22 @@ class ICourseService(ABC):
     @abstractmethod
     def update_course(self, course_id: str, course: Course) -> Course: ...
 
+    @abstractmethod
+    def patch_course(
+        self,
+        course_id: str,
+        fields: dict[str, Any],
+        add_exercise_ids: list[str] | None = None,
+        remove_exercise_ids: list[str] | None = None,
+    ) -> Course | None: ...
+
     @abstractmethod
     def delete_course(self, course_id: str): ...
+
+    @abstractmethod
+    def get_course_overview(self, course_id: str) -> CourseOverviewModel | None: ...
+
+    @abstractmethod
+    def get_students_in_course(
+        self, course_id: str, offset: int = 0, limit: int | None = None
+    ) -> StudentPage | None: ...
@@ -2,12 +2,18 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import BinaryIO
 
+from models.cs50_submission_problem import CS50SubmissionProblemModel
+
 
 @dataclass(frozen=True)
 class SubmissionUploadResult:
     submissions_added: int
+    best_submissions_updated: int = 0
 
 
 class ICS50SubmissionProblemService(ABC):
     @abstractmethod
     def import_submissions_from_json(self, slug: str, file: BinaryIO) -> SubmissionUploadResult: ...
+
+    @abstractmethod
+    def get_submissions(self, slug: str) -> CS50SubmissionProblemModel | None: ...
@@ -8,6 +8,8 @@ class EnrollmentImportResult:
     students_created: int
     enrollments_created: int
     rows_skipped: int
+    # rows committed by an earlier, interrupted run of the same import
+    rows_resumed: int = 0
 
 
 class IEnrollmentService(ABC):
@@ -15,3 +17,6 @@ class IEnrollmentService(ABC):
     def import_students_from_csv(
         self, course_id: str, file: BinaryIO
     ) -> EnrollmentImportResult: ...
+
+    @abstractmethod
+    def remove_enrollment(self, course_id: str, student_id: str) -> bool: ...
@@ -0,0 +1,42 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+
+from models.moodle_worksheet import MoodleWorksheetRowModel
+
+
+@dataclass(frozen=True)
+class RegradeResult:
+    recomputed: int
+    skipped: int
+    rows: list[MoodleWorksheetRowModel]
+
+
+class IGradingService(ABC):
+    @abstractmethod
+    def grade_course(self, course_id: str) -> list[MoodleWorksheetRowModel]: ...
+
+    @abstractmethod
+    def iter_course_grades(
+        self, course_id: str, participant_ids: Mapping[str, str] | None = None
+    ) -> Iterator[MoodleWorksheetRowModel]:
+        """
+        Like ``grade_course``, but builds the rows one at a time while iterating.
+
+        :param participant_ids: Moodle's participant identifier by normalized email,
+            written to ``submission_id`` of every row
+        :raises CourseDoesNotExistException: before the first row, if the course is unknown
+        :raises MissingMoodleParticipant: before the first row, if ``participant_ids``
+            lacks an enrolled student
+        """
+        ...
+
+    @abstractmethod
+    def regrade_course(self, course_id: str) -> RegradeResult:
+        """
+        Regrades only the (student, exercise) pairs whose inputs changed since the last regrade.
+
+        :return: the number of recomputed and skipped pairs and the worksheet rows
+            of every student with at least one recomputed pair
+        """
+        ...
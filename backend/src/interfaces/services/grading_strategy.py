@@ -0,0 +1,51 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, ClassVar
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class SubmissionBatch:
+    """
+    The submissions of one problem for a whole roster as flat arrays.
+
+    Submission arrays hold one entry per submission, ``student_index`` points into
+    the per-student arrays. Timestamps and deadlines are POSIX seconds; a student
+    without a deadline has ``inf``, a submission without checks has ``nan``.
+    """
+
+    student_index: np.ndarray
+    checks_passed: np.ndarray
+    checks_run: np.ndarray
+    timestamps: np.ndarray
+    deadlines: np.ndarray
+    has_github: np.ndarray
+
+    @property
+    def num_students(self) -> int:
+        return len(self.deadlines)
+
+
+class IGradingStrategy(ABC):
+    name: ClassVar[str]
+
+    def __init__(self, pass_threshold: float = 1.0, late_penalty_per_day: float = 0.0):
+        self.pass_threshold = pass_threshold
+        self.late_penalty_per_day = late_penalty_per_day
+
+    @abstractmethod
+    def grade(self, batch: SubmissionBatch) -> np.ndarray:
+        """Returns one score between 0 and 1 per student of the batch."""
+        ...
+
+    def config(self) -> dict[str, Any]:
+        """Everything besides the submissions that changes the grade."""
+        return {
+            "strategy": self.name,
+            "pass_threshold": self.pass_threshold,
+            "late_penalty_per_day": self.late_penalty_per_day,
+        }
+
+    def passed(self, scores: np.ndarray) -> np.ndarray:
+        return scores >= self.pass_threshold
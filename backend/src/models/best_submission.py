@@ -0,0 +1,68 @@
+from datetime import UTC, datetime
+
+from pydantic import BaseModel, field_validator
+
+from models.submission import SubmissionModel
+
+
+class BestSubmissionModel(BaseModel):
+    """The best and the latest submission of one student for one problem."""
+
+    slug: str
+    github_id: int
+    github_username: str
+    score: float
+    checks_passed: int | None
+    checks_run: int | None
+    timestamp: datetime
+    last_timestamp: datetime
+
+    @field_validator("timestamp", "last_timestamp")
+    def as_stored(cls, v: datetime) -> datetime:
+        # BSON dates are naive UTC with millisecond precision, keep the
+        # model comparable with what comes back from the database
+        if v.tzinfo is None:
+            v = v.replace(tzinfo=UTC)
+        return v.replace(microsecond=v.microsecond // 1000 * 1000)
+
+    @classmethod
+    def from_submission(cls, submission: SubmissionModel) -> "BestSubmissionModel":
+        return cls(
+            slug=submission.slug,
+            github_id=submission.github_id,
+            github_username=submission.github_username,
+            score=score(submission),
+            checks_passed=submission.checks_passed,
+            checks_run=submission.checks_run,
+            timestamp=submission.timestamp,
+            last_timestamp=submission.timestamp,
+        )
+
+    def beats(self, other: "BestSubmissionModel") -> bool:
+        """Higher score wins, an equal score wins if it was reached earlier."""
+        return self.score > other.score or (
+            self.score == other.score and self.timestamp < other.timestamp
+        )
+
+    def merge(self, other: "BestSubmissionModel") -> "BestSubmissionModel":
+        best = other if other.beats(self) else self
+        return best.model_copy(
+            update={"last_timestamp": max(self.last_timestamp, other.last_timestamp)}
+        )
+
+
+def score(submission: SubmissionModel) -> float:
+    if not submission.checks_run or submission.checks_passed is None:
+        return 0.0
+    return submission.checks_passed / submission.checks_run
+
+
+def best_per_student(slug: str, submissions: list[SubmissionModel]) -> list[BestSubmissionModel]:
+    best: dict[int, BestSubmissionModel] = {}
+    for submission in submissions:
+        candidate = BestSubmissionModel.from_submission(submission).model_copy(
+            update={"slug": slug}
+        )
+        current = best.get(submission.github_id)
+        best[submission.github_id] = candidate if current is None else current.merge(candidate)
+    return list(best.values())
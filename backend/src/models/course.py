@@ -1,6 +1,7 @@
+from datetime import UTC, datetime
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class Course(BaseModel):
@@ -8,3 +9,11 @@ class Course(BaseModel):
     name: str
     cs50_id: int | None = None
     exercise_ids: list[str] = []
+    deadline: datetime | None = None
+
+    @field_validator("deadline")
+    def deadline_in_utc(cls, v):
+        # BSON dates come back naive in UTC
+        if v is not None and v.tzinfo is None:
+            return v.replace(tzinfo=UTC)
+        return v
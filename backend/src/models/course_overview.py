@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+
+
+class StudentProgressModel(BaseModel):
+    student_id: str
+    email: str
+    name: str = ""
+    github_id: int | None = None
+    passed_exercise_ids: list[str] = []
+
+    @property
+    def passed_count(self) -> int:
+        return len(self.passed_exercise_ids)
+
+
+class CourseOverviewModel(BaseModel):
+    course_id: str
+    exercise_ids: list[str]
+    students: list[StudentProgressModel]
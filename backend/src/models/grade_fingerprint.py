@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+
+
+class GradeFingerprintModel(BaseModel):
+    course_id: str
+    student_id: str
+    slug: str
+    fingerprint: str
+    passed: bool
@@ -17,7 +17,6 @@ class PassFailGrade(int, enum.Enum):
 
 class MoodleWorksheetRowModel(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid4()))
-    submission_id: str
     email: str
     status: str
 
@@ -32,6 +31,11 @@ class MoodleWorksheetRowModel(BaseModel):
     feedback_comment: str
 
     # optional fields:
+    # Moodle's participant identifier ("Teilnehmer/in1234567"), the worksheet import
+    # matches rows by it; required to export the row
+    submission_id: str = ""
+    full_name: str = ""
+    online_text: str = ""
     submission_begin: datetime | None = None
     deadline: datetime | None = None
     last_submission: datetime | None = None
@@ -1,6 +1,11 @@
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
+
+
+def normalize_email(email: str) -> str:
+    """Identity of an email address; Moodle exports keep the casing students typed."""
+    return email.strip().casefold()
 
 
 class StudentModel(BaseModel):
@@ -9,3 +14,8 @@ class StudentModel(BaseModel):
     github_id: int | None = None
     name: str = ""
     github_username: str | None = None
+
+    @computed_field
+    @property
+    def email_key(self) -> str:
+        return normalize_email(self.email)
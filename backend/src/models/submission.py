@@ -1,8 +1,15 @@
 from datetime import datetime
+from zoneinfo import ZoneInfo
 
 from dateutil import parser
 from pydantic import BaseModel, field_validator
 
+# CS50 prints submission times in the zone of the HSD course, e.g. "08:20:07PM CET"
+SUBMISSION_TIMEZONE = ZoneInfo("Europe/Berlin")
+
+# dateutil leaves unknown abbreviations naive, which later reads would take as UTC
+TIMEZONE_ABBREVIATIONS = {"CET": SUBMISSION_TIMEZONE, "CEST": SUBMISSION_TIMEZONE}
+
 
 class SubmissionModel(BaseModel):
     archive: str
@@ -17,5 +24,9 @@ class SubmissionModel(BaseModel):
 
     @field_validator("timestamp", mode="before")
     def parse_timestamp(cls, v):
-        dt = parser.parse(v)
+        if isinstance(v, datetime):
+            return v
+        dt = parser.parse(v, tzinfos=TIMEZONE_ABBREVIATIONS)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=SUBMISSION_TIMEZONE)
         return dt
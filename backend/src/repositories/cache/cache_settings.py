@@ -0,0 +1,14 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class CacheSettings(BaseSettings):
+    # a max_size of 0 disables caching. The cache is per process and writes only
+    # invalidate it in the worker that made them, so enable it for a single worker
+    max_size: int = 0
+    ttl_seconds: float = 60.0
+
+    model_config = SettingsConfigDict(
+        env_prefix="CACHE_",
+        env_file=".env",
+        extra="ignore",
+    )
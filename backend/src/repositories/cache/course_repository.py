@@ -0,0 +1,68 @@
+from typing import Any
+
+from interfaces.repositories.course_repository_interface import ICourseRepository
+from models.course import Course
+from repositories.cache.lru_cache import CacheStats, LRUCache
+
+
+class CachedCourseRepository(ICourseRepository):
+    """
+    Read-through cache in front of another course repository.
+
+    Writes invalidate after the backing write returned. A read that was in flight
+    meanwhile may have seen the old course; it is not cached, as the cache drops
+    values read before the latest invalidation of their key.
+
+    The cache lives in one process. With several workers, a write in one leaves
+    the others serving the old course until the TTL ends, hence it is off by default.
+    """
+
+    def __init__(self, repository: ICourseRepository, max_size: int, ttl_seconds: float):
+        self._repository = repository
+        self._by_id: LRUCache[str, Course] = LRUCache(max_size, ttl_seconds)
+
+    def stats(self) -> dict[str, CacheStats]:
+        return {"by_id": self._by_id.stats()}
+
+    def create(self, data: Course) -> Course:
+        created = self._repository.create(data)
+        self._by_id.put(created.id, created.model_copy(deep=True))
+        return created
+
+    def get(self, item_id: str) -> Course | None:
+        cached = self._by_id.get(item_id)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
+        read_at = self._by_id.version()
+        course = self._repository.get(item_id)
+        if course is not None:
+            self._by_id.put(item_id, course.model_copy(deep=True), read_at)
+        return course
+
+    def get_all(self) -> list[Course]:
+        return self._repository.get_all()
+
+    def update(self, item_id: str, data: Course) -> Course | None:
+        try:
+            return self._repository.update(item_id, data)
+        finally:
+            self._by_id.invalidate(item_id)
+
+    def patch(
+        self,
+        item_id: str,
+        fields: dict[str, Any],
+        add_exercise_ids: list[str] | None = None,
+        remove_exercise_ids: list[str] | None = None,
+    ) -> Course | None:
+        try:
+            return self._repository.patch(item_id, fields, add_exercise_ids, remove_exercise_ids)
+        finally:
+            self._by_id.invalidate(item_id)
+
+    def delete(self, item_id: str) -> bool:
+        try:
+            return self._repository.delete(item_id)
+        finally:
+            self._by_id.invalidate(item_id)
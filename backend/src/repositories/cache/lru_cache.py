@@ -0,0 +1,120 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    size: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache[K, V]:
+    """
+    Thread-safe LRU cache whose entries expire ``ttl_seconds`` after being stored.
+
+    Every invalidation bumps a version. A read-through caller takes ``version()``
+    before reading the backend and passes it to ``put``, which drops the value if
+    the key was invalidated since: the read may have returned the old value of a
+    write that finished while it was in flight.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        # version of the latest invalidation per key, bounded like the entries
+        self._version = 0
+        self._invalidated: OrderedDict[K, int] = OrderedDict()
+        # reads older than this are dropped, their key may have been forgotten above
+        self._oldest_known = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            expires_at, value = entry
+            if self._clock() >= expires_at:
+                del self._entries[key]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def version(self) -> int:
+        with self._lock:
+            return self._version
+
+    def put(self, key: K, value: V, read_at: int | None = None) -> None:
+        """Stores ``value``; with ``read_at`` only if ``key`` was not invalidated since."""
+        if self._max_size <= 0:
+            return
+
+        with self._lock:
+            if read_at is not None and (
+                read_at < self._oldest_known or self._invalidated.get(key, 0) > read_at
+            ):
+                return
+
+            self._entries[key] = (self._clock() + self._ttl_seconds, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, key: K) -> None:
+        with self._lock:
+            self._version += 1
+            self._invalidated[key] = self._version
+            self._invalidated.move_to_end(key)
+            while len(self._invalidated) > self._max_size:
+                _, self._oldest_known = self._invalidated.popitem(last=False)
+
+            if self._entries.pop(key, None) is not None:
+                self._invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._version += 1
+            self._oldest_known = self._version
+            self._invalidated.clear()
+            self._invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                size=len(self._entries),
+            )
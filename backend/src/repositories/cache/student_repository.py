@@ -0,0 +1,99 @@
+from typing import Any
+
+from interfaces.repositories.student_repository_interface import IStudentRepository
+from models.student import StudentModel, normalize_email
+from repositories.cache.lru_cache import CacheStats, LRUCache
+
+
+class CachedStudentRepository(IStudentRepository):
+    """
+    Read-through cache in front of another student repository.
+
+    Students are cached by id; the email cache only maps an email key to a student id,
+    so invalidating the id entry is enough to drop both lookups. Like the course cache,
+    writes invalidate after the backing write returned and students read before
+    that are not cached; it is off by default for the same reason.
+    """
+
+    def __init__(self, repository: IStudentRepository, max_size: int, ttl_seconds: float):
+        self._repository = repository
+        self._by_id: LRUCache[str, StudentModel] = LRUCache(max_size, ttl_seconds)
+        self._by_email: LRUCache[str, str] = LRUCache(max_size, ttl_seconds)
+
+    def stats(self) -> dict[str, CacheStats]:
+        return {"by_id": self._by_id.stats(), "by_email": self._by_email.stats()}
+
+    def _put(self, student: StudentModel, read_at: tuple[int, int] | None = None) -> None:
+        id_read_at, email_read_at = read_at or (None, None)
+        self._by_id.put(student.id, student.model_copy(deep=True), id_read_at)
+        self._by_email.put(student.email_key, student.id, email_read_at)
+
+    def _version(self) -> tuple[int, int]:
+        return self._by_id.version(), self._by_email.version()
+
+    def create(self, data: StudentModel) -> StudentModel:
+        created = self._repository.create(data)
+        self._put(created)
+        return created
+
+    def get(self, item_id: str) -> StudentModel | None:
+        cached = self._by_id.get(item_id)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
+        read_at = self._version()
+        student = self._repository.get(item_id)
+        if student is not None:
+            self._put(student, read_at)
+        return student
+
+    def get_all(self) -> list[StudentModel]:
+        return self._repository.get_all()
+
+    def update(self, item_id: str, data: StudentModel) -> StudentModel | None:
+        try:
+            return self._repository.update(item_id, data)
+        finally:
+            self._by_id.invalidate(item_id)
+
+    def patch(self, item_id: str, fields: dict[str, Any]) -> StudentModel | None:
+        try:
+            return self._repository.patch(item_id, fields)
+        finally:
+            self._by_id.invalidate(item_id)
+
+    def delete(self, item_id: str) -> bool:
+        try:
+            return self._repository.delete(item_id)
+        finally:
+            self._by_id.invalidate(item_id)
+
+    def get_by_email(self, email: str) -> StudentModel | None:
+        email_key = normalize_email(email)
+        student_id = self._by_email.get(email_key)
+        if student_id is not None:
+            cached = self._by_id.get(student_id)
+            if cached is not None and cached.email_key == email_key:
+                return cached.model_copy(deep=True)
+            self._by_email.invalidate(email_key)
+
+        read_at = self._version()
+        student = self._repository.get_by_email(email)
+        if student is not None:
+            self._put(student, read_at)
+        return student
+
+    def get_many(self, item_ids: list[str]) -> list[StudentModel]:
+        students = []
+        missing = []
+        for item_id in item_ids:
+            cached = self._by_id.get(item_id)
+            if cached is not None:
+                students.append(cached.model_copy(deep=True))
+            else:
+                missing.append(item_id)
+
+        if missing:
+            # may come from a secondary, so it must not be served to point lookups later
+            students.extend(self._repository.get_many(missing))
+        return students
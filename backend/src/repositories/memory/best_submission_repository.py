@@ -0,0 +1,46 @@
+import threading
+
+from interfaces.repositories.best_submission_repository_interface import (
+    IBestSubmissionRepository,
+)
+from models.best_submission import BestSubmissionModel, best_per_student
+from models.submission import SubmissionModel
+
+
+class MemoryBestSubmissionRepository(IBestSubmissionRepository):
+    """Best submissions by (slug, github_id) with a secondary index github_id -> slugs."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._by_key: dict[tuple[str, int], BestSubmissionModel] = {}
+        self._slugs_by_github_id: dict[int, set[str]] = {}
+
+    def record(self, slug: str, submissions: list[SubmissionModel]) -> int:
+        changed = 0
+        with self._lock:
+            for candidate in best_per_student(slug, submissions):
+                key = (slug, candidate.github_id)
+                current = self._by_key.get(key)
+                merged = candidate if current is None else current.merge(candidate)
+                if merged == current:
+                    continue
+
+                self._by_key[key] = merged
+                self._slugs_by_github_id.setdefault(candidate.github_id, set()).add(slug)
+                changed += 1
+        return changed
+
+    def get_for_slugs(
+        self, slugs: list[str], github_ids: list[int] | None = None
+    ) -> list[BestSubmissionModel]:
+        with self._lock:
+            if github_ids is None:
+                wanted = set(slugs)
+                return [b.model_copy() for (slug, _), b in self._by_key.items() if slug in wanted]
+
+            return [
+                self._by_key[slug, github_id].model_copy()
+                for github_id in dict.fromkeys(github_ids)
+                for slug in dict.fromkeys(slugs)
+                if slug in self._slugs_by_github_id.get(github_id, ())
+            ]
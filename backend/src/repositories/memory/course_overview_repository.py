@@ -0,0 +1,58 @@
+from interfaces.repositories.best_submission_repository_interface import (
+    IBestSubmissionRepository,
+)
+from interfaces.repositories.course_overview_repository_interface import (
+    ICourseOverviewRepository,
+)
+from interfaces.repositories.course_repository_interface import ICourseRepository
+from interfaces.repositories.enrollment_repository_interface import IEnrollmentRepository
+from interfaces.repositories.student_repository_interface import IStudentRepository
+from models.course_overview import CourseOverviewModel, StudentProgressModel
+
+
+class MemoryCourseOverviewRepository(ICourseOverviewRepository):
+    """Joins the in-memory repositories the same way the Mongo aggregation does."""
+
+    def __init__(
+        self,
+        course_repository: ICourseRepository,
+        enrollment_repository: IEnrollmentRepository,
+        student_repository: IStudentRepository,
+        best_submission_repository: IBestSubmissionRepository,
+    ):
+        self._courses = course_repository
+        self._enrollments = enrollment_repository
+        self._students = student_repository
+        self._best = best_submission_repository
+
+    def get_overview(
+        self, course_id: str, pass_threshold: float = 1.0
+    ) -> CourseOverviewModel | None:
+        course = self._courses.get(course_id)
+        if course is None:
+            return None
+
+        students = self._students.get_many(self._enrollments.get_students_for_course(course_id))
+        github_ids = [s.github_id for s in students if s.github_id is not None]
+
+        passed: dict[int, set[str]] = {}
+        if github_ids and course.exercise_ids:
+            for best in self._best.get_for_slugs(course.exercise_ids, github_ids):
+                if best.score >= pass_threshold:
+                    passed.setdefault(best.github_id, set()).add(best.slug)
+
+        progress = [
+            StudentProgressModel(
+                student_id=student.id,
+                email=student.email,
+                name=student.name,
+                github_id=student.github_id,
+                passed_exercise_ids=[
+                    e for e in course.exercise_ids if e in passed.get(student.github_id, ())
+                ],
+            )
+            for student in sorted(students, key=lambda s: s.email)
+        ]
+        return CourseOverviewModel(
+            course_id=course_id, exercise_ids=course.exercise_ids, students=progress
+        )
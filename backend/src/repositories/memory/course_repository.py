@@ -0,0 +1,77 @@
+import threading
+from typing import Any
+
+from interfaces.repositories.course_repository_interface import ICourseRepository
+from models.course import Course
+from repositories.memory.enrollment_repository import MemoryEnrollmentRepository
+from repositories.memory.grade_fingerprint_repository import MemoryGradeFingerprintRepository
+from repositories.partial_update import validate_exercise_id_changes, validate_patch_fields
+
+
+class MemoryCourseRepository(ICourseRepository):
+    def __init__(
+        self,
+        enrollment_repository: MemoryEnrollmentRepository | None = None,
+        grade_fingerprint_repository: MemoryGradeFingerprintRepository | None = None,
+    ):
+        self._lock = threading.RLock()
+        self._by_id: dict[str, Course] = {}
+        self._enrollments = enrollment_repository
+        self._fingerprints = grade_fingerprint_repository
+
+    def create(self, data: Course) -> Course:
+        with self._lock:
+            if data.id in self._by_id:
+                msg = f"Course with id {data.id} already exists"
+                raise ValueError(msg)
+            self._by_id[data.id] = data.model_copy(deep=True)
+        return data
+
+    def get(self, item_id: str) -> Course | None:
+        with self._lock:
+            course = self._by_id.get(item_id)
+            return course.model_copy(deep=True) if course else None
+
+    def get_all(self) -> list[Course]:
+        with self._lock:
+            return [c.model_copy(deep=True) for c in self._by_id.values()]
+
+    def update(self, item_id: str, data: Course) -> Course | None:
+        with self._lock:
+            if item_id not in self._by_id:
+                return None
+            self._by_id[item_id] = data.model_copy(deep=True)
+            return data.model_copy(deep=True)
+
+    def patch(
+        self,
+        item_id: str,
+        fields: dict[str, Any],
+        add_exercise_ids: list[str] | None = None,
+        remove_exercise_ids: list[str] | None = None,
+    ) -> Course | None:
+        validate_patch_fields(Course, fields)
+        validate_exercise_id_changes(fields, add_exercise_ids, remove_exercise_ids)
+
+        with self._lock:
+            course = self._by_id.get(item_id)
+            if course is None:
+                return None
+
+            course = course.model_copy(update=fields, deep=True)
+            course.exercise_ids += [
+                e for e in dict.fromkeys(add_exercise_ids or []) if e not in course.exercise_ids
+            ]
+            removed = set(remove_exercise_ids or [])
+            course.exercise_ids = [e for e in course.exercise_ids if e not in removed]
+
+            self._by_id[item_id] = course
+            return course.model_copy(deep=True)
+
+    def delete(self, item_id: str) -> bool:
+        with self._lock:
+            if self._enrollments is not None:
+                self._enrollments.remove_course(item_id)
+            if self._fingerprints is not None:
+                self._fingerprints.remove_course(item_id)
+            return self._by_id.pop(item_id, None) is not None
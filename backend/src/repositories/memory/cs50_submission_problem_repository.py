@@ -0,0 +1,29 @@
+import threading
+
+from interfaces.repositories.cs50_submission_problem_repository_interface import (
+    ICS50SubmissionProblemRepository,
+)
+from models.cs50_submission_problem import CS50SubmissionProblemModel
+
+
+class MemorySubmissionProblemRepository(ICS50SubmissionProblemRepository):
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._by_slug: dict[str, CS50SubmissionProblemModel] = {}
+
+    def upload_submissions(self, submission_problem: CS50SubmissionProblemModel) -> None:
+        with self._lock:
+            self._by_slug[submission_problem.slug] = submission_problem.model_copy(deep=True)
+
+    def get_submissions(self, slug: str) -> CS50SubmissionProblemModel | None:
+        with self._lock:
+            problem = self._by_slug.get(slug)
+            return problem.model_copy(deep=True) if problem else None
+
+    def get_submissions_for_slugs(self, slugs: list[str]) -> list[CS50SubmissionProblemModel]:
+        with self._lock:
+            return [
+                self._by_slug[slug].model_copy(deep=True)
+                for slug in dict.fromkeys(slugs)
+                if slug in self._by_slug
+            ]
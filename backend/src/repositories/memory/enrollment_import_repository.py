@@ -0,0 +1,62 @@
+import threading
+
+from exceptions.duplicate_email import StudentEmailAlreadyExists
+from interfaces.repositories.enrollment_import_repository_interface import (
+    IEnrollmentImportRepository,
+    ImportBatchResult,
+)
+from models.enrollment import EnrollmentModel
+from models.student import StudentModel
+from repositories.memory.enrollment_repository import MemoryEnrollmentRepository
+from repositories.memory.student_repository import MemoryStudentRepository
+
+
+class MemoryEnrollmentImportRepository(IEnrollmentImportRepository):
+    """Applies an import batch under one lock, the in-memory counterpart of a transaction."""
+
+    def __init__(
+        self,
+        student_repository: MemoryStudentRepository,
+        enrollment_repository: MemoryEnrollmentRepository,
+    ):
+        self._lock = threading.RLock()
+        self._students = student_repository
+        self._enrollments = enrollment_repository
+        self._checkpoints: dict[str, int] = {}
+
+    def get_checkpoint(self, import_id: str) -> int:
+        with self._lock:
+            return self._checkpoints.get(import_id, 0)
+
+    def import_batch(
+        self, import_id: str, course_id: str, students: list[StudentModel], rows_done: int
+    ) -> ImportBatchResult:
+        with self._lock:
+            stored: dict[str, StudentModel] = {}
+            students_created = 0
+            for student in students:
+                try:
+                    saved = self._students.create(student)
+                    students_created += 1
+                except StudentEmailAlreadyExists:
+                    saved = self._students.get_by_email(student.email)
+                stored[saved.id] = saved
+
+            enrolled = set(self._enrollments.get_students_for_course(course_id))
+            new_enrollments = [
+                EnrollmentModel(student_id=s.id, course_id=course_id)
+                for s in stored.values()
+                if s.id not in enrolled
+            ]
+            self._enrollments.add_bulk_enrollments(new_enrollments)
+
+            self._checkpoints[import_id] = rows_done
+            return ImportBatchResult(
+                students=list(stored.values()),
+                students_created=students_created,
+                enrollments_created=len(new_enrollments),
+            )
+
+    def finish(self, import_id: str) -> None:
+        with self._lock:
+            self._checkpoints.pop(import_id, None)
@@ -0,0 +1,71 @@
+import threading
+
+from interfaces.repositories.enrollment_repository_interface import IEnrollmentRepository
+from models.enrollment import EnrollmentModel
+
+
+class MemoryEnrollmentRepository(IEnrollmentRepository):
+    """
+    Enrollments held as two adjacency maps, student -> courses and course -> students.
+
+    Both directions are insertion ordered dicts used as sets, so every lookup is
+    a dict access and the result order is stable. Adding an enrollment that
+    already exists is a no-op.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._by_student: dict[str, dict[str, None]] = {}
+        self._by_course: dict[str, dict[str, None]] = {}
+
+    def add_enrollment(self, enrollment: EnrollmentModel):
+        with self._lock:
+            self._by_student.setdefault(enrollment.student_id, {})[enrollment.course_id] = None
+            self._by_course.setdefault(enrollment.course_id, {})[enrollment.student_id] = None
+
+    def add_bulk_enrollments(self, enrollments: list[EnrollmentModel]):
+        with self._lock:
+            for enrollment in enrollments:
+                self.add_enrollment(enrollment)
+
+    def get_courses_for_student(self, student_id: str) -> list[str]:
+        with self._lock:
+            return list(self._by_student.get(student_id, ()))
+
+    def get_students_for_course(self, course_id: str) -> list[str]:
+        with self._lock:
+            return list(self._by_course.get(course_id, ()))
+
+    def get_courses_for_students(self, student_ids: list[str]) -> dict[str, list[str]]:
+        with self._lock:
+            return {s: list(self._by_student.get(s, ())) for s in student_ids}
+
+    def get_students_for_courses(self, course_ids: list[str]) -> dict[str, list[str]]:
+        with self._lock:
+            return {c: list(self._by_course.get(c, ())) for c in course_ids}
+
+    def remove_enrollment(self, enrollment: EnrollmentModel) -> bool:
+        with self._lock:
+            courses = self._by_student.get(enrollment.student_id, {})
+            if enrollment.course_id not in courses:
+                return False
+
+            del courses[enrollment.course_id]
+            del self._by_course[enrollment.course_id][enrollment.student_id]
+            return True
+
+    def remove_student(self, student_id: str) -> int:
+        """Removes all enrollments of a student, like a cascading delete."""
+        with self._lock:
+            courses = self._by_student.pop(student_id, {})
+            for course_id in courses:
+                self._by_course[course_id].pop(student_id, None)
+            return len(courses)
+
+    def remove_course(self, course_id: str) -> int:
+        """Removes all enrollments of a course, like a cascading delete."""
+        with self._lock:
+            students = self._by_course.pop(course_id, {})
+            for student_id in students:
+                self._by_student[student_id].pop(course_id, None)
+            return len(students)
@@ -0,0 +1,37 @@
+import threading
+
+from interfaces.repositories.grade_fingerprint_repository_interface import (
+    IGradeFingerprintRepository,
+)
+from models.grade_fingerprint import GradeFingerprintModel
+
+
+class MemoryGradeFingerprintRepository(IGradeFingerprintRepository):
+    def __init__(self):
+        self._lock = threading.RLock()
+        # course_id -> (student_id, slug) -> fingerprint
+        self._by_course: dict[str, dict[tuple[str, str], GradeFingerprintModel]] = {}
+
+    def get_for_course(self, course_id: str) -> list[GradeFingerprintModel]:
+        with self._lock:
+            return [f.model_copy() for f in self._by_course.get(course_id, {}).values()]
+
+    def save(self, fingerprints: list[GradeFingerprintModel]) -> None:
+        with self._lock:
+            for f in fingerprints:
+                self._by_course.setdefault(f.course_id, {})[f.student_id, f.slug] = f.model_copy()
+
+    def remove_student(self, student_id: str) -> int:
+        """Removes the fingerprints of a student in every course, like a cascading delete."""
+        with self._lock:
+            removed = 0
+            for fingerprints in self._by_course.values():
+                for key in [k for k in fingerprints if k[0] == student_id]:
+                    del fingerprints[key]
+                    removed += 1
+            return removed
+
+    def remove_course(self, course_id: str) -> int:
+        """Removes all fingerprints of a course, like a cascading delete."""
+        with self._lock:
+            return len(self._by_course.pop(course_id, {}))
@@ -0,0 +1,99 @@
+import threading
+from typing import Any
+
+from exceptions.duplicate_email import StudentEmailAlreadyExists
+from interfaces.repositories.student_repository_interface import IStudentRepository
+from models.student import StudentModel, normalize_email
+from repositories.memory.enrollment_repository import MemoryEnrollmentRepository
+from repositories.memory.grade_fingerprint_repository import MemoryGradeFingerprintRepository
+from repositories.partial_update import validate_patch_fields
+
+
+class MemoryStudentRepository(IStudentRepository):
+    """Students by id with a unique secondary index on ``email_key``."""
+
+    def __init__(
+        self,
+        enrollment_repository: MemoryEnrollmentRepository | None = None,
+        grade_fingerprint_repository: MemoryGradeFingerprintRepository | None = None,
+    ):
+        self._lock = threading.RLock()
+        self._by_id: dict[str, StudentModel] = {}
+        self._by_email_key: dict[str, str] = {}
+        self._enrollments = enrollment_repository
+        self._fingerprints = grade_fingerprint_repository
+
+    def _store(self, student: StudentModel) -> None:
+        previous = self._by_id.get(student.id)
+        if previous is not None:
+            self._by_email_key.pop(previous.email_key, None)
+        self._by_id[student.id] = student.model_copy(deep=True)
+        self._by_email_key[student.email_key] = student.id
+
+    def _email_taken(self, email_key: str, student_id: str) -> bool:
+        return self._by_email_key.get(email_key, student_id) != student_id
+
+    def create(self, data: StudentModel) -> StudentModel:
+        with self._lock:
+            if data.email_key in self._by_email_key or data.id in self._by_id:
+                raise StudentEmailAlreadyExists(data.email)
+            self._store(data)
+        return data
+
+    def get(self, item_id: str) -> StudentModel | None:
+        with self._lock:
+            student = self._by_id.get(item_id)
+            return student.model_copy(deep=True) if student else None
+
+    def get_all(self) -> list[StudentModel]:
+        with self._lock:
+            return [s.model_copy(deep=True) for s in self._by_id.values()]
+
+    def get_many(self, item_ids: list[str]) -> list[StudentModel]:
+        with self._lock:
+            return [
+                self._by_id[item_id].model_copy(deep=True)
+                for item_id in dict.fromkeys(item_ids)
+                if item_id in self._by_id
+            ]
+
+    def get_by_email(self, email: str) -> StudentModel | None:
+        with self._lock:
+            student_id = self._by_email_key.get(normalize_email(email))
+            return self.get(student_id) if student_id else None
+
+    def update(self, item_id: str, data: StudentModel) -> StudentModel | None:
+        with self._lock:
+            if item_id not in self._by_id:
+                return None
+            if self._email_taken(data.email_key, item_id):
+                raise StudentEmailAlreadyExists(data.email)
+            self._store(data)
+            return data.model_copy(deep=True)
+
+    def patch(self, item_id: str, fields: dict[str, Any]) -> StudentModel | None:
+        validate_patch_fields(StudentModel, fields)
+
+        with self._lock:
+            student = self._by_id.get(item_id)
+            if student is None:
+                return None
+
+            patched = student.model_copy(update=fields, deep=True)
+            if self._email_taken(patched.email_key, item_id):
+                raise StudentEmailAlreadyExists(fields.get("email"))
+            self._store(patched)
+            return patched.model_copy(deep=True)
+
+    def delete(self, item_id: str) -> bool:
+        with self._lock:
+            if self._enrollments is not None:
+                self._enrollments.remove_student(item_id)
+            if self._fingerprints is not None:
+                self._fingerprints.remove_student(item_id)
+
+            student = self._by_id.pop(item_id, None)
+            if student is None:
+                return False
+            self._by_email_key.pop(student.email_key, None)
+            return True
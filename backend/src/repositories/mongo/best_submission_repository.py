@@ -0,0 +1,86 @@
+from pymongo import UpdateOne
+from pymongo.collection import Collection
+
+from interfaces.repositories.best_submission_repository_interface import (
+    IBestSubmissionRepository,
+)
+from models.best_submission import BestSubmissionModel, best_per_student
+from models.submission import SubmissionModel
+
+
+class MongoBestSubmissionRepository(IBestSubmissionRepository):
+    """
+    Materialized view with one document per (slug, github_id).
+
+    An import reads the stored entries of its slug once and only writes the
+    students whose best or latest submission changed. The writes repeat the
+    comparison in their filters, so a concurrent import of the same slug that
+    stored a better submission after the read is never overwritten.
+    """
+
+    def __init__(self, collection: Collection):
+        self._collection = collection
+
+    def record(self, slug: str, submissions: list[SubmissionModel]) -> int:
+        candidates = best_per_student(slug, submissions)
+        if not candidates:
+            return 0
+
+        stored = {
+            doc["github_id"]: BestSubmissionModel(**doc)
+            for doc in self._collection.find(
+                {"slug": slug, "github_id": {"$in": [c.github_id for c in candidates]}},
+                {"_id": 0},
+            )
+        }
+
+        operations = []
+        changed = 0
+        for candidate in candidates:
+            current = stored.get(candidate.github_id)
+            merged = candidate if current is None else current.merge(candidate)
+            if merged == current:
+                continue
+
+            operations.extend(best_submission_writes(candidate))
+            changed += 1
+
+        if operations:
+            self._collection.bulk_write(operations, ordered=False)
+        return changed
+
+    def get_for_slugs(
+        self, slugs: list[str], github_ids: list[int] | None = None
+    ) -> list[BestSubmissionModel]:
+        if not slugs:
+            return []
+
+        query: dict = {"slug": {"$in": list(slugs)}}
+        if github_ids is not None:
+            query["github_id"] = {"$in": list(github_ids)}
+
+        return [BestSubmissionModel(**doc) for doc in self._collection.find(query, {"_id": 0})]
+
+
+def best_submission_writes(candidate: BestSubmissionModel) -> list[UpdateOne]:
+    """Writes that store ``candidate`` unless the stored submission is at least as good."""
+    key = {"slug": candidate.slug, "github_id": candidate.github_id}
+    best = candidate.model_dump(exclude={"last_timestamp"})
+    return [
+        # replaces the best submission only if the candidate beats the stored one
+        UpdateOne(
+            {
+                **key,
+                "$or": [
+                    {"score": {"$lt": candidate.score}},
+                    {"score": candidate.score, "timestamp": {"$gt": candidate.timestamp}},
+                ],
+            },
+            {"$set": best},
+        ),
+        UpdateOne(
+            key,
+            {"$setOnInsert": best, "$max": {"last_timestamp": candidate.last_timestamp}},
+            upsert=True,
+        ),
+    ]
@@ -0,0 +1,35 @@
+from collections.abc import Sequence
+from typing import Any
+
+from pymongo.client_session import ClientSession
+from pymongo.collection import Collection
+
+type Dependent = tuple[Collection, dict[str, Any]]
+
+
+def delete_cascading(
+    collection: Collection,
+    query: dict[str, Any],
+    dependents: Sequence[Dependent],
+    transactions: bool = False,
+) -> bool:
+    """
+    Deletes one document and every dependent document with ``delete_many``.
+
+    Each dependent query must be served by an index, e.g. ``{"course_id": ...}``
+    by ``course_student_idx``. Dependents are removed even if the document itself
+    is already gone, which cleans up after an earlier partial delete. With
+    ``transactions`` all deletes commit together, which needs a replica set.
+    """
+
+    def delete(session: ClientSession | None) -> bool:
+        result = collection.delete_one(query, session=session)
+        for dependent, dependent_query in dependents:
+            dependent.delete_many(dependent_query, session=session)
+        return result.deleted_count == 1
+
+    if not transactions:
+        return delete(None)
+
+    with collection.database.client.start_session() as session:
+        return session.with_transaction(delete)
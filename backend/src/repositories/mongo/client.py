@@ -0,0 +1,57 @@
+from collections.abc import Sequence
+from typing import Any
+
+from pymongo import MongoClient, monitoring
+from pymongo.collection import Collection
+from pymongo.read_preferences import make_read_preference, read_pref_mode_from_name
+
+
+def create_mongo_client(
+    uri: str,
+    max_pool_size: int = 100,
+    min_pool_size: int = 0,
+    max_idle_time_ms: int | None = None,
+    wait_queue_timeout_ms: int | None = None,
+    server_selection_timeout_ms: int = 30_000,
+    compressors: str = "",
+    read_preference: str = "primary",
+    event_listeners: Sequence[monitoring.ConnectionPoolListener | monitoring.CommandListener] = (),
+) -> MongoClient:
+    """
+    Builds the MongoClient from ``MongoSettings``.
+
+    Options that are unset are left out, so pymongo defaults and options in the
+    ``uri`` still apply. ``compressors`` is a comma separated list, e.g.
+    ``zstd,snappy``; zstd needs ``zstandard`` and snappy ``python-snappy`` installed.
+    """
+    options: dict[str, Any] = {
+        "maxPoolSize": max_pool_size,
+        "minPoolSize": min_pool_size,
+        "serverSelectionTimeoutMS": server_selection_timeout_ms,
+        "readPreference": read_preference,
+        "event_listeners": list(event_listeners),
+    }
+    if max_idle_time_ms is not None:
+        options["maxIdleTimeMS"] = max_idle_time_ms
+    if wait_queue_timeout_ms is not None:
+        options["waitQueueTimeoutMS"] = wait_queue_timeout_ms
+    if compressors:
+        options["compressors"] = compressors
+
+    return MongoClient(uri, **options)
+
+
+def read_collection(
+    collection: Collection,
+    read_preference: str = "secondaryPreferred",
+    max_staleness_seconds: int | None = None,
+) -> Collection:
+    """
+    Returns a handle on ``collection`` for heavy reads, e.g. routed to secondaries.
+
+    Writes must keep using ``collection``. ``max_staleness_seconds`` (at least 90)
+    keeps reads away from secondaries that lag further behind the primary.
+    """
+    mode = read_pref_mode_from_name(read_preference)
+    staleness = -1 if max_staleness_seconds is None else max_staleness_seconds
+    return collection.with_options(read_preference=make_read_preference(mode, None, staleness))
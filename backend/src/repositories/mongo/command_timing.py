@@ -0,0 +1,22 @@
+from pymongo import monitoring
+
+from request_timing import record
+
+
+class CommandTiming(monitoring.CommandListener):
+    """
+    Attributes the duration of every Mongo command to the request that issued it.
+
+    pymongo calls the listener in the thread that runs the command, which for an
+    API request carries the request's timing context. Commands of background
+    work (migrations, the orphan sweeper) are not recorded.
+    """
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        return
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        record("mongo", event.duration_micros / 1_000_000, event.command_name)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        record("mongo", event.duration_micros / 1_000_000, event.command_name)
@@ -0,0 +1,132 @@
+from typing import Any
+
+from pymongo.collection import Collection
+
+from interfaces.repositories.course_overview_repository_interface import (
+    ICourseOverviewRepository,
+)
+from models.course_overview import CourseOverviewModel, StudentProgressModel
+
+
+def course_overview_pipeline(
+    course_id: str,
+    pass_threshold: float,
+    enrollment_collection: str = "enrollments",
+    student_collection: str = "students",
+    best_submission_collection: str = "best_submissions",
+) -> list[dict[str, Any]]:
+    """
+    Joins course -> enrollments -> students -> best submissions in one aggregation.
+
+    Each lookup is an equality match on an indexed field (``course_student_idx``,
+    ``id_unique_idx``, ``github_id_slug_idx``). The best submissions are limited to
+    the course's exercises inside the lookup, so problems of other courses are
+    neither read nor unwound. Empty lookups are preserved, so the course comes back
+    even without enrollments and students without submissions are still listed.
+    """
+    return [
+        {"$match": {"id": course_id}},
+        {
+            "$lookup": {
+                "from": enrollment_collection,
+                "localField": "id",
+                "foreignField": "course_id",
+                "as": "enrollment",
+            }
+        },
+        {"$unwind": {"path": "$enrollment", "preserveNullAndEmptyArrays": True}},
+        {
+            "$lookup": {
+                "from": student_collection,
+                "localField": "enrollment.student_id",
+                "foreignField": "id",
+                "as": "student",
+            }
+        },
+        {"$unwind": {"path": "$student", "preserveNullAndEmptyArrays": True}},
+        {
+            "$lookup": {
+                "from": best_submission_collection,
+                "let": {"github_id": "$student.github_id", "exercise_ids": "$exercise_ids"},
+                "pipeline": [
+                    {
+                        "$match": {
+                            "$expr": {
+                                "$and": [
+                                    {"$eq": ["$github_id", "$$github_id"]},
+                                    {"$in": ["$slug", "$$exercise_ids"]},
+                                ]
+                            }
+                        }
+                    },
+                    {"$project": {"_id": 0, "slug": 1, "score": 1}},
+                ],
+                "as": "best",
+            }
+        },
+        {"$unwind": {"path": "$best", "preserveNullAndEmptyArrays": True}},
+        {
+            "$group": {
+                "_id": "$student.id",
+                "exercise_ids": {"$first": "$exercise_ids"},
+                "email": {"$first": "$student.email"},
+                "name": {"$first": "$student.name"},
+                "github_id": {"$first": "$student.github_id"},
+                "passed": {
+                    "$addToSet": {
+                        "$cond": [{"$gte": ["$best.score", pass_threshold]}, "$best.slug", None]
+                    }
+                },
+            }
+        },
+        {"$sort": {"email": 1}},
+    ]
+
+
+class MongoCourseOverviewRepository(ICourseOverviewRepository):
+    def __init__(
+        self,
+        collection: Collection,
+        enrollment_collection: str = "enrollments",
+        student_collection: str = "students",
+        best_submission_collection: str = "best_submissions",
+    ):
+        self._collection = collection
+        self._lookups = {
+            "enrollment_collection": enrollment_collection,
+            "student_collection": student_collection,
+            "best_submission_collection": best_submission_collection,
+        }
+
+    def get_overview(
+        self, course_id: str, pass_threshold: float = 1.0
+    ) -> CourseOverviewModel | None:
+        groups = list(
+            self._collection.aggregate(
+                course_overview_pipeline(course_id, pass_threshold, **self._lookups)
+            )
+        )
+        if not groups:
+            return None
+
+        exercise_ids = groups[0]["exercise_ids"] or []
+        students = []
+        for group in groups:
+            # the course itself without any enrollment
+            if group["_id"] is None:
+                continue
+
+            passed = set(group["passed"])
+            students.append(
+                StudentProgressModel(
+                    student_id=group["_id"],
+                    email=group["email"],
+                    name=group.get("name") or "",
+                    github_id=group.get("github_id"),
+                    passed_exercise_ids=[e for e in exercise_ids if e in passed],
+                )
+            )
+
+        return CourseOverviewModel(
+            course_id=course_id, exercise_ids=exercise_ids, students=students
+        )
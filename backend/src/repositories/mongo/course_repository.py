@@ -1,12 +1,29 @@
+from typing import Any
+
+from pymongo import ReturnDocument
 from pymongo.collection import Collection
 
 from interfaces.repositories.course_repository_interface import ICourseRepository
 from models.course import Course
+from repositories.mongo.cascade import delete_cascading
+from repositories.partial_update import validate_exercise_id_changes, validate_patch_fields
 
 
 class MongoCourseRepository(ICourseRepository):
-    def __init__(self, collection: Collection):
+    def __init__(
+        self,
+        collection: Collection,
+        enrollment_collection: Collection | None = None,
+        transactions: bool = False,
+        read_collection: Collection | None = None,
+        grade_fingerprint_collection: Collection | None = None,
+    ):
         self._collection = collection
+        # list reads may go to secondaries, lookups used by writes stay on the primary
+        self._read_collection = read_collection if read_collection is not None else collection
+        self._enrollments = enrollment_collection
+        self._fingerprints = grade_fingerprint_collection
+        self._transactions = transactions
 
     def create(self, data: Course) -> Course:
         document = data.model_dump()
@@ -18,7 +35,7 @@ class MongoCourseRepository(ICourseRepository):
         return Course(**doc) if doc else None
 
     def get_all(self) -> list[Course]:
-        return [Course(**doc) for doc in self._collection.find()]
+        return [Course(**doc) for doc in self._read_collection.find()]
 
     def update(self, item_id: str, data: Course) -> Course | None:
         document = data.model_dump()
@@ -31,6 +48,43 @@ class MongoCourseRepository(ICourseRepository):
 
         return Course(**result) if result else None
 
+    def patch(
+        self,
+        item_id: str,
+        fields: dict[str, Any],
+        add_exercise_ids: list[str] | None = None,
+        remove_exercise_ids: list[str] | None = None,
+    ) -> Course | None:
+        validate_patch_fields(Course, fields)
+        validate_exercise_id_changes(fields, add_exercise_ids, remove_exercise_ids)
+
+        update: dict[str, Any] = {}
+        if fields:
+            update["$set"] = fields
+        if add_exercise_ids:
+            update["$addToSet"] = {"exercise_ids": {"$each": add_exercise_ids}}
+        if remove_exercise_ids:
+            update["$pull"] = {"exercise_ids": {"$in": remove_exercise_ids}}
+
+        if not update:
+            return self.get(item_id)
+
+        result = self._collection.find_one_and_update(
+            {"id": item_id},
+            update,
+            projection={"_id": 0},
+            return_document=ReturnDocument.AFTER,
+        )
+
+        return Course(**result) if result else None
+
     def delete(self, item_id: str) -> bool:
-        result = self._collection.delete_one({"id": item_id})
-        return result.deleted_count == 1
+        dependents = []
+        if self._enrollments is not None:
+            dependents.append((self._enrollments, {"course_id": item_id}))
+        if self._fingerprints is not None:
+            dependents.append((self._fingerprints, {"course_id": item_id}))
+
+        return delete_cascading(
+            self._collection, {"id": item_id}, dependents, transactions=self._transactions
+        )
@@ -1,37 +1,44 @@
-from datetime import datetime
-from email.utils import format_datetime
-
 from pymongo.collection import Collection
 
 from interfaces.repositories.cs50_submission_problem_repository_interface import (
     ICS50SubmissionProblemRepository,
 )
 from models.cs50_submission_problem import CS50SubmissionProblemModel
+from repositories.mongo.submission_codec import decode_submissions, encode_problem
 
 
 class MongoSubmissionProblemRepository(ICS50SubmissionProblemRepository):
-    def __init__(self, collection: Collection):
+    def __init__(self, collection: Collection, read_collection: Collection | None = None):
         self._collection = collection
+        self._read_collection = read_collection if read_collection is not None else collection
 
-    def upload_submissions(self, submission_problem: CS50SubmissionProblemModel):
-        document = submission_problem.model_dump()
+    def upload_submissions(self, submission_problem: CS50SubmissionProblemModel) -> None:
+        document = encode_problem(submission_problem)
 
         self._collection.update_one(
             {"slug": submission_problem.slug},
-            {"$set": document},
+            {"$set": document, "$unset": {"submissions": ""}},
             upsert=True,
         )
 
     def get_submissions(self, slug: str) -> CS50SubmissionProblemModel | None:
-        doc = self._collection.find_one({"slug": slug})
+        doc = self._read_collection.find_one({"slug": slug}, {"_id": 0})
         if not doc:
             return None
 
-        doc.pop("_id", None)
+        return _to_model(doc)
+
+    def get_submissions_for_slugs(self, slugs: list[str]) -> list[CS50SubmissionProblemModel]:
+        if not slugs:
+            return []
+
+        docs = self._read_collection.find({"slug": {"$in": list(slugs)}}, {"_id": 0})
+        return [_to_model(doc) for doc in docs]
+
 
-        subs = doc.get("submissions", [])
-        for s in subs:
-            ts = s.get("timestamp")
-            if isinstance(ts, datetime):
-                s["timestamp"] = format_datetime(ts)
-        return CS50SubmissionProblemModel(**doc)
+def _to_model(doc: dict) -> CS50SubmissionProblemModel:
+    return CS50SubmissionProblemModel(
+        id=doc["id"],
+        slug=doc["slug"],
+        submissions=decode_submissions(doc),
+    )
@@ -0,0 +1,122 @@
+from datetime import UTC, datetime
+
+from pymongo import UpdateOne
+from pymongo.client_session import ClientSession
+from pymongo.collection import Collection
+
+from interfaces.repositories.enrollment_import_repository_interface import (
+    IEnrollmentImportRepository,
+    ImportBatchResult,
+)
+from models.enrollment import EnrollmentModel
+from models.student import StudentModel
+from repositories.mongo.student_repository import email_filter
+
+
+class MongoEnrollmentImportRepository(IEnrollmentImportRepository):
+    """
+    Writes CSV enrollment imports batch by batch.
+
+    Students are upserted by their normalized email and enrollments by (student, course), so a
+    batch that is retried after a crash or a transient error neither duplicates
+    documents nor fails on the unique indexes. The checkpoint in ``collection`` is
+    written with the batch; with ``transactions`` students, enrollments and the
+    checkpoint commit together and ``with_transaction`` retries transient errors.
+    """
+
+    def __init__(
+        self,
+        collection: Collection,
+        student_collection: Collection,
+        enrollment_collection: Collection,
+        transactions: bool = False,
+    ):
+        self._collection = collection
+        self._students = student_collection
+        self._enrollments = enrollment_collection
+        self._transactions = transactions
+
+    def get_checkpoint(self, import_id: str) -> int:
+        doc = self._collection.find_one({"_id": import_id}, {"rows_done": 1})
+        return doc["rows_done"] if doc else 0
+
+    def import_batch(
+        self, import_id: str, course_id: str, students: list[StudentModel], rows_done: int
+    ) -> ImportBatchResult:
+        def write(session: ClientSession | None) -> ImportBatchResult:
+            return self._write_batch(session, import_id, course_id, students, rows_done)
+
+        if not self._transactions:
+            return write(None)
+
+        with self._collection.database.client.start_session() as session:
+            return session.with_transaction(write)
+
+    def finish(self, import_id: str) -> None:
+        self._collection.delete_one({"_id": import_id})
+
+    def _write_batch(
+        self,
+        session: ClientSession | None,
+        import_id: str,
+        course_id: str,
+        students: list[StudentModel],
+        rows_done: int,
+    ) -> ImportBatchResult:
+        students_created = 0
+        enrollments_created = 0
+        stored: list[StudentModel] = []
+
+        if students:
+            result = self._students.bulk_write(
+                [
+                    UpdateOne(email_filter([s]), {"$setOnInsert": s.model_dump()}, upsert=True)
+                    for s in students
+                ],
+                ordered=False,
+                session=session,
+            )
+            students_created = result.upserted_count
+
+            docs = self._students.find(
+                email_filter(students),
+                {"_id": 0},
+                session=session,
+            )
+            stored = [StudentModel(**doc) for doc in docs]
+
+            result = self._enrollments.bulk_write(
+                [
+                    UpdateOne(
+                        enrollment,
+                        {"$setOnInsert": enrollment},
+                        upsert=True,
+                    )
+                    for enrollment in (
+                        EnrollmentModel(student_id=s.id, course_id=course_id).model_dump()
+                        for s in stored
+                    )
+                ],
+                ordered=False,
+                session=session,
+            )
+            enrollments_created = result.upserted_count
+
+        self._collection.update_one(
+            {"_id": import_id},
+            {
+                "$set": {
+                    "course_id": course_id,
+                    "rows_done": rows_done,
+                    "updated_at": datetime.now(UTC),
+                }
+            },
+            upsert=True,
+            session=session,
+        )
+
+        return ImportBatchResult(
+            students=stored,
+            students_created=students_created,
+            enrollments_created=enrollments_created,
+        )
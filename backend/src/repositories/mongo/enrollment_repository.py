@@ -1,8 +1,12 @@
+from pymongo import UpdateOne
 from pymongo.collection import Collection
 
 from interfaces.repositories.enrollment_repository_interface import IEnrollmentRepository
 from models.enrollment import EnrollmentModel
 
+# only fields of the compound indexes, so the lookups never fetch documents
+ID_PROJECTION = {"_id": 0, "student_id": 1, "course_id": 1}
+
 
 class MongoEnrollmentRepository(IEnrollmentRepository):
     def __init__(self, collection: Collection):
@@ -21,6 +25,26 @@ class MongoEnrollmentRepository(IEnrollmentRepository):
         docs = self._collection.find({"course_id": course_id})
         return [doc["student_id"] for doc in docs]
 
+    def get_courses_for_students(self, student_ids: list[str]) -> dict[str, list[str]]:
+        courses: dict[str, list[str]] = {student_id: [] for student_id in student_ids}
+        if not courses:
+            return courses
+
+        docs = self._collection.find({"student_id": {"$in": list(courses)}}, ID_PROJECTION)
+        for doc in docs:
+            courses[doc["student_id"]].append(doc["course_id"])
+        return courses
+
+    def get_students_for_courses(self, course_ids: list[str]) -> dict[str, list[str]]:
+        students: dict[str, list[str]] = {course_id: [] for course_id in course_ids}
+        if not students:
+            return students
+
+        docs = self._collection.find({"course_id": {"$in": list(students)}}, ID_PROJECTION)
+        for doc in docs:
+            students[doc["course_id"]].append(doc["student_id"])
+        return students
+
     def remove_enrollment(self, enrollment: EnrollmentModel) -> bool:
         result = self._collection.delete_one({
             "student_id": enrollment.student_id,
@@ -32,5 +56,9 @@ class MongoEnrollmentRepository(IEnrollmentRepository):
         if not enrollments:
             return
 
+        # upserts, so importing the same roster again adds no duplicate enrollments
         documents = [e.model_dump() for e in enrollments]
-        self._collection.insert_many(documents)
+        self._collection.bulk_write(
+            [UpdateOne(doc, {"$setOnInsert": doc}, upsert=True) for doc in documents],
+            ordered=False,
+        )
@@ -0,0 +1,32 @@
+from pymongo import UpdateOne
+from pymongo.collection import Collection
+
+from interfaces.repositories.grade_fingerprint_repository_interface import (
+    IGradeFingerprintRepository,
+)
+from models.grade_fingerprint import GradeFingerprintModel
+
+
+class MongoGradeFingerprintRepository(IGradeFingerprintRepository):
+    def __init__(self, collection: Collection):
+        self._collection = collection
+
+    def get_for_course(self, course_id: str) -> list[GradeFingerprintModel]:
+        docs = self._collection.find({"course_id": course_id}, {"_id": 0})
+        return [GradeFingerprintModel(**doc) for doc in docs]
+
+    def save(self, fingerprints: list[GradeFingerprintModel]) -> None:
+        if not fingerprints:
+            return
+
+        self._collection.bulk_write(
+            [
+                UpdateOne(
+                    {"course_id": f.course_id, "student_id": f.student_id, "slug": f.slug},
+                    {"$set": f.model_dump()},
+                    upsert=True,
+                )
+                for f in fingerprints
+            ],
+            ordered=False,
+        )
@@ -0,0 +1,188 @@
+import logging
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from pymongo.collection import Collection
+from pymongo.errors import OperationFailure
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSIONS_COLLECTION = "_index_versions"
+
+# suffix of the index a changed definition is first built under
+REBUILD_SUFFIX = "_rebuild"
+
+# the server refuses a second index on the same keys that differs only in e.g. uniqueness
+INDEX_OPTIONS_CONFLICT = 85
+INDEX_KEY_SPECS_CONFLICT = 86
+
+# options of index_information() entries that create_index accepts back
+RESTORABLE_OPTIONS = ("unique", "sparse", "partialFilterExpression", "expireAfterSeconds")
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    name: str
+    keys: tuple[tuple[str, int], ...]
+    unique: bool = False
+    partial_filter: dict[str, Any] | None = None
+    # TTL index: documents expire this many seconds after the indexed date
+    expire_after_seconds: int | None = None
+
+    def options(self) -> dict[str, Any]:
+        options: dict[str, Any] = {"name": self.name}
+        if self.unique:
+            options["unique"] = True
+        if self.partial_filter is not None:
+            options["partialFilterExpression"] = self.partial_filter
+        if self.expire_after_seconds is not None:
+            options["expireAfterSeconds"] = self.expire_after_seconds
+        return options
+
+    def matches(self, info: dict[str, Any]) -> bool:
+        """Compares the declaration with an entry of ``Collection.index_information()``."""
+        keys = tuple((name, int(direction)) for name, direction in info["key"])
+        return (
+            keys == self.keys
+            and bool(info.get("unique")) == self.unique
+            and info.get("partialFilterExpression") == self.partial_filter
+            and info.get("expireAfterSeconds") == self.expire_after_seconds
+        )
+
+
+@dataclass(frozen=True)
+class CollectionIndexes:
+    """
+    Declared indexes of one collection.
+
+    Bump ``version`` whenever ``indexes`` or ``retired`` change. Retired index
+    names are dropped if they still exist.
+    """
+
+    version: int
+    indexes: tuple[IndexSpec, ...]
+    retired: tuple[str, ...] = ()
+
+
+@dataclass
+class IndexMigrationReport:
+    collection: str
+    version: int
+    previous_version: int | None = None
+    created: list[str] = field(default_factory=list)
+    rebuilt: list[str] = field(default_factory=list)
+    dropped: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.created or self.rebuilt or self.dropped)
+
+
+def ensure_indexes(collection: Collection, declaration: CollectionIndexes) -> IndexMigrationReport:
+    """
+    Brings the indexes of ``collection`` in line with ``declaration``.
+
+    Missing indexes are created, indexes whose definition changed are rebuilt and
+    retired ones are dropped; running it again is a no-op. Failing index builds,
+    e.g. a unique index over duplicated values, are reported instead of raised and
+    leave the existing index in place. Retired indexes are only dropped once every
+    declared index was built, as they may still serve queries until then.
+    """
+    versions = collection.database[INDEX_VERSIONS_COLLECTION]
+    recorded = versions.find_one({"_id": collection.name}) or {}
+
+    report = IndexMigrationReport(
+        collection=collection.name,
+        version=declaration.version,
+        previous_version=recorded.get("version"),
+    )
+
+    existing = collection.index_information()
+
+    for spec in declaration.indexes:
+        info = existing.get(spec.name)
+        if info is not None and spec.matches(info):
+            report.unchanged.append(spec.name)
+            continue
+
+        try:
+            if info is not None:
+                _rebuild(collection, spec, info, existing)
+            else:
+                collection.create_index(list(spec.keys), **spec.options())
+        except OperationFailure as exc:
+            report.failed[spec.name] = str(exc)
+            logger.exception("Failed to build index %s on %s", spec.name, collection.name)
+            continue
+
+        (report.rebuilt if info is not None else report.created).append(spec.name)
+
+    if not report.failed:
+        for name in declaration.retired:
+            if name in existing:
+                collection.drop_index(name)
+                report.dropped.append(name)
+
+    if report.changed or report.previous_version != declaration.version:
+        versions.update_one(
+            {"_id": collection.name},
+            {
+                "$set": {
+                    "version": declaration.version,
+                    "indexes": [spec.name for spec in declaration.indexes],
+                    "applied_at": datetime.now(UTC),
+                }
+            },
+            upsert=True,
+        )
+        logger.info(
+            "Migrated indexes of %s from version %s to %s: created=%s rebuilt=%s dropped=%s",
+            collection.name,
+            report.previous_version,
+            report.version,
+            report.created,
+            report.rebuilt,
+            report.dropped,
+        )
+
+    return report
+
+
+def _rebuild(
+    collection: Collection,
+    spec: IndexSpec,
+    info: dict[str, Any],
+    existing: dict[str, dict[str, Any]],
+) -> None:
+    """
+    Replaces the index ``spec.name`` with the changed definition.
+
+    Index names cannot be changed and two identical indexes cannot coexist, so the
+    new definition is first built under a temporary name. That build proves it
+    succeeds, e.g. that a new unique index has no duplicates, while the old index
+    still serves queries. Only then is the old index swapped out. If the final
+    build fails anyway, the old index is built again.
+    """
+    temporary = f"{spec.name}{REBUILD_SUFFIX}"
+    if temporary in existing:
+        # left behind by an interrupted rebuild
+        collection.drop_index(temporary)
+
+    try:
+        collection.create_index(list(spec.keys), **{**spec.options(), "name": temporary})
+    except OperationFailure as exc:
+        if exc.code not in (INDEX_OPTIONS_CONFLICT, INDEX_KEY_SPECS_CONFLICT):
+            raise
+    else:
+        collection.drop_index(temporary)
+
+    collection.drop_index(spec.name)
+    try:
+        collection.create_index(list(spec.keys), **spec.options())
+    except OperationFailure:
+        options = {key: info[key] for key in RESTORABLE_OPTIONS if key in info}
+        collection.create_index(list(info["key"]), name=spec.name, **options)
+        raise
@@ -1,19 +1,109 @@
 from pymongo.collection import Collection
 
+from repositories.mongo.indexes import (
+    CollectionIndexes,
+    IndexMigrationReport,
+    IndexSpec,
+    ensure_indexes,
+)
 
-def init_student_collection(collection: Collection):
-    collection.create_index("email", unique=True)
+COURSE_INDEXES = CollectionIndexes(
+    version=1,
+    indexes=(IndexSpec("id_unique_idx", (("id", 1),), unique=True),),
+)
 
+STUDENT_INDEXES = CollectionIndexes(
+    version=4,
+    indexes=(
+        # email_1 stays until the email_key backfill has run on every deployment
+        IndexSpec("email_1", (("email", 1),), unique=True),
+        # partial, so students without a key yet do not collide on null
+        IndexSpec(
+            "email_key_unique_idx",
+            (("email_key", 1),),
+            unique=True,
+            partial_filter={"email_key": {"$type": "string"}},
+        ),
+        IndexSpec("id_unique_idx", (("id", 1),), unique=True),
+        # most students have no github_id until they submitted their GitHub name
+        IndexSpec(
+            "github_id_idx",
+            (("github_id", 1),),
+            partial_filter={"github_id": {"$type": "number"}},
+        ),
+    ),
+)
 
-def init_enrollment_collection(collection: Collection):
-    collection.create_index(
-        [("student_id", 1), ("course_id", 1)], unique=True, name="student_course_unique_idx"
-    )
+ENROLLMENT_INDEXES = CollectionIndexes(
+    version=2,
+    indexes=(
+        IndexSpec("student_course_unique_idx", (("student_id", 1), ("course_id", 1)), unique=True),
+        # both compound indexes hold the two id fields, so id lookups are covered queries
+        IndexSpec("course_student_idx", (("course_id", 1), ("student_id", 1))),
+    ),
+    # prefixes of the compound indexes above
+    retired=("student_idx", "course_idx"),
+)
 
-    collection.create_index([("student_id", 1)], name="student_idx")
+CS50_SUBMISSION_PROBLEM_INDEXES = CollectionIndexes(
+    version=1,
+    indexes=(IndexSpec("slug_unique_idx", (("slug", 1),), unique=True),),
+)
 
-    collection.create_index([("course_id", 1)], name="course_idx")
+BEST_SUBMISSION_INDEXES = CollectionIndexes(
+    version=2,
+    indexes=(
+        IndexSpec("slug_github_id_unique_idx", (("slug", 1), ("github_id", 1)), unique=True),
+        # course overview looks up all problems of one student
+        IndexSpec("github_id_slug_idx", (("github_id", 1), ("slug", 1))),
+    ),
+)
 
+GRADE_FINGERPRINT_INDEXES = CollectionIndexes(
+    version=2,
+    indexes=(
+        IndexSpec(
+            "course_student_slug_unique_idx",
+            (("course_id", 1), ("student_id", 1), ("slug", 1)),
+            unique=True,
+        ),
+        # deleting a student removes its fingerprints in every course
+        IndexSpec("student_idx", (("student_id", 1),)),
+    ),
+)
 
-def init_cs50_submission_problem_collection(collection: Collection):
-    collection.create_index("slug", unique=True, name="slug_unique_idx")
+ENROLLMENT_IMPORT_INDEXES = CollectionIndexes(
+    version=1,
+    indexes=(
+        # checkpoints of imports that were never uploaded again; finished ones are deleted
+        IndexSpec("updated_at_ttl_idx", (("updated_at", 1),), expire_after_seconds=7 * 24 * 3600),
+    ),
+)
+
+
+def init_course_collection(collection: Collection) -> IndexMigrationReport:
+    return ensure_indexes(collection, COURSE_INDEXES)
+
+
+def init_student_collection(collection: Collection) -> IndexMigrationReport:
+    return ensure_indexes(collection, STUDENT_INDEXES)
+
+
+def init_enrollment_collection(collection: Collection) -> IndexMigrationReport:
+    return ensure_indexes(collection, ENROLLMENT_INDEXES)
+
+
+def init_enrollment_import_collection(collection: Collection) -> IndexMigrationReport:
+    return ensure_indexes(collection, ENROLLMENT_IMPORT_INDEXES)
+
+
+def init_cs50_submission_problem_collection(collection: Collection) -> IndexMigrationReport:
+    return ensure_indexes(collection, CS50_SUBMISSION_PROBLEM_INDEXES)
+
+
+def init_best_submission_collection(collection: Collection) -> IndexMigrationReport:
+    return ensure_indexes(collection, BEST_SUBMISSION_INDEXES)
+
+
+def init_grade_fingerprint_collection(collection: Collection) -> IndexMigrationReport:
+    return ensure_indexes(collection, GRADE_FINGERPRINT_INDEXES)
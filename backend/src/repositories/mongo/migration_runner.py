@@ -0,0 +1,238 @@
+import logging
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any, ClassVar
+
+from pymongo import DeleteMany, DeleteOne, ReplaceOne, UpdateOne
+from pymongo.collection import Collection
+from pymongo.database import Database
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_COLLECTION = "_migrations"
+
+DUPLICATE_KEY = 11000
+
+type WriteOp = UpdateOne | ReplaceOne | DeleteOne | DeleteMany
+
+
+class BackfillMigration(ABC):
+    """
+    Rewrites the documents of one collection in batches ordered by ``_id``.
+
+    ``query`` selects the documents the backfill still has to touch, so a
+    migration stays correct if documents are written by the new code while it runs.
+    The writes go to ``target`` if set, e.g. to build a derived collection.
+    """
+
+    version: ClassVar[int]
+    name: ClassVar[str]
+    collection: ClassVar[str]
+    query: ClassVar[dict[str, Any]] = {}
+    target: ClassVar[str | None] = None
+    # writes failing on a unique index are logged and counted instead of stopping the run
+    skip_duplicate_keys: ClassVar[bool] = False
+
+    @abstractmethod
+    def transform(self, document: dict[str, Any]) -> list[WriteOp]:
+        """Returns the writes for one document, addressed by its ``_id``."""
+        ...
+
+    def transform_batch(self, database: Database, batch: list[dict[str, Any]]) -> list[WriteOp]:
+        """Returns the writes for one batch; override to look at documents together."""
+        return [op for document in batch for op in self.transform(document)]
+
+    def prepare(self, database: Database) -> None:
+        """Runs before the first batch of every (resumed) run; must be idempotent."""
+        return
+
+    def finalize(self, database: Database) -> None:
+        """Runs once after the last batch, e.g. to build an index over the new data."""
+        return
+
+
+@dataclass(frozen=True)
+class MigrationResult:
+    version: int
+    name: str
+    status: str
+    processed: int = 0
+    batches: int = 0
+    skipped: int = 0
+
+
+class MigrationRunner:
+    """
+    Applies backfill migrations in version order and records them in ``_migrations``.
+
+    Every batch is written with one unordered ``bulk_write`` followed by a
+    checkpoint, and the runner sleeps ``throttle_seconds`` between batches so it
+    can run next to API traffic. An interrupted migration resumes after its last
+    checkpoint. A lease keeps several API instances from running the same
+    migration at once.
+    """
+
+    def __init__(
+        self,
+        database: Database,
+        migrations: Sequence[BackfillMigration],
+        batch_size: int = 500,
+        throttle_seconds: float = 0.1,
+        lease_seconds: float = 300,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self._database = database
+        self._state = database[MIGRATIONS_COLLECTION]
+        self._migrations = sorted(migrations, key=lambda m: m.version)
+        self._batch_size = batch_size
+        self._throttle_seconds = throttle_seconds
+        self._lease_seconds = lease_seconds
+        self._sleep = sleep
+        self._owner = str(uuid.uuid4())
+        self._stopped = threading.Event()
+
+    def stop(self) -> None:
+        """Stops after the current batch; the migration resumes on the next run."""
+        self._stopped.set()
+
+    def run(self) -> list[MigrationResult]:
+        results = []
+        for migration in self._migrations:
+            state = self._state.find_one({"_id": migration.version}) or {}
+            if state.get("status") == "applied":
+                results.append(MigrationResult(migration.version, migration.name, "skipped"))
+                continue
+
+            if not self._acquire(migration):
+                # later migrations may depend on this one
+                results.append(MigrationResult(migration.version, migration.name, "locked"))
+                break
+
+            result = self._backfill(migration, state.get("checkpoint"))
+            results.append(result)
+            if result.status != "applied":
+                break
+
+        return results
+
+    def run_in_background(self) -> threading.Thread:
+        thread = threading.Thread(target=self._run_logged, name="schema-migrations", daemon=True)
+        thread.start()
+        return thread
+
+    def _run_logged(self) -> None:
+        try:
+            for result in self.run():
+                logger.info("Schema migration %s", result)
+        except Exception:
+            logger.exception("Schema migrations failed")
+
+    def _lease_until(self) -> datetime:
+        return datetime.now(UTC) + timedelta(seconds=self._lease_seconds)
+
+    def _acquire(self, migration: BackfillMigration) -> bool:
+        try:
+            self._state.update_one(
+                {
+                    "_id": migration.version,
+                    "status": {"$ne": "applied"},
+                    "$or": [
+                        {"owner": self._owner},
+                        {"lease_until": {"$lt": datetime.now(UTC)}},
+                        {"lease_until": {"$exists": False}},
+                    ],
+                },
+                {
+                    "$set": {
+                        "name": migration.name,
+                        "status": "running",
+                        "owner": self._owner,
+                        "lease_until": self._lease_until(),
+                    },
+                },
+                upsert=True,
+            )
+        except DuplicateKeyError:
+            return False
+        return True
+
+    def _backfill(self, migration: BackfillMigration, checkpoint: Any) -> MigrationResult:
+        collection = self._database[migration.collection]
+        target = self._database[migration.target or migration.collection]
+        processed = 0
+        batches = 0
+        skipped = 0
+
+        migration.prepare(self._database)
+
+        while True:
+            if self._stopped.is_set():
+                # hand the lease back so the next start resumes right away
+                self._state.update_one(
+                    {"_id": migration.version, "owner": self._owner},
+                    {"$unset": {"lease_until": "", "owner": ""}},
+                )
+                return MigrationResult(
+                    migration.version, migration.name, "interrupted", processed, batches, skipped
+                )
+
+            query = dict(migration.query)
+            if checkpoint is not None:
+                query = {"$and": [query, {"_id": {"$gt": checkpoint}}]}
+
+            batch = list(collection.find(query).sort("_id", 1).limit(self._batch_size))
+            if not batch:
+                break
+
+            operations = migration.transform_batch(self._database, batch)
+            if operations:
+                skipped += _write(migration, target, operations)
+
+            checkpoint = batch[-1]["_id"]
+            processed += len(batch)
+            batches += 1
+
+            self._state.update_one(
+                {"_id": migration.version, "owner": self._owner},
+                {
+                    "$set": {"checkpoint": checkpoint, "lease_until": self._lease_until()},
+                    "$inc": {"processed": len(batch)},
+                },
+            )
+
+            if len(batch) < self._batch_size:
+                break
+            self._sleep(self._throttle_seconds)
+
+        migration.finalize(self._database)
+
+        self._state.update_one(
+            {"_id": migration.version, "owner": self._owner},
+            {
+                "$set": {"status": "applied", "applied_at": datetime.now(UTC)},
+                "$unset": {"lease_until": "", "owner": ""},
+            },
+        )
+        return MigrationResult(
+            migration.version, migration.name, "applied", processed, batches, skipped
+        )
+
+
+def _write(migration: BackfillMigration, target: Collection, operations: list[WriteOp]) -> int:
+    """Writes one batch and returns the number of skipped duplicate-key writes."""
+    try:
+        target.bulk_write(operations, ordered=False)
+    except BulkWriteError as exc:
+        errors = exc.details.get("writeErrors", [])
+        if not migration.skip_duplicate_keys or any(e.get("code") != DUPLICATE_KEY for e in errors):
+            raise
+        for error in errors:
+            logger.warning("Migration %s skipped a write: %s", migration.name, error.get("errmsg"))
+        return len(errors)
+    return 0
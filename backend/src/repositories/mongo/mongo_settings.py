@@ -1,9 +1,39 @@
+from typing import Literal
+
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class MongoSettings(BaseSettings):
     uri: str = "mongodb://localhost:27017"
     database: str = "cs50-moodle-bridge"
+    # connection pool per MongoClient, see create_mongo_client
+    max_pool_size: int = Field(default=100, ge=1)
+    min_pool_size: int = Field(default=0, ge=0)
+    max_idle_time_ms: int | None = Field(default=None, ge=0)
+    wait_queue_timeout_ms: int | None = Field(default=None, ge=0)
+    server_selection_timeout_ms: int = Field(default=30_000, ge=0)
+    # comma separated, e.g. "zstd,snappy"
+    compressors: str = ""
+    read_preference: Literal[
+        "primary", "primaryPreferred", "secondary", "secondaryPreferred", "nearest"
+    ] = "primary"
+    # list and export reads, writes always go to the primary
+    heavy_read_preference: Literal[
+        "primary", "primaryPreferred", "secondary", "secondaryPreferred", "nearest"
+    ] = "secondaryPreferred"
+    max_staleness_seconds: int | None = Field(default=None, ge=90)
+    # apply the declared indexes when the API starts
+    migrate_on_startup: bool = True
+    # schema backfills run in the background in batches of this size
+    migration_batch_size: int = 500
+    migration_throttle_seconds: float = 0.1
+    # CSV enrollment imports commit in batches of this many rows
+    import_batch_size: int = Field(default=500, ge=1)
+    # cascade deletes run in a transaction, which needs a replica set
+    use_transactions: bool = False
+    # remove enrollments of deleted students and courses in the background
+    sweep_orphans_on_startup: bool = False
 
     model_config = SettingsConfigDict(
         env_prefix="MONGO_",
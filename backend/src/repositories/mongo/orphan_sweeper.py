@@ -0,0 +1,110 @@
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from pymongo.collection import Collection
+from pymongo.database import Database
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class OrphanSweepReport:
+    scanned: int
+    orphaned: int
+    removed: int
+    batches: int
+    interrupted: bool = False
+
+
+class OrphanSweeper:
+    """
+    Removes enrollments whose student or course no longer exists.
+
+    Enrollments are scanned in batches ordered by ``_id``. Per batch the referenced
+    ids are checked with one ``$in`` query against ``students`` and ``courses``
+    (covered by their ``id_unique_idx``) and the orphans are removed with one
+    ``delete_many``. Nothing is held across batches and the sweeper sleeps
+    ``throttle_seconds`` in between, so it can run next to API traffic.
+    """
+
+    def __init__(
+        self,
+        database: Database,
+        batch_size: int = 500,
+        throttle_seconds: float = 0.1,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self._enrollments = database["enrollments"]
+        self._students = database["students"]
+        self._courses = database["courses"]
+        self._batch_size = batch_size
+        self._throttle_seconds = throttle_seconds
+        self._sleep = sleep
+        self._stopped = threading.Event()
+
+    def stop(self) -> None:
+        """Stops after the current batch."""
+        self._stopped.set()
+
+    def run(self, dry_run: bool = False) -> OrphanSweepReport:
+        """Sweeps all enrollments once; with ``dry_run`` orphans are only counted."""
+        scanned = orphaned = removed = batches = 0
+        checkpoint = None
+
+        while True:
+            if self._stopped.is_set():
+                return OrphanSweepReport(scanned, orphaned, removed, batches, interrupted=True)
+
+            query = {} if checkpoint is None else {"_id": {"$gt": checkpoint}}
+            batch = list(
+                self._enrollments.find(query, {"student_id": 1, "course_id": 1})
+                .sort("_id", 1)
+                .limit(self._batch_size)
+            )
+            if not batch:
+                break
+
+            orphans = self._orphans(batch)
+            if orphans and not dry_run:
+                result = self._enrollments.delete_many({"_id": {"$in": orphans}})
+                removed += result.deleted_count
+
+            checkpoint = batch[-1]["_id"]
+            scanned += len(batch)
+            orphaned += len(orphans)
+            batches += 1
+
+            if len(batch) < self._batch_size:
+                break
+            self._sleep(self._throttle_seconds)
+
+        return OrphanSweepReport(scanned, orphaned, removed, batches)
+
+    def run_in_background(self) -> threading.Thread:
+        thread = threading.Thread(target=self._run_logged, name="orphan-sweeper", daemon=True)
+        thread.start()
+        return thread
+
+    def _run_logged(self) -> None:
+        try:
+            report = self.run()
+        except Exception:
+            logger.exception("Orphan sweep failed")
+        else:
+            logger.info("Orphan sweep %s", report)
+
+    def _existing(self, collection: Collection, ids: set[str]) -> set[str]:
+        docs = collection.find({"id": {"$in": list(ids)}}, {"_id": 0, "id": 1})
+        return {doc["id"] for doc in docs}
+
+    def _orphans(self, batch: list[dict]) -> list:
+        students = self._existing(self._students, {doc.get("student_id") for doc in batch})
+        courses = self._existing(self._courses, {doc.get("course_id") for doc in batch})
+        return [
+            doc["_id"]
+            for doc in batch
+            if doc.get("student_id") not in students or doc.get("course_id") not in courses
+        ]
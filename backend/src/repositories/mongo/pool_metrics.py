@@ -0,0 +1,93 @@
+import threading
+from dataclasses import dataclass
+
+from pymongo import monitoring
+
+
+@dataclass(frozen=True)
+class PoolMetricsSnapshot:
+    checked_out: int
+    checkouts: int
+    checkout_failures: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+    pools_cleared: int
+
+    @property
+    def wait_seconds_avg(self) -> float:
+        return self.wait_seconds_total / self.checkouts if self.checkouts else 0.0
+
+
+class PoolMetrics(monitoring.ConnectionPoolListener):
+    """
+    Counts connection checkouts of a MongoClient via pymongo's pool events.
+
+    ``checked_out`` is the number of connections in use right now, the wait times
+    are the time a checkout spent waiting for a free connection, as reported by
+    pymongo. A growing wait time means ``max_pool_size`` is too small for the load.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._checked_out = 0
+        self._checkouts = 0
+        self._checkout_failures = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._pools_cleared = 0
+
+    def snapshot(self) -> PoolMetricsSnapshot:
+        with self._lock:
+            return PoolMetricsSnapshot(
+                checked_out=self._checked_out,
+                checkouts=self._checkouts,
+                checkout_failures=self._checkout_failures,
+                wait_seconds_total=self._wait_total,
+                wait_seconds_max=self._wait_max,
+                pools_cleared=self._pools_cleared,
+            )
+
+    def connection_checked_out(self, event: monitoring.ConnectionCheckedOutEvent) -> None:
+        with self._lock:
+            self._checked_out += 1
+            self._checkouts += 1
+            self._wait_total += event.duration
+            self._wait_max = max(self._wait_max, event.duration)
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent) -> None:
+        with self._lock:
+            self._checked_out = max(self._checked_out - 1, 0)
+
+    def connection_check_out_failed(self, event: monitoring.ConnectionCheckOutFailedEvent) -> None:
+        with self._lock:
+            self._checkout_failures += 1
+            self._wait_total += event.duration
+            self._wait_max = max(self._wait_max, event.duration)
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent) -> None:
+        with self._lock:
+            self._pools_cleared += 1
+
+    # events without metrics
+    def pool_created(self, event: monitoring.PoolCreatedEvent) -> None:
+        return
+
+    def pool_ready(self, event: monitoring.PoolReadyEvent) -> None:
+        return
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent) -> None:
+        return
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent) -> None:
+        return
+
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent) -> None:
+        return
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent) -> None:
+        return
+
+    def connection_check_out_started(
+        self, event: monitoring.ConnectionCheckOutStartedEvent
+    ) -> None:
+        return
@@ -0,0 +1,153 @@
+from typing import Any, ClassVar
+
+from pymongo import DeleteMany, ReplaceOne, UpdateOne
+from pymongo.database import Database
+
+from models.best_submission import best_per_student
+from models.cs50_submission_problem import CS50SubmissionProblemModel
+from models.student import normalize_email
+from models.submission import SubmissionModel
+from repositories.mongo.best_submission_repository import best_submission_writes
+from repositories.mongo.migration_runner import BackfillMigration, WriteOp
+from repositories.mongo.submission_codec import (
+    COMPACT_LAYOUT,
+    decode_submissions,
+    encode_problem,
+)
+
+
+class CompactSubmissionLayoutMigration(BackfillMigration):
+    """Rewrites legacy CS50 submission documents into the compact columnar layout."""
+
+    version = 1
+    name = "compact_cs50_submission_layout"
+    collection = "cs50_submissions"
+    query: ClassVar[dict[str, Any]] = {"layout": {"$ne": COMPACT_LAYOUT}}
+
+    def transform(self, document: dict[str, Any]) -> list[WriteOp]:
+        problem = CS50SubmissionProblemModel(
+            id=document["id"],
+            slug=document["slug"],
+            submissions=decode_submissions(document),
+        )
+        # skip the document if the app rewrote it since the batch was read
+        return [
+            ReplaceOne(
+                {"_id": document["_id"], "layout": {"$ne": COMPACT_LAYOUT}},
+                encode_problem(problem),
+            )
+        ]
+
+
+class BestSubmissionsBackfill(BackfillMigration):
+    """Builds the ``best_submissions`` view from the submissions imported before it existed."""
+
+    version = 2
+    name = "backfill_best_submissions"
+    collection = "cs50_submissions"
+    target = "best_submissions"
+
+    def transform(self, document: dict[str, Any]) -> list[WriteOp]:
+        submissions = [SubmissionModel(**s) for s in decode_submissions(document)]
+        # conditional, so a live import that recorded a newer result is kept
+        return [
+            op
+            for best in best_per_student(document["slug"], submissions)
+            for op in best_submission_writes(best)
+        ]
+
+
+STUDENT_MERGE_FIELDS = ("name", "github_id", "github_username")
+
+
+def merge_students(
+    database: Database, keep: dict[str, Any], others: list[dict[str, Any]]
+) -> list[WriteOp]:
+    """
+    Merges ``others`` into ``keep`` and returns the student writes that finish the merge.
+
+    ``keep`` gets the GitHub and name fields it is missing. Enrollments move to it
+    right away, grade fingerprints of the merged students are dropped so they are
+    regraded. The merged students are only deleted by the returned writes, so a
+    rerun after a failed batch finds them again.
+    """
+    missing = {}
+    for field in STUDENT_MERGE_FIELDS:
+        if keep.get(field) in (None, ""):
+            value = next((d[field] for d in others if d.get(field) not in (None, "")), None)
+            if value is not None:
+                missing[field] = value
+
+    merged = [d["id"] for d in others]
+    enrollments = database["enrollments"]
+    enrollment_ops = [
+        UpdateOne(
+            {"student_id": keep["id"], "course_id": doc["course_id"]},
+            {"$setOnInsert": {"student_id": keep["id"], "course_id": doc["course_id"]}},
+            upsert=True,
+        )
+        for doc in enrollments.find({"student_id": {"$in": merged}}, {"_id": 0, "course_id": 1})
+    ]
+    if enrollment_ops:
+        enrollments.bulk_write(enrollment_ops, ordered=False)
+    enrollments.delete_many({"student_id": {"$in": merged}})
+    database["grade_fingerprints"].delete_many({"student_id": {"$in": merged}})
+
+    ops: list[WriteOp] = [DeleteMany({"_id": {"$in": [d["_id"] for d in others]}})]
+    if missing:
+        ops.append(UpdateOne({"_id": keep["_id"]}, {"$set": missing}))
+    return ops
+
+
+class StudentEmailKeyBackfill(BackfillMigration):
+    """
+    Stores the normalized ``email_key`` on students, merging students whose emails
+    only differ in casing or surrounding whitespace.
+
+    Only students without a key are read. A student that already holds the key,
+    e.g. one created by the app while the backfill runs, absorbs the others;
+    otherwise the one with a GitHub id, else the oldest one, is kept.
+    """
+
+    version = 3
+    name = "student_email_key"
+    collection = "students"
+    query: ClassVar[dict[str, Any]] = {"email_key": {"$exists": False}}
+    # the app can still store the same key between our lookup and the write
+    skip_duplicate_keys = True
+
+    def transform(self, document: dict[str, Any]) -> list[WriteOp]:
+        return [
+            UpdateOne(
+                {"_id": document["_id"], "email_key": {"$exists": False}},
+                {"$set": {"email_key": normalize_email(document["email"])}},
+            )
+        ]
+
+    def transform_batch(self, database: Database, batch: list[dict[str, Any]]) -> list[WriteOp]:
+        groups: dict[str, list[dict[str, Any]]] = {}
+        for doc in batch:
+            groups.setdefault(normalize_email(doc["email"]), []).append(doc)
+
+        holders = {
+            doc["email_key"]: doc
+            for doc in database["students"].find({"email_key": {"$in": list(groups)}})
+        }
+
+        ops: list[WriteOp] = []
+        for key, group in groups.items():
+            keep = holders.get(key)
+            if keep is None:
+                keep = next((d for d in group if d.get("github_id") is not None), group[0])
+                ops.extend(self.transform(keep))
+            others = [d for d in group if d is not keep]
+            if others:
+                ops.extend(merge_students(database, keep, others))
+        return ops
+
+
+SCHEMA_MIGRATIONS: list[BackfillMigration] = [
+    CompactSubmissionLayoutMigration(),
+    BestSubmissionsBackfill(),
+    StudentEmailKeyBackfill(),
+]
@@ -1,14 +1,46 @@
+from typing import Any
+
+from pymongo import ReturnDocument
 from pymongo.collection import Collection
 from pymongo.errors import DuplicateKeyError
 
 from exceptions.duplicate_email import StudentEmailAlreadyExists
 from interfaces.repositories.student_repository_interface import IStudentRepository
-from models.student import StudentModel
+from models.student import StudentModel, normalize_email
+from repositories.mongo.cascade import delete_cascading
+from repositories.partial_update import validate_patch_fields
+
+
+def email_filter(students: list[StudentModel]) -> dict[str, Any]:
+    """
+    Matches the stored students with the email keys of ``students``.
+
+    Students stored before the email_key backfill (schema migration 3) has run
+    have no key yet and are matched on their email as typed, like ``email_1`` does.
+    """
+    return {
+        "$or": [
+            {"email_key": {"$in": list({s.email_key for s in students})}},
+            {"email_key": {"$exists": False}, "email": {"$in": list({s.email for s in students})}},
+        ]
+    }
 
 
 class MongoStudentRepository(IStudentRepository):
-    def __init__(self, collection: Collection):
+    def __init__(
+        self,
+        collection: Collection,
+        enrollment_collection: Collection | None = None,
+        transactions: bool = False,
+        read_collection: Collection | None = None,
+        grade_fingerprint_collection: Collection | None = None,
+    ):
         self._collection = collection
+        # list reads may go to secondaries, lookups used by writes stay on the primary
+        self._read_collection = read_collection if read_collection is not None else collection
+        self._enrollments = enrollment_collection
+        self._fingerprints = grade_fingerprint_collection
+        self._transactions = transactions
 
     def create(self, data: StudentModel) -> StudentModel:
         try:
@@ -23,7 +55,7 @@ class MongoStudentRepository(IStudentRepository):
         return StudentModel(**doc) if doc else None
 
     def get_all(self) -> list[StudentModel]:
-        return [StudentModel(**doc) for doc in self._collection.find()]
+        return [StudentModel(**doc) for doc in self._read_collection.find()]
 
     def update(self, item_id: str, data: StudentModel) -> StudentModel | None:
         document = data.model_dump()
@@ -36,11 +68,47 @@ class MongoStudentRepository(IStudentRepository):
 
         return StudentModel(**result) if result else None
 
+    def patch(self, item_id: str, fields: dict[str, Any]) -> StudentModel | None:
+        validate_patch_fields(StudentModel, fields)
+
+        if not fields:
+            return self.get(item_id)
+
+        changes = dict(fields)
+        if "email" in changes:
+            changes["email_key"] = normalize_email(changes["email"])
+
+        try:
+            result = self._collection.find_one_and_update(
+                {"id": item_id},
+                {"$set": changes},
+                projection={"_id": 0},
+                return_document=ReturnDocument.AFTER,
+            )
+        except DuplicateKeyError:
+            raise StudentEmailAlreadyExists(fields.get("email")) from None
+
+        return StudentModel(**result) if result else None
+
     def delete(self, item_id: str) -> bool:
-        result = self._collection.delete_one({"id": item_id})
-        return result.deleted_count == 1
+        dependents = []
+        if self._enrollments is not None:
+            dependents.append((self._enrollments, {"student_id": item_id}))
+        if self._fingerprints is not None:
+            dependents.append((self._fingerprints, {"student_id": item_id}))
+
+        return delete_cascading(
+            self._collection, {"id": item_id}, dependents, transactions=self._transactions
+        )
 
     def get_by_email(self, email: str) -> StudentModel | None:
-        result = self._collection.find_one({"email": email})
+        result = self._collection.find_one(email_filter([StudentModel(email=email)]))
 
         return StudentModel(**result) if result else None
+
+    def get_many(self, item_ids: list[str]) -> list[StudentModel]:
+        if not item_ids:
+            return []
+
+        docs = self._read_collection.find({"id": {"$in": list(item_ids)}}, {"_id": 0})
+        return [StudentModel(**doc) for doc in docs]
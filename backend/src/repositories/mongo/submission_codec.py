@@ -0,0 +1,148 @@
+from datetime import UTC, datetime
+from email.utils import format_datetime
+from typing import Any
+
+from models.cs50_submission_problem import CS50SubmissionProblemModel
+from models.submission import SubmissionModel
+
+ME50_URL = "https://github.com/me50"
+
+# Stored in every compact document so the read path can tell it apart from the
+# legacy layout, which embeds one full SubmissionModel dict per submission.
+COMPACT_LAYOUT = 2
+
+# columnar keys, one array entry per submission
+GITHUB_ID = "gid"
+USER = "u"
+HASH = "h"
+CHECKS_PASSED = "cp"
+CHECKS_RUN = "cr"
+TIMESTAMP = "ts"
+
+
+def github_url(username: str, commit: str) -> str:
+    return f"{ME50_URL}/{username}/tree/{commit}"
+
+
+def archive_url(username: str, commit: str) -> str:
+    return f"{ME50_URL}/{username}/archive/{commit}.zip"
+
+
+def _commit_hash(submission: SubmissionModel) -> str | None:
+    """Returns the commit hash if both URLs can be rebuilt from username + hash."""
+    prefix = f"{ME50_URL}/{submission.github_username}/tree/"
+    if not submission.github_url.startswith(prefix):
+        return None
+
+    commit = submission.github_url.removeprefix(prefix)
+    if not commit or "/" in commit:
+        return None
+
+    if submission.archive != archive_url(submission.github_username, commit):
+        return None
+
+    return commit
+
+
+def encode_problem(problem: CS50SubmissionProblemModel) -> dict[str, Any]:
+    """
+    Encodes a submission problem into the compact columnar layout.
+
+    Usernames are stored once per problem and referenced by index, the slug is
+    only stored on the parent document and ``github_url``/``archive`` are
+    reduced to the commit hash. Values that cannot be derived are kept verbatim
+    in the sparse ``x`` (extra) map, names in the sparse ``n`` map.
+    """
+    users: list[str] = []
+    user_index: dict[str, int] = {}
+    columns: dict[str, list] = {
+        GITHUB_ID: [],
+        USER: [],
+        HASH: [],
+        CHECKS_PASSED: [],
+        CHECKS_RUN: [],
+        TIMESTAMP: [],
+    }
+    names: dict[str, str] = {}
+    extra: dict[str, dict[str, str]] = {}
+
+    for i, submission in enumerate(problem.submissions):
+        if submission.github_username not in user_index:
+            user_index[submission.github_username] = len(users)
+            users.append(submission.github_username)
+
+        commit = _commit_hash(submission)
+
+        columns[GITHUB_ID].append(submission.github_id)
+        columns[USER].append(user_index[submission.github_username])
+        columns[HASH].append(commit)
+        columns[CHECKS_PASSED].append(submission.checks_passed)
+        columns[CHECKS_RUN].append(submission.checks_run)
+        columns[TIMESTAMP].append(submission.timestamp)
+
+        if submission.name is not None:
+            names[str(i)] = submission.name
+
+        overrides: dict[str, str] = {}
+        if commit is None:
+            overrides["archive"] = submission.archive
+            overrides["github_url"] = submission.github_url
+        if submission.slug != problem.slug:
+            overrides["slug"] = submission.slug
+        if overrides:
+            extra[str(i)] = overrides
+
+    return {
+        "id": problem.id,
+        "slug": problem.slug,
+        "layout": COMPACT_LAYOUT,
+        "users": users,
+        "s": columns,
+        "n": names,
+        "x": extra,
+    }
+
+
+def _timestamp(value: Any) -> Any:
+    # BSON dates come back naive in UTC
+    if isinstance(value, datetime) and value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value
+
+
+def decode_submissions(document: dict[str, Any]) -> list[dict[str, Any]]:
+    """Rebuilds SubmissionModel dicts from either the compact or the legacy layout."""
+    if document.get("layout") != COMPACT_LAYOUT:
+        submissions = document.get("submissions", [])
+        for s in submissions:
+            ts = s.get("timestamp")
+            if isinstance(ts, datetime):
+                s["timestamp"] = format_datetime(ts)
+        return submissions
+
+    slug = document["slug"]
+    users = document.get("users", [])
+    columns = document.get("s", {})
+    names = document.get("n", {})
+    extra = document.get("x", {})
+
+    submissions = []
+    for i, github_id in enumerate(columns.get(GITHUB_ID, [])):
+        username = users[columns[USER][i]]
+        commit = columns[HASH][i]
+
+        submission = {
+            "archive": archive_url(username, commit) if commit is not None else None,
+            "checks_passed": columns[CHECKS_PASSED][i],
+            "checks_run": columns[CHECKS_RUN][i],
+            "github_id": github_id,
+            "github_url": github_url(username, commit) if commit is not None else None,
+            "github_username": username,
+            "name": names.get(str(i)),
+            "slug": slug,
+            "timestamp": _timestamp(columns[TIMESTAMP][i]),
+        }
+        submission.update(extra.get(str(i), {}))
+        submissions.append(submission)
+
+    return submissions
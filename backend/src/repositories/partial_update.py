@@ -0,0 +1,27 @@
+from typing import Any
+
+from pydantic import BaseModel
+
+IMMUTABLE_FIELDS = frozenset({"id"})
+
+
+def validate_patch_fields(model: type[BaseModel], fields: dict[str, Any]) -> None:
+    """Raises ValueError if ``fields`` contains keys that cannot be patched on ``model``."""
+    invalid = sorted(set(fields) - set(model.model_fields) | set(fields) & IMMUTABLE_FIELDS)
+    if invalid:
+        msg = f"Cannot patch {model.__name__} fields: {', '.join(invalid)}"
+        raise ValueError(msg)
+
+
+def validate_exercise_id_changes(
+    fields: dict[str, Any],
+    add_exercise_ids: list[str] | None,
+    remove_exercise_ids: list[str] | None,
+) -> None:
+    if (add_exercise_ids or remove_exercise_ids) and "exercise_ids" in fields:
+        msg = "Cannot replace and add/remove exercise ids in the same update"
+        raise ValueError(msg)
+
+    if add_exercise_ids and remove_exercise_ids:
+        msg = "Cannot add and remove exercise ids in the same update"
+        raise ValueError(msg)
@@ -0,0 +1,14 @@
+from typing import Literal
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class RepositorySettings(BaseSettings):
+    # "memory" keeps all data in the process, for tests and single-node deployments
+    backend: Literal["mongo", "memory"] = "mongo"
+
+    model_config = SettingsConfigDict(
+        env_prefix="REPOSITORY_",
+        env_file=".env",
+        extra="ignore",
+    )
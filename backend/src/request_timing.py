@@ -0,0 +1,68 @@
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class TimingSegment:
+    count: int
+    seconds: float
+
+
+class RequestTiming:
+    """
+    Time spent per category while handling one request, e.g. ``mongo`` or ``github``.
+
+    Sync endpoints run in a worker thread with a copy of the request context, so
+    the thread records into the same instance as the event loop.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+        self._counts: Counter[str] = Counter()
+        self._seconds: Counter[str] = Counter()
+        self._operations: dict[str, Counter[str]] = {}
+
+    def add(self, category: str, seconds: float, operation: str | None = None) -> None:
+        with self._lock:
+            self._counts[category] += 1
+            self._seconds[category] += seconds
+            if operation is not None:
+                self._operations.setdefault(category, Counter())[operation] += 1
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def segments(self) -> dict[str, TimingSegment]:
+        with self._lock:
+            return {
+                name: TimingSegment(count, self._seconds[name])
+                for name, count in self._counts.items()
+            }
+
+    def operations(self, category: str) -> dict[str, int]:
+        """Calls per operation, e.g. Mongo commands by name; repeated ones hint at N+1 queries."""
+        with self._lock:
+            return dict(self._operations.get(category, {}))
+
+
+_current: ContextVar[RequestTiming | None] = ContextVar("request_timing", default=None)
+
+
+def start_request_timing() -> tuple[RequestTiming, Token]:
+    timing = RequestTiming()
+    return timing, _current.set(timing)
+
+
+def stop_request_timing(token: Token) -> None:
+    _current.reset(token)
+
+
+def record(category: str, seconds: float, operation: str | None = None) -> None:
+    """Adds to the timing of the current request; a no-op outside of requests."""
+    timing = _current.get()
+    if timing is not None:
+        timing.add(category, seconds, operation)
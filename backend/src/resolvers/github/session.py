@@ -0,0 +1,15 @@
+import requests
+
+from request_timing import record
+
+
+def record_github_call(response: requests.Response, *args, **kwargs) -> None:
+    # elapsed ends when the response headers are parsed, the body may still be streaming
+    record("github", response.elapsed.total_seconds(), response.request.method)
+
+
+def create_github_session() -> requests.Session:
+    """Session for GitHub API calls that adds every call to the current request's timing."""
+    session = requests.Session()
+    session.hooks["response"].append(record_github_call)
+    return session
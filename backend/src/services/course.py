@@ -1,11 +1,35 @@
+from typing import Any
+
+from interfaces.repositories.course_overview_repository_interface import (
+    ICourseOverviewRepository,
+)
 from interfaces.repositories.course_repository_interface import ICourseRepository
-from interfaces.services.course_service import ICourseService
+from interfaces.repositories.enrollment_repository_interface import IEnrollmentRepository
+from interfaces.repositories.student_repository_interface import IStudentRepository
+from interfaces.services.course_service import ICourseService, StudentPage
 from models.course import Course
+from models.course_overview import CourseOverviewModel
+from services.roster_index import RosterIndexRegistry
 
 
 class CourseService(ICourseService):
-    def __init__(self, course_repository: ICourseRepository):
+    def __init__(
+        self,
+        course_repository: ICourseRepository,
+        course_overview_repository: ICourseOverviewRepository | None = None,
+        pass_threshold: float = 1.0,
+        enrollment_repository: IEnrollmentRepository | None = None,
+        student_repository: IStudentRepository | None = None,
+        student_batch_size: int = 1000,
+        roster_indexes: RosterIndexRegistry | None = None,
+    ):
         self.course_repository = course_repository
+        self.course_overview_repository = course_overview_repository
+        self.pass_threshold = pass_threshold
+        self.enrollment_repository = enrollment_repository
+        self.student_repository = student_repository
+        self.student_batch_size = student_batch_size
+        self.roster_indexes = roster_indexes
 
     def get_course(self, course_id: str) -> Course | None:
         record = self.course_repository.get(course_id)
@@ -28,5 +52,48 @@ class CourseService(ICourseService):
 
         return updated
 
+    def patch_course(
+        self,
+        course_id: str,
+        fields: dict[str, Any],
+        add_exercise_ids: list[str] | None = None,
+        remove_exercise_ids: list[str] | None = None,
+    ) -> Course | None:
+        return self.course_repository.patch(
+            course_id, fields, add_exercise_ids, remove_exercise_ids
+        )
+
     def delete_course(self, course_id: str) -> bool:
-        return self.course_repository.delete(course_id)
+        deleted = self.course_repository.delete(course_id)
+        # the delete removed the enrollments too, also after a partial earlier delete
+        if self.roster_indexes is not None:
+            self.roster_indexes.invalidate(course_id)
+        return deleted
+
+    def get_course_overview(self, course_id: str) -> CourseOverviewModel | None:
+        return self.course_overview_repository.get_overview(course_id, self.pass_threshold)
+
+    def get_students_in_course(
+        self, course_id: str, offset: int = 0, limit: int | None = None
+    ) -> StudentPage | None:
+        """
+        Returns one page of the students enrolled in a course, ordered by student id.
+
+        The students are fetched with one ``$in`` query per ``student_batch_size``
+        ids instead of one read per student.
+        """
+        if self.course_repository.get(course_id) is None:
+            return None
+
+        student_ids = sorted(self.enrollment_repository.get_students_for_course(course_id))
+        end = None if limit is None else offset + limit
+        page_ids = student_ids[offset:end]
+
+        found = {}
+        for start in range(0, len(page_ids), self.student_batch_size):
+            batch = page_ids[start : start + self.student_batch_size]
+            found.update((s.id, s) for s in self.student_repository.get_many(batch))
+
+        # enrollments of deleted students are skipped
+        students = [found[student_id] for student_id in page_ids if student_id in found]
+        return StudentPage(total=len(student_ids), students=students)
@@ -2,6 +2,9 @@ import json
 from typing import BinaryIO
 
 from exceptions.exceptions import InvalidJsonFormat
+from interfaces.repositories.best_submission_repository_interface import (
+    IBestSubmissionRepository,
+)
 from interfaces.repositories.cs50_submission_problem_repository_interface import (
     ICS50SubmissionProblemRepository,
 )
@@ -9,12 +12,18 @@ from interfaces.services.cs50_submission_problem_service import (
     ICS50SubmissionProblemService,
     SubmissionUploadResult,
 )
+from models.cs50_submission_problem import CS50SubmissionProblemModel
 from models.submission import SubmissionModel
 
 
 class CS50SubmissionProblemService(ICS50SubmissionProblemService):
-    def __init__(self, repo: ICS50SubmissionProblemRepository):
-        self._repo = repo
+    def __init__(
+        self,
+        cs50_submission_problem_repository: ICS50SubmissionProblemRepository,
+        best_submission_repository: IBestSubmissionRepository | None = None,
+    ):
+        self._repo = cs50_submission_problem_repository
+        self._best_repo = best_submission_repository
 
     def import_submissions_from_json(self, slug: str, file: BinaryIO) -> SubmissionUploadResult:
         raw = file.read()
@@ -42,6 +51,17 @@ class CS50SubmissionProblemService(ICS50SubmissionProblemService):
             SubmissionModel.model_validate(item) for item in submission_items
         ]
 
-        self._repo.upload_submissions(slug, submissions)
+        self._repo.upload_submissions(
+            CS50SubmissionProblemModel(slug=slug, submissions=submissions)
+        )
+
+        best_updated = 0
+        if self._best_repo is not None:
+            best_updated = self._best_repo.record(slug, submissions)
+
+        return SubmissionUploadResult(
+            submissions_added=len(submissions), best_submissions_updated=best_updated
+        )
 
-        return SubmissionUploadResult(submissions_added=len(submissions))
+    def get_submissions(self, slug: str) -> CS50SubmissionProblemModel | None:
+        return self._repo.get_submissions(slug)
@@ -1,14 +1,21 @@
+import hashlib
+import io
+from collections.abc import Iterator
 from typing import BinaryIO
 
 import pandas as pd
 
 from exceptions.exceptions import CourseDoesNotExistException, InvalidCsvFormat
 from interfaces.repositories.course_repository_interface import ICourseRepository
+from interfaces.repositories.enrollment_import_repository_interface import (
+    IEnrollmentImportRepository,
+)
 from interfaces.repositories.enrollment_repository_interface import IEnrollmentRepository
 from interfaces.repositories.student_repository_interface import IStudentRepository
 from interfaces.services.enrollment_service import EnrollmentImportResult, IEnrollmentService
 from models.enrollment import EnrollmentModel
 from models.student import StudentModel
+from services.roster_index import RosterIndexRegistry
 
 
 class EnrollmentService(IEnrollmentService):
@@ -17,52 +24,105 @@ class EnrollmentService(IEnrollmentService):
         student_repository: IStudentRepository,
         course_repository: ICourseRepository,
         enrollment_repository: IEnrollmentRepository,
+        import_repository: IEnrollmentImportRepository,
+        roster_indexes: RosterIndexRegistry | None = None,
+        import_batch_size: int = 500,
     ):
         self._student_repo = student_repository
         self._course_repo = course_repository
         self._enroll_repo = enrollment_repository
+        self._rosters = roster_indexes
+        self._import_repo = import_repository
+        self._import_batch_size = import_batch_size
 
     def import_students_from_csv(self, course_id: str, file: BinaryIO):
         course = self._course_repo.get(course_id)
         if not course:
             raise CourseDoesNotExistException
 
-        df = pd.read_csv(file)
+        content = file.read()
+        df = pd.read_csv(io.BytesIO(content))
 
         required_columns = {"Vorname", "Nachname", "E-Mail-Adresse"}
         if not required_columns.issubset(df.columns):
             raise InvalidCsvFormat
 
+        import_id = hashlib.blake2b(
+            course_id.encode() + b"\0" + content, digest_size=16
+        ).hexdigest()
+        return self._import_in_batches(course_id, import_id, _students(df))
+
+    def remove_enrollment(self, course_id: str, student_id: str) -> bool:
+        removed = self._enroll_repo.remove_enrollment(
+            EnrollmentModel(student_id=student_id, course_id=course_id)
+        )
+        if removed and self._rosters is not None:
+            self._rosters.unenrolled(course_id, student_id)
+        return removed
+
+    def _import_in_batches(
+        self, course_id: str, import_id: str, rows: Iterator[StudentModel | None]
+    ) -> EnrollmentImportResult:
+        """
+        Commits every ``import_batch_size`` rows as one unit of work.
+
+        The import id is derived from the course and the file content, so uploading
+        the same file again after a crash continues after the last committed batch.
+        """
+        rows_resumed = self._import_repo.get_checkpoint(import_id)
         students_created = 0
         enrollments_created = 0
         rows_skipped = 0
+        rows_done = 0
+        pending = 0
+        batch: list[StudentModel] = []
 
-        for _, row in df.iterrows():
-            email = str(row["E-Mail-Adresse"]).strip()
-            first_name = str(row["Vorname"]).strip()
-            last_name = str(row["Nachname"]).strip()
+        def commit() -> None:
+            nonlocal students_created, enrollments_created, pending
+            result = self._import_repo.import_batch(import_id, course_id, batch, rows_done)
+            students_created += result.students_created
+            enrollments_created += result.enrollments_created
+            if self._rosters is not None:
+                for student in result.students:
+                    self._rosters.enrolled(course_id, student)
+            batch.clear()
+            pending = 0
 
-            if not email or email == "nan":
-                rows_skipped += 1
+        for student in rows:
+            rows_done += 1
+            if rows_done <= rows_resumed:
                 continue
 
-            student = self._student_repo.get_by_email(email)
+            pending += 1
+            if student is None:
+                rows_skipped += 1
+            else:
+                batch.append(student)
 
-            if not student:
-                student = StudentModel(
-                    email=email,
-                    name=f"{first_name} {last_name}",
-                )
-                self._student_repo.create(student)
-                students_created += 1
+            if pending == self._import_batch_size:
+                commit()
 
-            self._enroll_repo.add_enrollment(
-                EnrollmentModel(student_id=student.id, course_id=course_id)
-            )
-            enrollments_created += 1
+        if pending:
+            commit()
+        self._import_repo.finish(import_id)
 
         return EnrollmentImportResult(
             students_created=students_created,
             enrollments_created=enrollments_created,
             rows_skipped=rows_skipped,
+            rows_resumed=min(rows_resumed, rows_done),
         )
+
+
+def _students(df: pd.DataFrame) -> Iterator[StudentModel | None]:
+    """Yields one new student per CSV row, None for rows without an email."""
+    for _, row in df.iterrows():
+        email = str(row["E-Mail-Adresse"]).strip()
+        first_name = str(row["Vorname"]).strip()
+        last_name = str(row["Nachname"]).strip()
+
+        if not email or email == "nan":
+            yield None
+            continue
+
+        yield StudentModel(email=email, name=f"{first_name} {last_name}")
@@ -6,14 +6,19 @@ from exceptions.exceptions import InvalidCsvFormat
 from interfaces.repositories.student_repository_interface import IStudentRepository
 from interfaces.resolver.github_client_resolver import IGitHubClientResolver
 from interfaces.services.github_service_interface import IGitHubService
+from services.roster_index import RosterIndexRegistry
 
 
 class GitHubService(IGitHubService):
     def __init__(
-        self, student_repository: IStudentRepository, github_client_resolver: IGitHubClientResolver
+        self,
+        student_repository: IStudentRepository,
+        github_client_resolver: IGitHubClientResolver,
+        roster_indexes: RosterIndexRegistry | None = None,
     ):
         self._student_repo = student_repository
         self._gh_client_resolver = github_client_resolver
+        self._rosters = roster_indexes
 
     def import_github_names(self, file: BinaryIO):
         df = pd.read_csv(file)
@@ -40,7 +45,10 @@ class GitHubService(IGitHubService):
 
             github_id = self._gh_client_resolver.get_user_id(text_submission)
 
-            student.github_id = github_id
-            student.github_username = text_submission
+            updated = self._student_repo.patch(
+                student.id,
+                {"github_id": github_id, "github_username": text_submission},
+            )
 
-            self._student_repo.update(student.id, student)
+            if updated is not None and self._rosters is not None:
+                self._rosters.student_changed(updated)
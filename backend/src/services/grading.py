@@ -0,0 +1,319 @@
+import hashlib
+import json
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+import numpy as np
+
+from exceptions.exceptions import CourseDoesNotExistException, MissingMoodleParticipant
+from interfaces.repositories.best_submission_repository_interface import (
+    IBestSubmissionRepository,
+)
+from interfaces.repositories.course_repository_interface import ICourseRepository
+from interfaces.repositories.cs50_submission_problem_repository_interface import (
+    ICS50SubmissionProblemRepository,
+)
+from interfaces.repositories.enrollment_repository_interface import IEnrollmentRepository
+from interfaces.repositories.grade_fingerprint_repository_interface import (
+    IGradeFingerprintRepository,
+)
+from interfaces.repositories.student_repository_interface import IStudentRepository
+from interfaces.services.grading_service import IGradingService, RegradeResult
+from interfaces.services.grading_strategy import IGradingStrategy, SubmissionBatch
+from models.best_submission import BestSubmissionModel
+from models.grade_fingerprint import GradeFingerprintModel
+from models.moodle_worksheet import GradeType, MoodleWorksheetRowModel, PassFailGrade
+from models.student import StudentModel
+from models.submission import SubmissionModel
+from services.grading_strategies.cs50_assignment import CS50Assignment
+from services.roster_index import RosterIndexRegistry
+
+GRADE_SCALE = "nicht bestanden    bestanden"
+STATUS_SUBMITTED = "Zur Bewertung abgegeben - Bewertet"
+STATUS_NOT_SUBMITTED = "Keine Abgabe - Bewertet"
+
+
+def build_batch(
+    submissions: Iterable[SubmissionModel | BestSubmissionModel],
+    roster: dict[int, int],
+    deadlines: np.ndarray,
+    has_github: np.ndarray,
+) -> SubmissionBatch:
+    """Collects the submissions of the students in ``roster`` (github_id -> index)."""
+    index, passed, run, timestamps = [], [], [], []
+    for submission in submissions:
+        student = roster.get(submission.github_id)
+        if student is None:
+            continue
+
+        index.append(student)
+        passed.append(np.nan if submission.checks_passed is None else submission.checks_passed)
+        run.append(np.nan if submission.checks_run is None else submission.checks_run)
+        timestamps.append(submission.timestamp.timestamp())
+
+    return SubmissionBatch(
+        student_index=np.array(index, dtype=np.int64),
+        checks_passed=np.array(passed, dtype=np.float64),
+        checks_run=np.array(run, dtype=np.float64),
+        timestamps=np.array(timestamps, dtype=np.float64),
+        deadlines=deadlines,
+        has_github=has_github,
+    )
+
+
+def input_fingerprint(
+    github_id: int | None,
+    submissions: Iterable[SubmissionModel | BestSubmissionModel],
+    config: dict[str, Any],
+) -> str:
+    """Hashes everything a student's grade for one problem depends on."""
+    keys = sorted((s.timestamp.timestamp(), s.checks_passed, s.checks_run) for s in submissions)
+    payload = json.dumps([github_id, keys, config], sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+@dataclass(frozen=True)
+class _GradingInputs:
+    deadline: datetime | None
+    students: list[StudentModel]
+    roster: dict[int, int]
+    slugs: list[str]
+    submissions: dict[str, list[SubmissionModel] | list[BestSubmissionModel]]
+    deadlines: np.ndarray
+    has_github: np.ndarray
+    last_submission: np.ndarray
+
+
+class GradingService(IGradingService):
+    """
+    Grades every student of a course against the CS50 problems in ``exercise_ids``.
+
+    The roster, the students and all submissions are loaded with one query each
+    and joined in memory on ``github_id``, so the number of queries does not grow
+    with the number of students or problems. Every problem is scored for the whole
+    roster at once by the grading strategy; a student passes once the strategy
+    passes every problem.
+
+    Without a deadline only the best submission per student counts, so the
+    ``best_submissions`` view is read instead of the full submission history.
+
+    ``regrade_course`` stores a fingerprint of the inputs of every
+    (student, problem) pair and only scores the pairs whose inputs changed.
+    Without a ``grade_fingerprint_repository`` it regrades every pair.
+    """
+
+    def __init__(
+        self,
+        course_repository: ICourseRepository,
+        student_repository: IStudentRepository,
+        enrollment_repository: IEnrollmentRepository,
+        cs50_submission_problem_repository: ICS50SubmissionProblemRepository,
+        strategy: IGradingStrategy | None = None,
+        best_submission_repository: IBestSubmissionRepository | None = None,
+        grade_fingerprint_repository: IGradeFingerprintRepository | None = None,
+        roster_indexes: RosterIndexRegistry | None = None,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ):
+        self._course_repo = course_repository
+        self._student_repo = student_repository
+        self._enroll_repo = enrollment_repository
+        self._submission_repo = cs50_submission_problem_repository
+        self._strategy = strategy or CS50Assignment()
+        self._best_repo = best_submission_repository
+        self._fingerprint_repo = grade_fingerprint_repository
+        self._rosters = roster_indexes
+        self._clock = clock
+
+    def grade_course(self, course_id: str) -> list[MoodleWorksheetRowModel]:
+        return list(self.iter_course_grades(course_id))
+
+    def iter_course_grades(
+        self, course_id: str, participant_ids: Mapping[str, str] | None = None
+    ) -> Iterator[MoodleWorksheetRowModel]:
+        inputs = self._load(course_id)
+        if participant_ids is not None:
+            missing = [s.email for s in inputs.students if s.email_key not in participant_ids]
+            if missing:
+                raise MissingMoodleParticipant(missing)
+
+        passed = np.zeros((len(inputs.slugs), len(inputs.students)), dtype=bool)
+
+        for row, slug in enumerate(inputs.slugs):
+            if slug not in inputs.submissions:
+                continue
+
+            batch = build_batch(
+                inputs.submissions[slug], inputs.roster, inputs.deadlines, inputs.has_github
+            )
+            passed[row] = self._strategy.passed(self._strategy.grade(batch))
+
+        return self._rows(inputs, passed, participant_ids)
+
+    def regrade_course(self, course_id: str) -> RegradeResult:
+        inputs = self._load(course_id)
+        students = inputs.students
+        config = {
+            **self._strategy.config(),
+            "deadline": inputs.deadline.isoformat() if inputs.deadline else None,
+        }
+
+        # without a fingerprint store every pair counts as changed, i.e. a full regrade
+        stored = (
+            {(f.student_id, f.slug): f for f in self._fingerprint_repo.get_for_course(course_id)}
+            if self._fingerprint_repo is not None
+            else {}
+        )
+        passed = np.zeros((len(inputs.slugs), len(students)), dtype=bool)
+        fingerprints: list[GradeFingerprintModel] = []
+        changed_students: set[int] = set()
+        skipped = 0
+
+        for row, slug in enumerate(inputs.slugs):
+            by_student: dict[int, list] = defaultdict(list)
+            for submission in inputs.submissions.get(slug, ()):
+                student = inputs.roster.get(submission.github_id)
+                if student is not None:
+                    by_student[student].append(submission)
+
+            changed: dict[int, str] = {}
+            for i, student in enumerate(students):
+                fingerprint = input_fingerprint(student.github_id, by_student.get(i, ()), config)
+                previous = stored.get((student.id, slug))
+                if previous is not None and previous.fingerprint == fingerprint:
+                    passed[row, i] = previous.passed
+                    skipped += 1
+                else:
+                    changed[i] = fingerprint
+
+            if not changed:
+                continue
+
+            batch = build_batch(
+                (s for i in changed for s in by_student.get(i, ())),
+                inputs.roster,
+                inputs.deadlines,
+                inputs.has_github,
+            )
+            result = self._strategy.passed(self._strategy.grade(batch))
+            for i, fingerprint in changed.items():
+                passed[row, i] = result[i]
+                fingerprints.append(
+                    GradeFingerprintModel(
+                        course_id=course_id,
+                        student_id=students[i].id,
+                        slug=slug,
+                        fingerprint=fingerprint,
+                        passed=bool(result[i]),
+                    )
+                )
+            changed_students.update(changed)
+
+        if self._fingerprint_repo is not None:
+            self._fingerprint_repo.save(fingerprints)
+
+        rows = [row for i, row in enumerate(self._rows(inputs, passed)) if i in changed_students]
+        return RegradeResult(recomputed=len(fingerprints), skipped=skipped, rows=rows)
+
+    def _load(self, course_id: str) -> _GradingInputs:
+        course = self._course_repo.get(course_id)
+        if not course:
+            raise CourseDoesNotExistException
+
+        if self._rosters is not None:
+            enrolled = self._rosters.get(course_id).students()
+        else:
+            student_ids = self._enroll_repo.get_students_for_course(course_id)
+            enrolled = self._student_repo.get_many(student_ids)
+
+        students = sorted(enrolled, key=lambda s: s.email)
+        roster = {s.github_id: i for i, s in enumerate(students) if s.github_id is not None}
+
+        deadline = course.deadline.timestamp() if course.deadline else np.inf
+        slugs = list(dict.fromkeys(course.exercise_ids))
+        last_submission = np.full(len(students), -np.inf)
+
+        submissions: dict[str, list[SubmissionModel] | list[BestSubmissionModel]]
+        if course.deadline is None and self._best_repo is not None:
+            submissions = self._best_submissions(slugs, roster, last_submission)
+        else:
+            submissions = {
+                p.slug: p.submissions
+                for p in self._submission_repo.get_submissions_for_slugs(slugs)
+            }
+            for problem_submissions in submissions.values():
+                for submission in problem_submissions:
+                    student = roster.get(submission.github_id)
+                    if student is not None:
+                        last_submission[student] = max(
+                            last_submission[student], submission.timestamp.timestamp()
+                        )
+
+        return _GradingInputs(
+            deadline=course.deadline,
+            students=students,
+            roster=roster,
+            slugs=slugs,
+            submissions=submissions,
+            deadlines=np.full(len(students), deadline),
+            has_github=np.array([s.github_id is not None for s in students], dtype=bool),
+            last_submission=last_submission,
+        )
+
+    def _best_submissions(
+        self, slugs: list[str], roster: dict[int, int], last_submission: np.ndarray
+    ) -> dict[str, list[BestSubmissionModel]]:
+        by_slug: dict[str, list[BestSubmissionModel]] = defaultdict(list)
+        for best in self._best_repo.get_for_slugs(slugs, list(roster)):
+            by_slug[best.slug].append(best)
+
+            student = roster.get(best.github_id)
+            if student is not None:
+                last_submission[student] = max(
+                    last_submission[student], best.last_timestamp.timestamp()
+                )
+        return by_slug
+
+    def _rows(
+        self,
+        inputs: _GradingInputs,
+        passed: np.ndarray,
+        participant_ids: Mapping[str, str] | None = None,
+    ) -> Iterator[MoodleWorksheetRowModel]:
+        graded_at = self._clock()
+        for i, student in enumerate(inputs.students):
+            missing = [slug for row, slug in enumerate(inputs.slugs) if not passed[row, i]]
+            latest = (
+                datetime.fromtimestamp(inputs.last_submission[i], UTC)
+                if np.isfinite(inputs.last_submission[i])
+                else None
+            )
+
+            yield MoodleWorksheetRowModel(
+                submission_id=participant_ids[student.email_key] if participant_ids else "",
+                full_name=student.name,
+                email=student.email,
+                status=STATUS_SUBMITTED if latest else STATUS_NOT_SUBMITTED,
+                grade_type=GradeType.pass_fail,
+                grade_pass_fail=PassFailGrade.failed if missing else PassFailGrade.passed,
+                grade_scale=GRADE_SCALE,
+                submission_last_modified=latest or graded_at,
+                online_text=student.github_username or "",
+                grade_last_modified=graded_at,
+                feedback_comment=_feedback(len(inputs.slugs), missing, student.github_id),
+                deadline=inputs.deadline,
+                last_submission=latest,
+            )
+
+
+def _feedback(total: int, missing: list[str], github_id: int | None) -> str:
+    if github_id is None:
+        return "Kein GitHub-Account hinterlegt"
+
+    comment = f"{total - len(missing)}/{total} Aufgaben bestanden"
+    if missing:
+        names = ", ".join(slug.rsplit("/", 1)[-1] for slug in missing)
+        comment += f", offen: {names}"
+    return comment
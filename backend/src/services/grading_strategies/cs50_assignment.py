@@ -0,0 +1,32 @@
+import numpy as np
+
+from interfaces.services.grading_strategy import IGradingStrategy, SubmissionBatch
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+class CS50Assignment(IGradingStrategy):
+    """
+    Scores each student with their best ``checks_passed / checks_run``.
+
+    Submissions after the student's deadline lose ``late_penalty_per_day`` of
+    their score for every started day.
+    """
+
+    name = "cs50"
+
+    def grade(self, batch: SubmissionBatch) -> np.ndarray:
+        ratio = np.divide(
+            batch.checks_passed,
+            batch.checks_run,
+            out=np.zeros_like(batch.checks_passed),
+            where=batch.checks_run > 0,
+        )
+
+        late_seconds = np.maximum(batch.timestamps - batch.deadlines[batch.student_index], 0)
+        late_days = np.ceil(late_seconds / SECONDS_PER_DAY)
+        penalty = np.clip(1 - self.late_penalty_per_day * late_days, 0, 1)
+
+        scores = np.zeros(batch.num_students)
+        np.maximum.at(scores, batch.student_index, ratio * penalty)
+        return scores
@@ -0,0 +1,12 @@
+import numpy as np
+
+from interfaces.services.grading_strategy import IGradingStrategy, SubmissionBatch
+
+
+class GithubNameAssignment(IGradingStrategy):
+    """Passes every student that has submitted a GitHub account."""
+
+    name = "github_name"
+
+    def grade(self, batch: SubmissionBatch) -> np.ndarray:
+        return batch.has_github.astype(float)
@@ -0,0 +1,13 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class GradingSettings(BaseSettings):
+    strategy: str = "cs50"
+    pass_threshold: float = 1.0
+    late_penalty_per_day: float = 0.0
+
+    model_config = SettingsConfigDict(
+        env_prefix="GRADING_",
+        env_file=".env",
+        extra="ignore",
+    )
@@ -0,0 +1,23 @@
+from interfaces.services.grading_strategy import IGradingStrategy
+from services.grading_strategies.cs50_assignment import CS50Assignment
+from services.grading_strategies.github_name_assignment import GithubNameAssignment
+
+GRADING_STRATEGIES: dict[str, type[IGradingStrategy]] = {
+    CS50Assignment.name: CS50Assignment,
+    GithubNameAssignment.name: GithubNameAssignment,
+}
+
+
+def register_strategy(strategy: type[IGradingStrategy]) -> type[IGradingStrategy]:
+    """Class decorator that makes a strategy available under its ``name``."""
+    GRADING_STRATEGIES[strategy.name] = strategy
+    return strategy
+
+
+def create_strategy(name: str, **options) -> IGradingStrategy:
+    try:
+        strategy = GRADING_STRATEGIES[name]
+    except KeyError:
+        msg = f"Unknown grading strategy {name!r}, available: {sorted(GRADING_STRATEGIES)}"
+        raise ValueError(msg) from None
+    return strategy(**options)
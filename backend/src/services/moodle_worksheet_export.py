@@ -0,0 +1,134 @@
+import csv
+import io
+import re
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from typing import BinaryIO
+from zoneinfo import ZoneInfo
+
+from exceptions.exceptions import InvalidCsvFormat
+from models.moodle_worksheet import GradeType, MoodleWorksheetRowModel, PassFailGrade
+from models.student import normalize_email
+
+BOM = "\ufeff"
+
+WORKSHEET_HEADER = (
+    "ID",
+    "Vollständiger Name",
+    "E-Mail-Adresse",
+    "Status",
+    "Bewertung",
+    "Skala",
+    "Bewertung kann geändert werden",
+    "Zuletzt geändert (Abgabe)",
+    "Texteingabe online",
+    "Zuletzt geändert (Bewertung)",
+    "Feedback als Kommentar",
+)
+
+# Moodle prints dates in the time zone of the HSD instance
+MOODLE_TIMEZONE = ZoneInfo("Europe/Berlin")
+
+WEEKDAYS = ("Montag", "Dienstag", "Mittwoch", "Donnerstag", "Freitag", "Samstag", "Sonntag")
+MONTHS = (
+    "Januar",
+    "Februar",
+    "März",
+    "April",
+    "Mai",
+    "Juni",
+    "Juli",
+    "August",
+    "September",
+    "Oktober",
+    "November",
+    "Dezember",
+)
+
+PASS_FAIL_LABELS = {PassFailGrade.failed: "nicht bestanden", PassFailGrade.passed: "bestanden"}
+
+# runs of characters replaced in the file name of the download
+UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def worksheet_filename(course_id: str) -> str:
+    """File name of the download; the course id comes from the URL and may contain quotes."""
+    return f"Bewertungen-{UNSAFE_FILENAME_CHARS.sub('_', course_id)}.csv"
+
+
+def format_moodle_date(value: datetime) -> str:
+    """Formats a date like Moodle does, e.g. ``Dienstag, 2. Dezember 2025, 10:37``."""
+    local = value.astimezone(MOODLE_TIMEZONE)
+    return (
+        f"{WEEKDAYS[local.weekday()]}, {local.day}. {MONTHS[local.month - 1]} {local.year}, "
+        f"{local:%H:%M}"
+    )
+
+
+def format_grade(row: MoodleWorksheetRowModel) -> str:
+    if row.grade_type == GradeType.pass_fail:
+        return PASS_FAIL_LABELS[row.grade_pass_fail]
+    return f"{row.grade_numeric:.2f}".replace(".", ",")
+
+
+def _field(value: str) -> str:
+    # Moodle only quotes values that contain a space or a CSV special character
+    if any(c in value for c in ' ,"\n\r'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def _line(values: Iterable[str]) -> str:
+    return ",".join(_field(value) for value in values)
+
+
+def read_participant_ids(file: BinaryIO) -> dict[str, str]:
+    """
+    Reads the worksheet downloaded from the Moodle assignment.
+
+    :return: Moodle's participant identifier by normalized email address
+    :raises InvalidCsvFormat: if the ID or email column is missing or a row has no ID
+    """
+    reader = csv.DictReader(io.TextIOWrapper(file, encoding="utf-8-sig", newline=""))
+    if not {"ID", "E-Mail-Adresse"}.issubset(reader.fieldnames or ()):
+        raise InvalidCsvFormat
+
+    participant_ids = {}
+    for record in reader:
+        participant_id = (record["ID"] or "").strip()
+        if not participant_id:
+            raise InvalidCsvFormat
+        participant_ids[normalize_email(record["E-Mail-Adresse"] or "")] = participant_id
+    return participant_ids
+
+
+def worksheet_line(row: MoodleWorksheetRowModel) -> str:
+    if not row.submission_id:
+        # Moodle would not match a row without its participant identifier
+        msg = f"No Moodle participant identifier for {row.email}"
+        raise ValueError(msg)
+    return _line((
+        row.submission_id,
+        row.full_name,
+        row.email,
+        row.status,
+        format_grade(row),
+        row.grade_scale,
+        "Ja" if row.grade_can_be_changed else "Nein",
+        format_moodle_date(row.submission_last_modified),
+        row.online_text,
+        format_moodle_date(row.grade_last_modified),
+        row.feedback_comment,
+    ))
+
+
+def iter_worksheet_csv(rows: Iterable[MoodleWorksheetRowModel]) -> Iterator[str]:
+    """
+    Serializes rows into the Moodle grading worksheet ("Bewertungstabelle") CSV.
+
+    Yields the BOM and header first and then one line per row, so the worksheet
+    can be streamed without holding it in memory.
+    """
+    yield BOM + _line(WORKSHEET_HEADER)
+    for row in rows:
+        yield "\n" + worksheet_line(row)
@@ -0,0 +1,111 @@
+import threading
+import time
+from collections.abc import Callable, Iterable
+
+from interfaces.repositories.enrollment_repository_interface import IEnrollmentRepository
+from interfaces.repositories.student_repository_interface import IStudentRepository
+from models.student import StudentModel
+
+
+class RosterIndex:
+    """The enrolled students of one course with an O(1) github_id -> student lookup."""
+
+    def __init__(self, course_id: str, students: Iterable[StudentModel] = ()):
+        self.course_id = course_id
+        self._by_id: dict[str, StudentModel] = {}
+        self._by_github_id: dict[int, str] = {}
+        for student in students:
+            self.add(student)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, student_id: str) -> bool:
+        return student_id in self._by_id
+
+    def owner(self, github_id: int) -> StudentModel | None:
+        """Returns the enrolled student that owns ``github_id``."""
+        student_id = self._by_github_id.get(github_id)
+        return self._by_id[student_id] if student_id is not None else None
+
+    def students(self) -> list[StudentModel]:
+        return list(self._by_id.values())
+
+    def add(self, student: StudentModel) -> None:
+        """Adds a student or replaces the stored version of it."""
+        self.remove(student.id)
+        self._by_id[student.id] = student
+        if student.github_id is not None:
+            self._by_github_id[student.github_id] = student.id
+
+    def remove(self, student_id: str) -> None:
+        student = self._by_id.pop(student_id, None)
+        if student is not None and self._by_github_id.get(student.github_id) == student_id:
+            del self._by_github_id[student.github_id]
+
+
+class RosterIndexRegistry:
+    """
+    Keeps one RosterIndex per course in memory.
+
+    A course is loaded with two queries on first use and is then kept up to
+    date by the enrollment and student hooks. Changes made by other processes
+    are picked up once an index is older than ``ttl_seconds``.
+    """
+
+    def __init__(
+        self,
+        enrollment_repository: IEnrollmentRepository,
+        student_repository: IStudentRepository,
+        ttl_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._enroll_repo = enrollment_repository
+        self._student_repo = student_repository
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._indexes: dict[str, tuple[float, RosterIndex]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, course_id: str) -> RosterIndex:
+        with self._lock:
+            entry = self._indexes.get(course_id)
+            if entry is not None and self._clock() - entry[0] < self._ttl_seconds:
+                return entry[1]
+
+        student_ids = self._enroll_repo.get_students_for_course(course_id)
+        index = RosterIndex(course_id, self._student_repo.get_many(student_ids))
+
+        with self._lock:
+            self._indexes[course_id] = (self._clock(), index)
+        return index
+
+    def enrolled(self, course_id: str, student: StudentModel) -> None:
+        with self._lock:
+            entry = self._indexes.get(course_id)
+            if entry is not None:
+                entry[1].add(student)
+
+    def unenrolled(self, course_id: str, student_id: str) -> None:
+        with self._lock:
+            entry = self._indexes.get(course_id)
+            if entry is not None:
+                entry[1].remove(student_id)
+
+    def student_changed(self, student: StudentModel) -> None:
+        with self._lock:
+            for _, index in self._indexes.values():
+                if student.id in index:
+                    index.add(student)
+
+    def student_removed(self, student_id: str) -> None:
+        with self._lock:
+            for _, index in self._indexes.values():
+                index.remove(student_id)
+
+    def invalidate(self, course_id: str | None = None) -> None:
+        with self._lock:
+            if course_id is None:
+                self._indexes.clear()
+            else:
+                self._indexes.pop(course_id, None)
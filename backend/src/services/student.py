@@ -1,11 +1,17 @@
 from interfaces.repositories.student_repository_interface import IStudentRepository
 from interfaces.services.student_service import IStudentService
 from models.student import StudentModel
+from services.roster_index import RosterIndexRegistry
 
 
 class StudentService(IStudentService):
-    def __init__(self, student_repository: IStudentRepository):
+    def __init__(
+        self,
+        student_repository: IStudentRepository,
+        roster_indexes: RosterIndexRegistry | None = None,
+    ):
         self.student_repository = student_repository
+        self.roster_indexes = roster_indexes
 
     def get_student(self, student_id: str) -> StudentModel | None:
         record = self.student_repository.get(student_id)
@@ -32,4 +38,7 @@ class StudentService(IStudentService):
         return updated
 
     def delete_student(self, student_id: str):
-        return self.student_repository.delete(student_id)
+        deleted = self.student_repository.delete(student_id)
+        if self.roster_indexes is not None:
+            self.roster_indexes.student_removed(student_id)
+        return deleted
@@ -1,12 +1,20 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from api.api_settings import ApiSettings
+from repositories.cache.cache_settings import CacheSettings
 from repositories.mongo.mongo_settings import MongoSettings
+from repositories.repository_settings import RepositorySettings
 from resolvers.github.github_setting import GitHubSettings
+from services.grading_strategies.grading_settings import GradingSettings
 
 
 class Settings(BaseSettings):
+    api: ApiSettings = ApiSettings()
+    repository: RepositorySettings = RepositorySettings()
     mongo: MongoSettings = MongoSettings()
     github: GitHubSettings = GitHubSettings()
+    cache: CacheSettings = CacheSettings()
+    grading: GradingSettings = GradingSettings()
 
     model_config = SettingsConfigDict()
 
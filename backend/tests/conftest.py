@@ -0,0 +1,17 @@
+import functools
+
+from mongomock.collection import BulkOperationBuilder
+
+
+def _ignore_sort(add):
+    # pymongo>=4.11 passes the UpdateOne/ReplaceOne ``sort`` option to the bulk
+    # builder, which mongomock 4.3 does not know about yet
+    @functools.wraps(add)
+    def wrapper(*args, sort=None, **kwargs):
+        return add(*args, **kwargs)
+
+    return wrapper
+
+
+BulkOperationBuilder.add_update = _ignore_sort(BulkOperationBuilder.add_update)
+BulkOperationBuilder.add_replace = _ignore_sort(BulkOperationBuilder.add_replace)
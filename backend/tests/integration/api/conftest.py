@@ -13,6 +13,7 @@ def client_course(course_repository):
     Dependencies can be overridden before yielding the client.
     """
     container.reset_override()
+    container.config.mongo.migrate_on_startup.override(False)
 
     course_service = CourseService(course_repository)
 
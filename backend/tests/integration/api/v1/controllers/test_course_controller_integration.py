@@ -133,3 +133,30 @@ def test_create_and_delete_multiple_courses(client_course):
     remaining_ids = {c["id"] for c in data}
     for cid in course_ids:
         assert cid not in remaining_ids
+
+
+def test_update_course_add_exercise_ids_keeps_other_fields(client_course):
+    payload = CourseCreate(name="New Course", cs50_id=60, exercise_ids=["ex1"])
+    response = client_course.post("/api/v1/courses", json=payload.model_dump())
+    created = CourseOut(**response.json())
+
+    response = client_course.patch(
+        f"/api/v1/courses/{created.id}", json={"add_exercise_ids": ["ex1", "ex2"]}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    updated = CourseOut(**response.json())
+    assert updated.name == payload.name
+    assert updated.cs50_id == payload.cs50_id
+    assert updated.exercise_ids == ["ex1", "ex2"]
+
+
+def test_update_course_conflicting_exercise_changes_returns_400(client_course):
+    payload = CourseCreate(name="New Course", cs50_id=60, exercise_ids=[])
+    response = client_course.post("/api/v1/courses", json=payload.model_dump())
+    created = CourseOut(**response.json())
+
+    response = client_course.patch(
+        f"/api/v1/courses/{created.id}",
+        json={"add_exercise_ids": ["ex1"], "remove_exercise_ids": ["ex2"]},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,30 @@
+from interfaces.repositories.best_submission_repository_interface import (
+    IBestSubmissionRepository,
+)
+from models.best_submission import BestSubmissionModel, best_per_student
+from models.submission import SubmissionModel
+
+
+class MockBestSubmissionRepository(IBestSubmissionRepository):
+    def __init__(self):
+        self._data: dict[tuple[str, int], BestSubmissionModel] = {}
+
+    def record(self, slug: str, submissions: list[SubmissionModel]) -> int:
+        updated = 0
+        for candidate in best_per_student(slug, submissions):
+            key = (slug, candidate.github_id)
+            current = self._data.get(key)
+            merged = candidate if current is None else current.merge(candidate)
+            if merged != current:
+                self._data[key] = merged
+                updated += 1
+        return updated
+
+    def get_for_slugs(
+        self, slugs: list[str], github_ids: list[int] | None = None
+    ) -> list[BestSubmissionModel]:
+        return [
+            best
+            for (slug, github_id), best in self._data.items()
+            if slug in slugs and (github_ids is None or github_id in github_ids)
+        ]
@@ -1,3 +1,5 @@
+from typing import Any
+
 from interfaces.repositories.course_repository_interface import ICourseRepository
 from models.course import Course
 
@@ -23,6 +25,27 @@ class MockCourseRepository(ICourseRepository):
         self._data[item_id] = data
         return self._data[item_id]
 
+    def patch(
+        self,
+        item_id: str,
+        fields: dict[str, Any],
+        add_exercise_ids: list[str] | None = None,
+        remove_exercise_ids: list[str] | None = None,
+    ) -> Course | None:
+        if item_id not in self._data:
+            return None
+
+        course = self._data[item_id].model_copy(update=fields)
+        for exercise_id in add_exercise_ids or []:
+            if exercise_id not in course.exercise_ids:
+                course.exercise_ids.append(exercise_id)
+        course.exercise_ids = [
+            e for e in course.exercise_ids if e not in (remove_exercise_ids or [])
+        ]
+
+        self._data[item_id] = course
+        return course
+
     def delete(self, item_id: str) -> bool:
         if item_id in self._data:
             self._data.pop(item_id)
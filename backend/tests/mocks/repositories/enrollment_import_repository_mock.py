@@ -0,0 +1,52 @@
+from interfaces.repositories.enrollment_import_repository_interface import (
+    IEnrollmentImportRepository,
+    ImportBatchResult,
+)
+from models.enrollment import EnrollmentModel
+from models.student import StudentModel
+
+
+class MockEnrollmentImportRepository(IEnrollmentImportRepository):
+    def __init__(self, student_repository, enrollment_repository, fail_after_batches=None):
+        self._students = student_repository
+        self._enrollments = enrollment_repository
+        self._checkpoints: dict[str, int] = {}
+        self.fail_after_batches = fail_after_batches
+        self.batches: list[list[str]] = []
+
+    def get_checkpoint(self, import_id: str) -> int:
+        return self._checkpoints.get(import_id, 0)
+
+    def import_batch(
+        self, import_id: str, course_id: str, students: list[StudentModel], rows_done: int
+    ) -> ImportBatchResult:
+        if self.fail_after_batches is not None and len(self.batches) >= self.fail_after_batches:
+            msg = "connection lost"
+            raise ConnectionError(msg)
+
+        self.batches.append([s.email for s in students])
+        stored = []
+        students_created = 0
+        enrollments_created = 0
+        for student in students:
+            existing = self._students.get_by_email(student.email)
+            if existing is None:
+                existing = self._students.create(student)
+                students_created += 1
+            stored.append(existing)
+
+            if course_id not in self._enrollments.get_courses_for_student(existing.id):
+                self._enrollments.add_enrollment(
+                    EnrollmentModel(student_id=existing.id, course_id=course_id)
+                )
+                enrollments_created += 1
+
+        self._checkpoints[import_id] = rows_done
+        return ImportBatchResult(
+            students=stored,
+            students_created=students_created,
+            enrollments_created=enrollments_created,
+        )
+
+    def finish(self, import_id: str) -> None:
+        self._checkpoints.pop(import_id, None)
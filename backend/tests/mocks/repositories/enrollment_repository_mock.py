@@ -19,6 +19,12 @@ class MockEnrollmentRepository(IEnrollmentRepository):
     def get_students_for_course(self, course_id: str) -> list[str]:
         return [student_id for student_id, courses in self._data.items() if course_id in courses]
 
+    def get_courses_for_students(self, student_ids: list[str]) -> dict[str, list[str]]:
+        return {student_id: self.get_courses_for_student(student_id) for student_id in student_ids}
+
+    def get_students_for_courses(self, course_ids: list[str]) -> dict[str, list[str]]:
+        return {course_id: self.get_students_for_course(course_id) for course_id in course_ids}
+
     def remove_enrollment(self, enrollment: EnrollmentModel) -> bool:
         student_courses = self._data.get(enrollment.student_id)
 
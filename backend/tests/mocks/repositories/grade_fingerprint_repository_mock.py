@@ -0,0 +1,16 @@
+from interfaces.repositories.grade_fingerprint_repository_interface import (
+    IGradeFingerprintRepository,
+)
+from models.grade_fingerprint import GradeFingerprintModel
+
+
+class MockGradeFingerprintRepository(IGradeFingerprintRepository):
+    def __init__(self):
+        self._data: dict[tuple[str, str, str], GradeFingerprintModel] = {}
+
+    def get_for_course(self, course_id: str) -> list[GradeFingerprintModel]:
+        return [f for f in self._data.values() if f.course_id == course_id]
+
+    def save(self, fingerprints: list[GradeFingerprintModel]) -> None:
+        for f in fingerprints:
+            self._data[f.course_id, f.student_id, f.slug] = f
@@ -1,6 +1,8 @@
+from typing import Any
+
 from exceptions.duplicate_email import StudentEmailAlreadyExists
 from interfaces.repositories.course_repository_interface import ICourseRepository
-from models.student import StudentModel
+from models.student import StudentModel, normalize_email
 
 
 class MockStudentRepository(ICourseRepository):
@@ -8,7 +10,7 @@ class MockStudentRepository(ICourseRepository):
         self._data: dict[str, StudentModel] = {}
 
     def create(self, data: StudentModel) -> StudentModel:
-        if any(s.email == data.email for s in self._data.values()):
+        if any(s.email_key == data.email_key for s in self._data.values()):
             raise StudentEmailAlreadyExists(data.email)
         self._data[data.id] = data
         return data
@@ -26,6 +28,13 @@ class MockStudentRepository(ICourseRepository):
         self._data[item_id] = data
         return self._data[item_id]
 
+    def patch(self, item_id: str, fields: dict[str, Any]) -> StudentModel | None:
+        if item_id not in self._data:
+            return None
+
+        self._data[item_id] = self._data[item_id].model_copy(update=fields)
+        return self._data[item_id]
+
     def delete(self, item_id: str) -> bool:
         if item_id in self._data:
             self._data.pop(item_id)
@@ -33,7 +42,11 @@ class MockStudentRepository(ICourseRepository):
         return False
 
     def get_by_email(self, email: str) -> StudentModel | None:
+        email_key = normalize_email(email)
         for s in self._data.values():
-            if s.email == email:
+            if s.email_key == email_key:
                 return s
         return None
+
+    def get_many(self, item_ids: list[str]) -> list[StudentModel]:
+        return [self._data[i] for i in item_ids if i in self._data]
@@ -1,12 +1,18 @@
 from copy import deepcopy
 
-from interfaces.services.course_service import ICourseService
+from interfaces.services.course_service import ICourseService, StudentPage
 from models.course import Course
+from models.course_overview import CourseOverviewModel
+from models.student import StudentModel
 
 
 class MockCourseService(ICourseService):
     def __init__(self):
         self._courses: dict[str, Course] = {}
+        self._students: dict[str, list[StudentModel]] = {}
+
+    def seed_students(self, course_id: str, students: list[StudentModel]):
+        self._students[course_id] = [s.model_copy(deep=True) for s in students]
 
     def get_course(self, course_id):
         course = self._courses.get(course_id)
@@ -35,5 +41,39 @@ class MockCourseService(ICourseService):
         self._courses[course_id] = updated
         return self._courses[course_id].model_copy(deep=True)
 
+    def patch_course(
+        self,
+        course_id: str,
+        fields: dict,
+        add_exercise_ids: list[str] | None = None,
+        remove_exercise_ids: list[str] | None = None,
+    ):
+        if course_id not in self._courses:
+            return None
+
+        course = self._courses[course_id].model_copy(update=deepcopy(fields), deep=True)
+        course.exercise_ids += [e for e in add_exercise_ids or [] if e not in course.exercise_ids]
+        course.exercise_ids = [
+            e for e in course.exercise_ids if e not in (remove_exercise_ids or [])
+        ]
+        self._courses[course_id] = course
+        return course.model_copy(deep=True)
+
     def delete_course(self, course_id: str):
         return self._courses.pop(course_id, None) is not None
+
+    def get_course_overview(self, course_id: str):
+        course = self._courses.get(course_id)
+        if course is None:
+            return None
+        return CourseOverviewModel(
+            course_id=course_id, exercise_ids=course.exercise_ids, students=[]
+        )
+
+    def get_students_in_course(self, course_id: str, offset: int = 0, limit: int | None = None):
+        if course_id not in self._courses:
+            return None
+
+        students = sorted(self._students.get(course_id, []), key=lambda s: s.id)
+        end = None if limit is None else offset + limit
+        return StudentPage(total=len(students), students=students[offset:end])
@@ -0,0 +1,38 @@
+from collections.abc import Iterator, Mapping
+
+from exceptions.exceptions import CourseDoesNotExistException, MissingMoodleParticipant
+from interfaces.services.grading_service import IGradingService, RegradeResult
+from models.moodle_worksheet import MoodleWorksheetRowModel
+from models.student import normalize_email
+
+
+class MockGradingService(IGradingService):
+    def __init__(self):
+        self._rows: dict[str, list[MoodleWorksheetRowModel]] = {}
+
+    def seed(self, course_id: str, rows: list[MoodleWorksheetRowModel]):
+        self._rows[course_id] = list(rows)
+
+    def grade_course(self, course_id: str) -> list[MoodleWorksheetRowModel]:
+        return list(self.iter_course_grades(course_id))
+
+    def iter_course_grades(
+        self, course_id: str, participant_ids: Mapping[str, str] | None = None
+    ) -> Iterator[MoodleWorksheetRowModel]:
+        if course_id not in self._rows:
+            raise CourseDoesNotExistException
+        rows = self._rows[course_id]
+        if participant_ids is None:
+            return iter(rows)
+
+        missing = [r.email for r in rows if normalize_email(r.email) not in participant_ids]
+        if missing:
+            raise MissingMoodleParticipant(missing)
+        return iter(
+            r.model_copy(update={"submission_id": participant_ids[normalize_email(r.email)]})
+            for r in rows
+        )
+
+    def regrade_course(self, course_id: str) -> RegradeResult:
+        rows = self.grade_course(course_id)
+        return RegradeResult(recomputed=len(rows), skipped=0, rows=rows)
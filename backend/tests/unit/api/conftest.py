@@ -4,12 +4,13 @@ import pytest
 from fastapi.testclient import TestClient
 
 from api.app import app, container
-from api.v1.controllers import course, cs50_submission_problem
+from api.v1.controllers import course, cs50_submission_problem, grading
 from models.course import Course
 from tests.mocks.services.course_service_mock import MockCourseService
 from tests.mocks.services.cs50_submission_problem_service_mock import (
     MockCS50SubmissionProblemService,
 )
+from tests.mocks.services.grading_service_mock import MockGradingService
 
 
 @pytest.fixture
@@ -19,6 +20,7 @@ def client():
     Dependencies can be overridden before yielding the client.
     """
     container.reset_override()
+    container.config.mongo.migrate_on_startup.override(False)
 
     mock_service = MockCourseService()
     mock_service.create_course(Course(id="1", name="Course 1", cs50_id=50, exercise_ids=[]))
@@ -27,7 +29,8 @@ def client():
     container.course_service.override(mock_service)
 
     container.cs50_submission_problem_service.override(MockCS50SubmissionProblemService())
-    container.wire(modules=[course, cs50_submission_problem])
+    container.grading_service.override(MockGradingService())
+    container.wire(modules=[course, cs50_submission_problem, grading])
 
     with TestClient(app) as c:
         yield c
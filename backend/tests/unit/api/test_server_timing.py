@@ -0,0 +1,75 @@
+import logging
+
+import pytest
+
+from api.app import container
+from request_timing import record
+from tests.mocks.services.course_service_mock import MockCourseService
+
+pytestmark = pytest.mark.unit
+
+
+class QueryingCourseService(MockCourseService):
+    """Pretends every course lookup runs a Mongo command."""
+
+    def get_course(self, course_id):
+        record("mongo", 0.002, "find")
+        return super().get_course(course_id)
+
+    def get_courses(self):
+        for course_id in ("1", "2"):
+            self.get_course(course_id)
+        return super().get_courses()
+
+
+def _entries(header: str) -> dict[str, str]:
+    return dict(entry.split(";", 1) for entry in header.split(", "))
+
+
+def test_server_timing_header_has_endpoint_serialization_and_total(client):
+    response = client.get("/api/v1/courses")
+
+    assert response.status_code == 200
+    entries = _entries(response.headers["Server-Timing"])
+    assert list(entries) == ["endpoint", "serialization", "total"]
+    assert "mongo" not in entries
+
+
+def test_server_timing_counts_commands_recorded_in_the_endpoint_thread(client):
+    container.course_service.override(QueryingCourseService())
+
+    response = client.get("/api/v1/courses")
+
+    entries = _entries(response.headers["Server-Timing"])
+    assert entries["mongo"] == 'dur=4.00;desc="2 Mongo commands"'
+
+
+def test_server_timing_is_set_on_error_responses(client):
+    response = client.get("/api/v1/courses/missing")
+
+    assert response.status_code == 404
+    entries = _entries(response.headers["Server-Timing"])
+    assert "serialization" not in entries
+    assert "total" in entries
+
+
+def test_request_timing_is_logged_with_command_counts(client, caplog):
+    container.course_service.override(QueryingCourseService())
+
+    with caplog.at_level(logging.INFO, logger="api.timing"):
+        client.get("/api/v1/courses")
+
+    [log] = [r for r in caplog.records if r.name == "api.timing"]
+    assert log.getMessage().startswith("GET /api/v1/courses 200 total=")
+    assert "mongo=2x4.0ms" in log.getMessage()
+    assert log.request_timing["mongo_count"] == 2
+    assert log.request_timing["mongo_commands"] == {"find": 2}
+    assert log.request_timing["status"] == 200
+
+
+def test_commands_outside_of_requests_are_not_recorded(client):
+    record("mongo", 1.0, "find")
+
+    response = client.get("/api/v1/courses")
+
+    assert "mongo" not in _entries(response.headers["Server-Timing"])
@@ -1,7 +1,15 @@
 import pytest
 from fastapi import status
 
-from api.models.course import CourseCreate, CourseOut, CourseUpdate
+from api.app import container
+from api.models.course import (
+    CourseCreate,
+    CourseOut,
+    CourseOverviewOut,
+    CourseUpdate,
+    StudentPageOut,
+)
+from models.student import StudentModel
 
 pytestmark = pytest.mark.unit
 
@@ -125,3 +133,53 @@ def test_create_and_delete_multiple_courses(client):
     remaining_ids = {c["id"] for c in data}
     for cid in course_ids:
         assert cid not in remaining_ids
+
+
+def test_update_course_adds_and_removes_exercise_ids(client):
+    response = client.patch("/api/v1/courses/1", json={"add_exercise_ids": ["ex1", "ex2"]})
+    assert response.status_code == status.HTTP_200_OK
+    assert CourseOut(**response.json()).exercise_ids == ["ex1", "ex2"]
+
+    response = client.patch("/api/v1/courses/1", json={"remove_exercise_ids": ["ex1"]})
+    assert response.status_code == status.HTTP_200_OK
+    assert CourseOut(**response.json()).exercise_ids == ["ex2"]
+
+
+def test_get_course_overview(client):
+    response = client.get("/api/v1/courses/1/overview")
+    assert response.status_code == status.HTTP_200_OK
+
+    model = CourseOverviewOut(**response.json())
+    assert model.course_id == "1"
+    assert isinstance(model.exercise_ids, list)
+    assert isinstance(model.students, list)
+
+
+def test_get_course_overview_not_found(client):
+    response = client.get("/api/v1/courses/nonexistent/overview")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_get_course_students_paginates(client):
+    container.course_service().seed_students(
+        "1", [StudentModel(id=f"s{i}", email=f"s{i}@example.com") for i in range(3)]
+    )
+
+    response = client.get("/api/v1/courses/1/students", params={"offset": 1, "limit": 1})
+    assert response.status_code == status.HTTP_200_OK
+
+    page = StudentPageOut(**response.json())
+    assert page.total == 3
+    assert page.offset == 1
+    assert page.limit == 1
+    assert [s.email for s in page.items] == ["s1@example.com"]
+
+
+def test_get_course_students_rejects_invalid_limit(client):
+    response = client.get("/api/v1/courses/1/students", params={"limit": 0})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
+def test_get_course_students_not_found(client):
+    response = client.get("/api/v1/courses/nonexistent/students")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
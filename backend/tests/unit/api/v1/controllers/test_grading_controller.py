@@ -0,0 +1,94 @@
+from datetime import UTC, datetime
+
+import pytest
+from fastapi import status
+
+from api.app import container
+from models.moodle_worksheet import GradeType, MoodleWorksheetRowModel, PassFailGrade
+
+pytestmark = pytest.mark.unit
+
+
+def seed_rows(count):
+    graded_at = datetime(2025, 12, 2, 9, 37, tzinfo=UTC)
+    container.grading_service().seed(
+        "1",
+        [
+            MoodleWorksheetRowModel(
+                email=f"student{i}@example.com",
+                status="Zur Bewertung abgegeben - Bewertet",
+                grade_type=GradeType.pass_fail,
+                grade_pass_fail=PassFailGrade.passed,
+                grade_scale="nicht bestanden    bestanden",
+                submission_last_modified=graded_at,
+                grade_last_modified=graded_at,
+                feedback_comment="",
+            )
+            for i in range(count)
+        ],
+    )
+
+
+def moodle_worksheet(count):
+    """The worksheet downloaded from the Moodle assignment, with the emails as typed."""
+    lines = ["\ufeffID,Vollständiger Name,E-Mail-Adresse,Status"]
+    lines += [f"Teilnehmer/in{100 + i},Student {i},Student{i}@Example.com," for i in range(count)]
+    return {"worksheet": ("Bewertungen.csv", "\n".join(lines).encode(), "text/csv")}
+
+
+def test_export_moodle_worksheet_streams_csv(client):
+    seed_rows(3)
+
+    response = client.post("/api/v1/grading/1/moodle-worksheet", files=moodle_worksheet(3))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.headers["content-disposition"] == 'attachment; filename="Bewertungen-1.csv"'
+    assert response.content.startswith(b"\xef\xbb\xbfID,")
+
+    lines = response.content.decode("utf-8-sig").split("\n")
+    assert len(lines) == 4
+    # Moodle's import matches the rows by the participant identifier
+    assert lines[1].startswith("Teilnehmer/in100,,student0@example.com,")
+
+
+def test_export_moodle_worksheet_missing_participant_returns_400(client):
+    seed_rows(3)
+
+    response = client.post("/api/v1/grading/1/moodle-worksheet", files=moodle_worksheet(2))
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "student2@example.com" in response.json()["detail"]
+
+
+def test_export_moodle_worksheet_without_id_column_returns_400(client):
+    seed_rows(1)
+    worksheet = b"Vorname,Nachname,E-Mail-Adresse\nMax,Mustermann,student0@example.com\n"
+
+    response = client.post(
+        "/api/v1/grading/1/moodle-worksheet",
+        files={"worksheet": ("Teilnehmer.csv", worksheet, "text/csv")},
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_export_moodle_worksheet_unknown_course_returns_404(client):
+    response = client.post("/api/v1/grading/unknown/moodle-worksheet", files=moodle_worksheet(1))
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_regrade_course_reports_counts(client):
+    container.grading_service().seed("1", [])
+
+    response = client.post("/api/v1/grading/1/regrade")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"recomputed": 0, "skipped": 0, "rows": []}
+
+
+def test_regrade_unknown_course_returns_404(client):
+    response = client.post("/api/v1/grading/unknown/regrade")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
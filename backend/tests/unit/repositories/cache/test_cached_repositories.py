@@ -0,0 +1,206 @@
+from unittest.mock import Mock
+
+import pytest
+
+from models.course import Course
+from models.student import StudentModel
+from repositories.cache.course_repository import CachedCourseRepository
+from repositories.cache.student_repository import CachedStudentRepository
+from tests.mocks.repositories.course_repository_mock import MockCourseRepository
+from tests.mocks.repositories.student_repository_mock import MockStudentRepository
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def course_backend():
+    return Mock(wraps=MockCourseRepository())
+
+
+@pytest.fixture
+def course_repository(course_backend):
+    return CachedCourseRepository(course_backend, max_size=16, ttl_seconds=60)
+
+
+@pytest.fixture
+def student_backend():
+    return Mock(wraps=MockStudentRepository())
+
+
+@pytest.fixture
+def student_repository(student_backend):
+    return CachedStudentRepository(student_backend, max_size=16, ttl_seconds=60)
+
+
+def test_course_get_is_served_from_cache(course_repository, course_backend):
+    course = course_backend.create(Course(name="Course 1"))
+
+    first = course_repository.get(course.id)
+    second = course_repository.get(course.id)
+
+    assert first == second == course
+    assert course_backend.get.call_count == 1
+    assert course_repository.stats()["by_id"].hits == 1
+
+
+def test_course_cache_returns_copies(course_repository, course_backend):
+    course = course_backend.create(Course(name="Course 1"))
+
+    course_repository.get(course.id).exercise_ids.append("ex1")
+
+    assert course_repository.get(course.id).exercise_ids == []
+
+
+def test_course_missing_result_is_not_cached(course_repository, course_backend):
+    assert course_repository.get("missing") is None
+    assert course_repository.get("missing") is None
+
+    assert course_backend.get.call_count == 2
+
+
+def test_course_update_invalidates_cache(course_repository):
+    course = course_repository.create(Course(name="Course 1"))
+    course_repository.get(course.id)
+
+    course_repository.update(course.id, Course(id=course.id, name="Renamed"))
+
+    assert course_repository.get(course.id).name == "Renamed"
+
+
+def test_course_read_during_update_is_not_cached():
+    class ReadDuringUpdate(MockCourseRepository):
+        def update(self, item_id, data):
+            # a concurrent request reads the course while the write is in flight
+            cached.get(item_id)
+            return super().update(item_id, data)
+
+    cached = CachedCourseRepository(ReadDuringUpdate(), max_size=16, ttl_seconds=60)
+    course = cached.create(Course(name="Course 1"))
+
+    cached.update(course.id, Course(id=course.id, name="Renamed"))
+
+    assert cached.get(course.id).name == "Renamed"
+
+
+def test_course_read_before_concurrent_update_is_not_cached():
+    class UpdateDuringRead(MockCourseRepository):
+        def get(self, item_id):
+            course = super().get(item_id)
+            if course is not None and course.name == "Course 1":
+                # another request writes after this read returned the old course
+                cached.update(item_id, Course(id=item_id, name="Renamed"))
+            return course
+
+    cached = CachedCourseRepository(UpdateDuringRead(), max_size=16, ttl_seconds=60)
+    course = cached.create(Course(name="Course 1"))
+    cached.update(course.id, Course(id=course.id, name="Course 1"))
+
+    assert cached.get(course.id).name == "Course 1"
+    assert cached.get(course.id).name == "Renamed"
+
+
+def test_course_delete_invalidates_cache(course_repository):
+    course = course_repository.create(Course(name="Course 1"))
+    course_repository.get(course.id)
+
+    course_repository.delete(course.id)
+
+    assert course_repository.get(course.id) is None
+
+
+def test_student_get_by_email_is_served_from_cache(student_repository, student_backend):
+    student = student_backend.create(StudentModel(email="first.last@email.com"))
+
+    student_repository.get_by_email(student.email)
+    fetched = student_repository.get_by_email(student.email)
+
+    assert fetched == student
+    assert student_backend.get_by_email.call_count == 1
+    assert student_repository.get(student.id) == student
+    assert student_backend.get.call_count == 0
+
+
+def test_student_created_through_cache_is_cached(student_repository, student_backend):
+    student = student_repository.create(StudentModel(email="first.last@email.com"))
+
+    assert student_repository.get_by_email(student.email) == student
+    assert student_backend.get_by_email.call_count == 0
+
+
+def test_student_update_invalidates_email_lookup(student_repository):
+    student = student_repository.create(StudentModel(email="old@email.com"))
+
+    student_repository.update(student.id, StudentModel(id=student.id, email="new@email.com"))
+
+    assert student_repository.get_by_email("old@email.com") is None
+    assert student_repository.get_by_email("new@email.com").id == student.id
+
+
+def test_student_delete_invalidates_cache(student_repository):
+    student = student_repository.create(StudentModel(email="first.last@email.com"))
+
+    student_repository.delete(student.id)
+
+    assert student_repository.get(student.id) is None
+    assert student_repository.get_by_email(student.email) is None
+
+
+def test_course_patch_invalidates_cache(course_repository):
+    course = course_repository.create(Course(name="Course 1"))
+    course_repository.get(course.id)
+
+    course_repository.patch(course.id, {"name": "Renamed"})
+
+    assert course_repository.get(course.id).name == "Renamed"
+
+
+def test_student_patch_invalidates_cache(student_repository):
+    student = student_repository.create(StudentModel(email="first.last@email.com"))
+
+    student_repository.patch(student.id, {"github_username": "octocat"})
+
+    assert student_repository.get_by_email(student.email).github_username == "octocat"
+
+
+def test_student_get_many_only_loads_uncached(student_repository, student_backend):
+    s1 = student_repository.create(StudentModel(email="a@example.com"))
+    s2 = student_backend.create(StudentModel(email="b@example.com"))
+
+    result = student_repository.get_many([s1.id, s2.id])
+
+    assert {s.id for s in result} == {s1.id, s2.id}
+    student_backend.get_many.assert_called_once_with([s2.id])
+
+
+def test_student_get_many_results_are_not_cached(student_repository, student_backend):
+    student = student_backend.create(StudentModel(email="a@example.com"))
+
+    student_repository.get_many([student.id])
+
+    assert student_repository.get(student.id) == student
+    assert student_repository.get_by_email(student.email) == student
+    student_backend.get.assert_called_once_with(student.id)
+
+
+def test_student_email_lookup_is_cached_by_normalized_email(student_repository, student_backend):
+    student = student_repository.create(StudentModel(email="Max@Mail.de"))
+
+    assert student_repository.get_by_email("max@mail.de ") == student
+    assert student_backend.get_by_email.call_count == 0
+
+
+def test_student_read_before_concurrent_patch_is_not_cached():
+    class PatchDuringRead(MockStudentRepository):
+        def get_by_email(self, email):
+            student = super().get_by_email(email)
+            if student is not None and student.name == "Old":
+                # another request writes after this read returned the old student
+                cached.patch(student.id, {"name": "New"})
+            return student
+
+    cached = CachedStudentRepository(PatchDuringRead(), max_size=16, ttl_seconds=60)
+    student = cached.create(StudentModel(email="a@email.com", name="Old"))
+    cached.patch(student.id, {"name": "Old"})
+
+    assert cached.get_by_email(student.email).name == "Old"
+    assert cached.get(student.id).name == "New"
@@ -0,0 +1,110 @@
+import pytest
+
+from repositories.cache.lru_cache import LRUCache
+
+pytestmark = pytest.mark.unit
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_get_returns_stored_value_and_counts_hit(clock):
+    cache = LRUCache(max_size=2, ttl_seconds=10, clock=clock)
+    cache.put("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.stats().hits == 1
+    assert cache.stats().misses == 0
+
+
+def test_get_missing_key_counts_miss(clock):
+    cache = LRUCache(max_size=2, ttl_seconds=10, clock=clock)
+
+    assert cache.get("a") is None
+    assert cache.stats().misses == 1
+    assert not cache.stats().hit_ratio
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = LRUCache(max_size=2, ttl_seconds=10, clock=clock)
+    cache.put("a", 1)
+
+    clock.now = 10
+
+    assert cache.get("a") is None
+    assert cache.stats().size == 0
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = LRUCache(max_size=2, ttl_seconds=10, clock=clock)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats().evictions == 1
+
+
+def test_invalidate_removes_entry(clock):
+    cache = LRUCache(max_size=2, ttl_seconds=10, clock=clock)
+    cache.put("a", 1)
+
+    cache.invalidate("a")
+    cache.invalidate("missing")
+
+    assert cache.get("a") is None
+    assert cache.stats().invalidations == 1
+
+
+def test_zero_max_size_disables_cache(clock):
+    cache = LRUCache(max_size=0, ttl_seconds=10, clock=clock)
+    cache.put("a", 1)
+
+    assert cache.get("a") is None
+    assert cache.stats().size == 0
+
+
+def test_put_drops_value_read_before_invalidation(clock):
+    cache = LRUCache(max_size=2, ttl_seconds=10, clock=clock)
+    read_at = cache.version()
+
+    cache.invalidate("a")
+    cache.put("a", "old", read_at)
+
+    assert cache.get("a") is None
+
+
+def test_put_keeps_value_read_after_invalidation(clock):
+    cache = LRUCache(max_size=2, ttl_seconds=10, clock=clock)
+    cache.invalidate("a")
+    read_at = cache.version()
+
+    cache.invalidate("b")
+    cache.put("a", "new", read_at)
+
+    assert cache.get("a") == "new"
+
+
+def test_put_drops_value_when_invalidation_was_forgotten(clock):
+    cache = LRUCache(max_size=1, ttl_seconds=10, clock=clock)
+    read_at = cache.version()
+
+    cache.invalidate("a")
+    cache.invalidate("b")
+    cache.put("a", "old", read_at)
+
+    assert cache.get("a") is None
@@ -0,0 +1,20 @@
+import pytest
+
+from repositories.memory.course_repository import MemoryCourseRepository
+from repositories.memory.enrollment_repository import MemoryEnrollmentRepository
+from repositories.memory.student_repository import MemoryStudentRepository
+
+
+@pytest.fixture
+def enrollment_repository():
+    return MemoryEnrollmentRepository()
+
+
+@pytest.fixture
+def course_repository(enrollment_repository):
+    return MemoryCourseRepository(enrollment_repository=enrollment_repository)
+
+
+@pytest.fixture
+def student_repository(enrollment_repository):
+    return MemoryStudentRepository(enrollment_repository=enrollment_repository)
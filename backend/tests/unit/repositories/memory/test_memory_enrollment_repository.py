@@ -0,0 +1,53 @@
+import pytest
+
+from models.course import Course
+from models.enrollment import EnrollmentModel
+
+pytestmark = pytest.mark.unit
+
+
+def test_enrollments_are_indexed_both_ways(enrollment_repository):
+    enrollment_repository.add_bulk_enrollments([
+        EnrollmentModel(student_id="s1", course_id="c1"),
+        EnrollmentModel(student_id="s2", course_id="c1"),
+        EnrollmentModel(student_id="s1", course_id="c2"),
+    ])
+
+    assert enrollment_repository.get_students_for_course("c1") == ["s1", "s2"]
+    assert enrollment_repository.get_courses_for_student("s1") == ["c1", "c2"]
+    assert enrollment_repository.get_courses_for_students(["s1", "s3"]) == {
+        "s1": ["c1", "c2"],
+        "s3": [],
+    }
+    assert enrollment_repository.get_students_for_courses(["c2"]) == {"c2": ["s1"]}
+
+
+def test_duplicate_enrollment_is_ignored(enrollment_repository):
+    enrollment = EnrollmentModel(student_id="s1", course_id="c1")
+
+    enrollment_repository.add_enrollment(enrollment)
+    enrollment_repository.add_enrollment(enrollment)
+
+    assert enrollment_repository.get_students_for_course("c1") == ["s1"]
+
+
+def test_remove_enrollment(enrollment_repository):
+    enrollment = EnrollmentModel(student_id="s1", course_id="c1")
+    enrollment_repository.add_enrollment(enrollment)
+
+    assert enrollment_repository.remove_enrollment(enrollment) is True
+    assert enrollment_repository.remove_enrollment(enrollment) is False
+    assert enrollment_repository.get_courses_for_student("s1") == []
+    assert enrollment_repository.get_students_for_course("c1") == []
+
+
+def test_delete_course_removes_enrollments(course_repository, enrollment_repository):
+    course = Course(id="c1", name="Course 1", cs50_id=50)
+    course_repository.create(course)
+    enrollment_repository.add_enrollment(EnrollmentModel(student_id="s1", course_id="c1"))
+    enrollment_repository.add_enrollment(EnrollmentModel(student_id="s1", course_id="c2"))
+
+    assert course_repository.delete("c1") is True
+
+    assert course_repository.get("c1") is None
+    assert enrollment_repository.get_courses_for_student("s1") == ["c2"]
@@ -0,0 +1,181 @@
+from datetime import UTC, datetime
+
+import pytest
+
+from models.course import Course
+from models.cs50_submission_problem import CS50SubmissionProblemModel
+from models.enrollment import EnrollmentModel
+from models.grade_fingerprint import GradeFingerprintModel
+from models.student import StudentModel
+from models.submission import SubmissionModel
+from repositories.memory.best_submission_repository import MemoryBestSubmissionRepository
+from repositories.memory.course_overview_repository import MemoryCourseOverviewRepository
+from repositories.memory.course_repository import MemoryCourseRepository
+from repositories.memory.cs50_submission_problem_repository import (
+    MemorySubmissionProblemRepository,
+)
+from repositories.memory.enrollment_import_repository import MemoryEnrollmentImportRepository
+from repositories.memory.grade_fingerprint_repository import MemoryGradeFingerprintRepository
+from repositories.memory.student_repository import MemoryStudentRepository
+
+pytestmark = pytest.mark.unit
+
+MARIO = "hsddigitallabor/problems/adg2025/mario"
+CASH = "hsddigitallabor/problems/adg2025/cash"
+
+
+def make_submission(github_id, checks_passed, day, slug=MARIO):
+    return SubmissionModel(
+        archive=f"https://github.com/me50/user{github_id}/archive/abc.zip",
+        checks_passed=checks_passed,
+        checks_run=10,
+        github_id=github_id,
+        github_url=f"https://github.com/me50/user{github_id}/tree/abc",
+        github_username=f"user{github_id}",
+        name=None,
+        slug=slug,
+        timestamp=datetime(2025, 12, day, 12, 0, tzinfo=UTC),
+    )
+
+
+def test_create_duplicate_course_raises(course_repository):
+    course_repository.create(Course(id="c1", name="Course 1"))
+
+    with pytest.raises(ValueError, match="c1"):
+        course_repository.create(Course(id="c1", name="Course 1"))
+
+
+def test_patch_course_exercise_ids(course_repository):
+    course_repository.create(Course(id="c1", name="Course 1", exercise_ids=[MARIO]))
+
+    patched = course_repository.patch("c1", {"name": "ADG"}, add_exercise_ids=[MARIO, CASH])
+    assert patched.name == "ADG"
+    assert patched.exercise_ids == [MARIO, CASH]
+
+    patched = course_repository.patch("c1", {}, remove_exercise_ids=[MARIO])
+    assert patched.exercise_ids == [CASH]
+    assert course_repository.get("c1").exercise_ids == [CASH]
+    assert course_repository.patch("missing", {"name": "x"}) is None
+
+
+def test_submission_problems_by_slug():
+    repo = MemorySubmissionProblemRepository()
+    mario = CS50SubmissionProblemModel(slug=MARIO, submissions=[make_submission(1, 10, 1)])
+    repo.upload_submissions(mario)
+    repo.upload_submissions(CS50SubmissionProblemModel(slug=CASH, submissions=[]))
+
+    assert repo.get_submissions(MARIO) == mario
+    assert repo.get_submissions("missing") is None
+    assert [p.slug for p in repo.get_submissions_for_slugs([CASH, "missing", MARIO])] == [
+        CASH,
+        MARIO,
+    ]
+
+
+def test_best_submission_record_only_counts_changes():
+    repo = MemoryBestSubmissionRepository()
+
+    assert repo.record(MARIO, [make_submission(1, 5, 1), make_submission(2, 10, 1)]) == 2
+    assert repo.record(MARIO, [make_submission(1, 5, 1)]) == 0
+    assert repo.record(MARIO, [make_submission(1, 8, 2)]) == 1
+
+    best = {b.github_id: b for b in repo.get_for_slugs([MARIO])}
+    assert best[1].checks_passed == 8
+    assert best[2].score == pytest.approx(1.0)
+
+
+def test_best_submission_get_for_slugs_filters_github_ids():
+    repo = MemoryBestSubmissionRepository()
+    repo.record(MARIO, [make_submission(1, 10, 1), make_submission(2, 10, 1)])
+    repo.record(CASH, [make_submission(1, 10, 1, slug=CASH)])
+
+    best = repo.get_for_slugs([MARIO, CASH], github_ids=[1, 3])
+
+    assert sorted((b.github_id, b.slug) for b in best) == [(1, CASH), (1, MARIO)]
+    assert repo.get_for_slugs([], github_ids=[1]) == []
+
+
+def test_grade_fingerprints_are_replaced_per_student_and_slug():
+    repo = MemoryGradeFingerprintRepository()
+    first = GradeFingerprintModel(
+        course_id="c1", student_id="s1", slug=MARIO, fingerprint="a", passed=False
+    )
+    repo.save([first, first.model_copy(update={"course_id": "c2"})])
+    repo.save([first.model_copy(update={"fingerprint": "b", "passed": True})])
+
+    [stored] = repo.get_for_course("c1")
+    assert stored.fingerprint == "b"
+    assert stored.passed is True
+    assert repo.get_for_course("missing") == []
+
+
+def test_deletes_cascade_to_grade_fingerprints():
+    fingerprints = MemoryGradeFingerprintRepository()
+    courses = MemoryCourseRepository(grade_fingerprint_repository=fingerprints)
+    students = MemoryStudentRepository(grade_fingerprint_repository=fingerprints)
+    courses.create(Course(id="c1", name="Course 1"))
+    student = students.create(StudentModel(email="a@example.com"))
+    fingerprint = GradeFingerprintModel(
+        course_id="c1", student_id=student.id, slug=MARIO, fingerprint="a", passed=True
+    )
+    fingerprints.save([fingerprint, fingerprint.model_copy(update={"course_id": "c2"})])
+
+    students.delete(student.id)
+    assert fingerprints.get_for_course("c2") == []
+
+    fingerprints.save([fingerprint])
+    courses.delete("c1")
+    assert fingerprints.get_for_course("c1") == []
+
+
+def test_course_overview_joins_memory_repositories(
+    course_repository, student_repository, enrollment_repository
+):
+    best = MemoryBestSubmissionRepository()
+    repo = MemoryCourseOverviewRepository(
+        course_repository, enrollment_repository, student_repository, best
+    )
+    course_repository.create(Course(id="c1", name="ADG", exercise_ids=[MARIO, CASH]))
+    course_repository.create(Course(id="c2", name="Empty", exercise_ids=[MARIO]))
+    for student in (
+        StudentModel(id="s1", email="b@example.com", github_id=1),
+        StudentModel(id="s2", email="a@example.com", github_id=2),
+        StudentModel(id="s3", email="c@example.com"),
+    ):
+        student_repository.create(student)
+        enrollment_repository.add_enrollment(EnrollmentModel(student_id=student.id, course_id="c1"))
+    best.record(MARIO, [make_submission(1, 10, 1)])
+    best.record(CASH, [make_submission(1, 5, 1, slug=CASH), make_submission(2, 10, 1, slug=CASH)])
+
+    overview = repo.get_overview("c1")
+
+    assert [s.email for s in overview.students] == [
+        "a@example.com",
+        "b@example.com",
+        "c@example.com",
+    ]
+    by_id = {s.student_id: s for s in overview.students}
+    assert by_id["s1"].passed_exercise_ids == [MARIO]
+    assert by_id["s2"].passed_exercise_ids == [CASH]
+    assert by_id["s3"].passed_exercise_ids == []
+    assert repo.get_overview("c1", pass_threshold=0.5).students[1].passed_count == 2
+    assert repo.get_overview("c2").students == []
+    assert repo.get_overview("missing") is None
+
+
+def test_import_batch_is_idempotent(student_repository, enrollment_repository):
+    repo = MemoryEnrollmentImportRepository(student_repository, enrollment_repository)
+    student_repository.create(StudentModel(id="s1", email="a@example.com"))
+    batch = [StudentModel(email="A@example.com"), StudentModel(email="b@example.com")]
+
+    first = repo.import_batch("imp", "c1", batch, 2)
+    again = repo.import_batch("imp", "c1", batch, 2)
+
+    assert (first.students_created, first.enrollments_created) == (1, 2)
+    assert (again.students_created, again.enrollments_created) == (0, 0)
+    assert {s.email for s in first.students} == {"a@example.com", "b@example.com"}
+    assert len(enrollment_repository.get_students_for_course("c1")) == 2
+    assert repo.get_checkpoint("imp") == 2
+
+    repo.finish("imp")
+    assert repo.get_checkpoint("imp") == 0
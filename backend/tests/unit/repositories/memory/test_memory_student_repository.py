@@ -0,0 +1,110 @@
+import pytest
+
+from exceptions.duplicate_email import StudentEmailAlreadyExists
+from models.enrollment import EnrollmentModel
+from models.student import StudentModel
+
+pytestmark = pytest.mark.unit
+
+
+def test_create_and_get_student(student_repository):
+    student = StudentModel(email="first.last@email.com", github_id=1)
+
+    student_repository.create(student)
+
+    assert student_repository.get(student.id) == student
+    assert student_repository.get("missing") is None
+
+
+def test_get_by_email_uses_normalized_key(student_repository):
+    student = StudentModel(email="First.Last@Email.com")
+    student_repository.create(student)
+
+    assert student_repository.get_by_email("  first.last@EMAIL.com ").id == student.id
+    assert student_repository.get_by_email("other@email.com") is None
+
+
+def test_create_duplicate_email_raises(student_repository):
+    student_repository.create(StudentModel(email="a@email.com"))
+
+    with pytest.raises(StudentEmailAlreadyExists):
+        student_repository.create(StudentModel(email="A@email.com"))
+
+
+def test_returned_students_are_copies(student_repository):
+    student = StudentModel(email="a@email.com", name="Ada")
+    student_repository.create(student)
+
+    student.name = "changed"
+    student_repository.get(student.id).name = "changed"
+
+    assert student_repository.get(student.id).name == "Ada"
+
+
+def test_get_many_skips_missing_ids(student_repository):
+    s1 = StudentModel(email="a@email.com")
+    s2 = StudentModel(email="b@email.com")
+    student_repository.create(s1)
+    student_repository.create(s2)
+
+    students = student_repository.get_many([s2.id, "missing", s1.id, s2.id])
+
+    assert [s.id for s in students] == [s2.id, s1.id]
+
+
+def test_patch_moves_email_index(student_repository):
+    student = StudentModel(email="a@email.com")
+    student_repository.create(student)
+
+    patched = student_repository.patch(student.id, {"email": "new@email.com"})
+
+    assert patched.email == "new@email.com"
+    assert student_repository.get_by_email("a@email.com") is None
+    assert student_repository.get_by_email("NEW@email.com").id == student.id
+
+
+def test_patch_rejects_taken_email(student_repository):
+    student_repository.create(StudentModel(email="a@email.com"))
+    other = StudentModel(email="b@email.com")
+    student_repository.create(other)
+
+    with pytest.raises(StudentEmailAlreadyExists):
+        student_repository.patch(other.id, {"email": "A@email.com"})
+
+    assert student_repository.get_by_email("b@email.com").id == other.id
+
+
+def test_patch_rejects_immutable_fields(student_repository):
+    student = StudentModel(email="a@email.com")
+    student_repository.create(student)
+
+    with pytest.raises(ValueError, match="id"):
+        student_repository.patch(student.id, {"id": "other"})
+
+
+def test_patch_missing_student(student_repository):
+    assert student_repository.patch("missing", {"name": "x"}) is None
+
+
+def test_update_student(student_repository):
+    student = StudentModel(email="a@email.com")
+    student_repository.create(student)
+
+    updated = student_repository.update(
+        student.id, StudentModel(id=student.id, email="b@email.com", name="Bea")
+    )
+
+    assert updated.name == "Bea"
+    assert student_repository.get_by_email("b@email.com").id == student.id
+    assert student_repository.update("missing", student) is None
+
+
+def test_delete_student_removes_enrollments(student_repository, enrollment_repository):
+    student = StudentModel(email="a@email.com")
+    student_repository.create(student)
+    enrollment_repository.add_enrollment(EnrollmentModel(student_id=student.id, course_id="c1"))
+
+    assert student_repository.delete(student.id) is True
+    assert student_repository.delete(student.id) is False
+    assert student_repository.get_by_email("a@email.com") is None
+    assert enrollment_repository.get_students_for_course("c1") == []
@@ -0,0 +1,133 @@
+from datetime import UTC, datetime
+
+import mongomock
+import pytest
+
+from dependencies import DependencyContainer
+from models.course import Course
+from models.cs50_submission_problem import CS50SubmissionProblemModel
+from models.enrollment import EnrollmentModel
+from models.grade_fingerprint import GradeFingerprintModel
+from models.student import StudentModel
+from models.submission import SubmissionModel
+from repositories.memory.course_overview_repository import MemoryCourseOverviewRepository
+from repositories.memory.cs50_submission_problem_repository import (
+    MemorySubmissionProblemRepository,
+)
+from repositories.memory.enrollment_repository import MemoryEnrollmentRepository
+from repositories.memory.student_repository import MemoryStudentRepository
+from repositories.mongo.cs50_submission_problem_repository import MongoSubmissionProblemRepository
+from repositories.mongo.enrollment_repository import MongoEnrollmentRepository
+from repositories.repository_settings import RepositorySettings
+
+pytestmark = pytest.mark.unit
+
+
+def test_repository_backend_defaults_to_mongo():
+    assert RepositorySettings().backend == "mongo"
+
+
+def test_repository_settings_rejects_unknown_backend():
+    with pytest.raises(ValueError, match="backend"):
+        RepositorySettings(backend="sqlite")
+
+
+def test_memory_backend_wires_services_to_memory_repositories():
+    container = DependencyContainer()
+    container.config.repository.backend.override("memory")
+
+    enrollments = container.enrollment_repository_backend()
+
+    assert isinstance(enrollments, MemoryEnrollmentRepository)
+    assert isinstance(container.student_repository_backend(), MemoryStudentRepository)
+    assert isinstance(
+        container.course_overview_repository_backend(), MemoryCourseOverviewRepository
+    )
+    assert container.enrollment_service()._enroll_repo is enrollments
+
+
+def test_mongo_backend_wires_services_to_mongo_repositories():
+    container = DependencyContainer()
+    container.config.repository.backend.override("mongo")
+
+    assert isinstance(container.enrollment_repository_backend(), MongoEnrollmentRepository)
+
+
+def test_service_deletes_leave_no_cached_or_derived_state():
+    container = DependencyContainer()
+    container.config.repository.backend.override("memory")
+    students = container.student_repository()
+    courses = container.course_repository()
+    fingerprints = container.grade_fingerprint_repository_backend()
+    rosters = container.roster_indexes()
+
+    courses.create(Course(id="c1", name="Course 1"))
+    student = students.create(StudentModel(email="a@example.com"))
+    container.enrollment_repository_backend().add_enrollment(
+        EnrollmentModel(student_id=student.id, course_id="c1")
+    )
+    fingerprints.save([
+        GradeFingerprintModel(
+            course_id="c1", student_id=student.id, slug="mario", fingerprint="f", passed=True
+        )
+    ])
+    assert student.id in rosters.get("c1")
+
+    container.student_service().delete_student(student.id)
+
+    assert students.get(student.id) is None
+    assert students.get_by_email("a@example.com") is None
+    assert student.id not in rosters.get("c1")
+    assert fingerprints.get_for_course("c1") == []
+
+    container.course_service().delete_course("c1")
+
+    assert courses.get("c1") is None
+
+
+@pytest.mark.parametrize("timestamp", ["Mon, 01 Dec 2025 08:20:07PM CET", "2025-12-01T20:20:07"])
+def test_submission_timestamps_are_the_same_instant_in_both_backends(timestamp):
+    slug = "hsddigitallabor/problems/adg2025/mario"
+    problem = CS50SubmissionProblemModel(
+        slug=slug,
+        submissions=[
+            SubmissionModel(
+                archive="https://github.com/me50/octocat/archive/abc.zip",
+                checks_passed=1,
+                checks_run=1,
+                github_id=1,
+                github_url="https://github.com/me50/octocat/tree/abc",
+                github_username="octocat",
+                name=None,
+                slug=slug,
+                timestamp=timestamp,
+            )
+        ],
+    )
+    memory = MemorySubmissionProblemRepository()
+    mongo = MongoSubmissionProblemRepository(mongomock.MongoClient()["test_db"]["submissions"])
+
+    stored = []
+    for repository in (memory, mongo):
+        repository.upload_submissions(problem)
+        stored.append(repository.get_submissions(slug).submissions[0].timestamp)
+
+    # 20:20 in Berlin is 19:20 UTC in winter
+    assert stored == [datetime(2025, 12, 1, 19, 20, 7, tzinfo=UTC)] * 2
+    assert all(ts.tzinfo is not None for ts in stored)
+
+
+def test_mongo_rosters_are_read_from_the_primary():
+    container = DependencyContainer()
+    container.config.repository.backend.override("mongo")
+    client = mongomock.MongoClient()
+    container.mongo.mongo_database.override(client["primary"])
+    # a secondary that has not replicated the import yet
+    container.mongo.student_read_collection.override(client["replica"]["students"])
+
+    student = container.student_repository().create(StudentModel(email="a@example.com"))
+    container.enrollment_repository_backend().add_enrollment(
+        EnrollmentModel(student_id=student.id, course_id="c1")
+    )
+
+    assert student.id in container.roster_indexes().get("c1")
@@ -0,0 +1,120 @@
+from datetime import UTC, datetime
+
+import mongomock
+import pytest
+
+from models.submission import SubmissionModel
+from repositories.mongo.best_submission_repository import MongoBestSubmissionRepository
+from repositories.mongo.migration import init_best_submission_collection
+
+pytestmark = pytest.mark.unit
+
+SLUG = "hsddigitallabor/problems/adg2025/mario"
+
+
+def make_submission(github_id, checks_passed, day, slug=SLUG):
+    return SubmissionModel(
+        archive=f"https://github.com/me50/user{github_id}/archive/abc.zip",
+        checks_passed=checks_passed,
+        checks_run=10,
+        github_id=github_id,
+        github_url=f"https://github.com/me50/user{github_id}/tree/abc",
+        github_username=f"user{github_id}",
+        name=None,
+        slug=slug,
+        timestamp=datetime(2025, 12, day, 12, 0, tzinfo=UTC),
+    )
+
+
+@pytest.fixture
+def collection():
+    collection = mongomock.MongoClient()["test_db"]["best_submissions"]
+    init_best_submission_collection(collection)
+    return collection
+
+
+@pytest.fixture
+def repo(collection):
+    return MongoBestSubmissionRepository(collection)
+
+
+def test_record_keeps_best_submission_per_student(repo, collection):
+    updated = repo.record(
+        SLUG,
+        [make_submission(1, 4, 1), make_submission(1, 10, 2), make_submission(1, 7, 3)],
+    )
+
+    assert updated == 1
+    assert collection.count_documents({}) == 1
+
+    (best,) = repo.get_for_slugs([SLUG])
+    assert best.checks_passed == 10
+    assert best.timestamp == datetime(2025, 12, 2, 12, 0, tzinfo=UTC)
+    assert best.last_timestamp == datetime(2025, 12, 3, 12, 0, tzinfo=UTC)
+
+
+def test_record_only_writes_students_that_changed(repo):
+    repo.record(SLUG, [make_submission(1, 10, 2), make_submission(2, 5, 2)])
+
+    # reimport of the full history with one better submission for student 2
+    updated = repo.record(
+        SLUG,
+        [make_submission(1, 10, 2), make_submission(2, 5, 2), make_submission(2, 8, 2)],
+    )
+
+    assert updated == 1
+    best = {b.github_id: b for b in repo.get_for_slugs([SLUG])}
+    assert best[1].checks_passed == 10
+    assert best[2].checks_passed == 8
+
+
+def test_record_keeps_earlier_submission_on_equal_score(repo):
+    repo.record(SLUG, [make_submission(1, 10, 2)])
+
+    updated = repo.record(SLUG, [make_submission(1, 10, 1)])
+
+    assert updated == 1
+    (best,) = repo.get_for_slugs([SLUG])
+    assert best.timestamp == datetime(2025, 12, 1, 12, 0, tzinfo=UTC)
+    assert best.last_timestamp == datetime(2025, 12, 2, 12, 0, tzinfo=UTC)
+
+
+class WriteAfterRead:
+    """Collection that runs ``write`` right after a find, like a concurrent import."""
+
+    def __init__(self, collection, write):
+        self._collection = collection
+        self._write = write
+
+    def find(self, *args, **kwargs):
+        docs = list(self._collection.find(*args, **kwargs))
+        self._write()
+        return docs
+
+    def __getattr__(self, name):
+        return getattr(self._collection, name)
+
+
+def test_record_does_not_overwrite_better_result_of_concurrent_import(repo, collection):
+    repo.record(SLUG, [make_submission(1, 4, 1)])
+    racing = MongoBestSubmissionRepository(
+        WriteAfterRead(collection, lambda: repo.record(SLUG, [make_submission(1, 10, 2)]))
+    )
+
+    racing.record(SLUG, [make_submission(1, 7, 3)])
+
+    (best,) = repo.get_for_slugs([SLUG])
+    assert best.checks_passed == 10
+    assert best.timestamp == datetime(2025, 12, 2, 12, 0, tzinfo=UTC)
+    assert best.last_timestamp == datetime(2025, 12, 3, 12, 0, tzinfo=UTC)
+
+
+def test_get_for_slugs_filters_by_github_ids(repo):
+    other = "hsddigitallabor/problems/adg2025/cash"
+    repo.record(SLUG, [make_submission(1, 10, 1), make_submission(2, 10, 1)])
+    repo.record(other, [make_submission(1, 10, 1, slug=other)])
+
+    result = repo.get_for_slugs([SLUG, other], github_ids=[1])
+
+    assert sorted(b.slug for b in result) == [other, SLUG]
+    assert repo.get_for_slugs([]) == []
@@ -0,0 +1,106 @@
+import mongomock
+import pytest
+
+from models.course import Course
+from models.enrollment import EnrollmentModel
+from models.grade_fingerprint import GradeFingerprintModel
+from models.student import StudentModel
+from repositories.mongo.course_repository import MongoCourseRepository
+from repositories.mongo.enrollment_repository import MongoEnrollmentRepository
+from repositories.mongo.grade_fingerprint_repository import MongoGradeFingerprintRepository
+from repositories.mongo.migration import init_enrollment_collection, init_student_collection
+from repositories.mongo.student_repository import MongoStudentRepository
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def db():
+    db = mongomock.MongoClient()["test_db"]
+    init_student_collection(db["students"])
+    init_enrollment_collection(db["enrollments"])
+    return db
+
+
+@pytest.fixture
+def repos(db):
+    courses = MongoCourseRepository(db["courses"], enrollment_collection=db["enrollments"])
+    students = MongoStudentRepository(db["students"], enrollment_collection=db["enrollments"])
+    enrollments = MongoEnrollmentRepository(db["enrollments"])
+
+    for course_id in ("c1", "c2"):
+        courses.create(Course(id=course_id, name=course_id, cs50_id=1))
+    for student_id in ("s1", "s2"):
+        students.create(StudentModel(id=student_id, email=f"{student_id}@example.com"))
+    enrollments.add_bulk_enrollments([
+        EnrollmentModel(student_id=s, course_id=c) for s in ("s1", "s2") for c in ("c1", "c2")
+    ])
+    return courses, students, enrollments
+
+
+def test_delete_course_removes_its_enrollments(repos):
+    courses, _, enrollments = repos
+
+    assert courses.delete("c1") is True
+
+    assert enrollments.get_students_for_course("c1") == []
+    assert set(enrollments.get_students_for_course("c2")) == {"s1", "s2"}
+
+
+def test_delete_student_removes_its_enrollments(repos):
+    _, students, enrollments = repos
+
+    assert students.delete("s1") is True
+
+    assert enrollments.get_courses_for_student("s1") == []
+    assert enrollments.get_students_for_course("c1") == ["s2"]
+
+
+def test_delete_missing_course_still_removes_dangling_enrollments(db, repos):
+    courses, _, enrollments = repos
+    db["courses"].delete_one({"id": "c2"})
+
+    assert courses.delete("c2") is False
+
+    assert enrollments.get_students_for_course("c2") == []
+
+
+def test_delete_without_enrollment_collection_keeps_enrollments(db, repos):
+    _, _, enrollments = repos
+
+    assert MongoCourseRepository(db["courses"]).delete("c1") is True
+
+    assert set(enrollments.get_students_for_course("c1")) == {"s1", "s2"}
+
+
+@pytest.fixture
+def fingerprints(db):
+    repository = MongoGradeFingerprintRepository(db["grade_fingerprints"])
+    repository.save([
+        GradeFingerprintModel(course_id=c, student_id=s, slug="mario", fingerprint="f", passed=True)
+        for s in ("s1", "s2")
+        for c in ("c1", "c2")
+    ])
+    return repository
+
+
+def test_delete_course_removes_its_grade_fingerprints(db, fingerprints):
+    courses = MongoCourseRepository(
+        db["courses"], grade_fingerprint_collection=db["grade_fingerprints"]
+    )
+
+    courses.delete("c1")
+
+    assert fingerprints.get_for_course("c1") == []
+    assert len(fingerprints.get_for_course("c2")) == 2
+
+
+def test_delete_student_removes_its_grade_fingerprints(db, fingerprints):
+    students = MongoStudentRepository(
+        db["students"], grade_fingerprint_collection=db["grade_fingerprints"]
+    )
+
+    students.delete("s1")
+
+    for course_id in ("c1", "c2"):
+        assert [f.student_id for f in fingerprints.get_for_course(course_id)] == ["s2"]
@@ -0,0 +1,35 @@
+from types import SimpleNamespace
+
+import pytest
+
+from repositories.mongo.command_timing import CommandTiming
+from request_timing import start_request_timing, stop_request_timing
+
+pytestmark = pytest.mark.unit
+
+
+def test_command_timing_records_succeeded_and_failed_commands():
+    listener = CommandTiming()
+    timing, token = start_request_timing()
+    try:
+        listener.started(SimpleNamespace(command_name="find"))
+        listener.succeeded(SimpleNamespace(command_name="find", duration_micros=1500))
+        listener.succeeded(SimpleNamespace(command_name="find", duration_micros=500))
+        listener.failed(SimpleNamespace(command_name="insert", duration_micros=1000))
+    finally:
+        stop_request_timing(token)
+
+    segment = timing.segments()["mongo"]
+    assert segment.count == 3
+    assert segment.seconds == pytest.approx(0.003)
+    assert timing.operations("mongo") == {"find": 2, "insert": 1}
+
+
+def test_command_timing_ignores_commands_outside_of_requests():
+    listener = CommandTiming()
+
+    listener.succeeded(SimpleNamespace(command_name="find", duration_micros=1500))
+
+    timing, token = start_request_timing()
+    stop_request_timing(token)
+    assert timing.segments() == {}
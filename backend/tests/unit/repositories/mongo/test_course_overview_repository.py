@@ -0,0 +1,235 @@
+import os
+from datetime import UTC, datetime
+
+import mongomock
+import pytest
+from pymongo import MongoClient
+
+from repositories.mongo.course_overview_repository import (
+    MongoCourseOverviewRepository,
+    course_overview_pipeline,
+)
+from repositories.mongo.migration import (
+    init_best_submission_collection,
+    init_enrollment_collection,
+    init_student_collection,
+)
+
+pytestmark = pytest.mark.unit
+
+requires_mongo = pytest.mark.skipif(
+    "MONGO_TEST_URI" not in os.environ, reason="needs a real MongoDB"
+)
+
+MARIO = "hsddigitallabor/problems/adg2025/mario"
+CASH = "hsddigitallabor/problems/adg2025/cash"
+
+
+def best(github_id, slug, score):
+    timestamp = datetime(2025, 12, 1, tzinfo=UTC)
+    return {
+        "slug": slug,
+        "github_id": github_id,
+        "github_username": f"user{github_id}",
+        "score": score,
+        "checks_passed": int(score * 10),
+        "checks_run": 10,
+        "timestamp": timestamp,
+        "last_timestamp": timestamp,
+    }
+
+
+def seed(db):
+    init_student_collection(db["students"])
+    init_enrollment_collection(db["enrollments"])
+    init_best_submission_collection(db["best_submissions"])
+
+    db["courses"].insert_many([
+        {"id": "c1", "name": "ADG", "cs50_id": 1, "exercise_ids": [MARIO, CASH]},
+        {"id": "c2", "name": "Empty", "cs50_id": 2, "exercise_ids": [MARIO]},
+    ])
+    db["students"].insert_many([
+        {"id": "s1", "email": "b@example.com", "name": "Bea", "github_id": 1},
+        {"id": "s2", "email": "a@example.com", "name": "Ada", "github_id": 2},
+        {"id": "s3", "email": "c@example.com", "name": "Cy", "github_id": None},
+    ])
+    db["enrollments"].insert_many([
+        {"student_id": s, "course_id": "c1"} for s in ("s1", "s2", "s3")
+    ])
+    db["best_submissions"].insert_many([
+        best(1, MARIO, 1.0),
+        best(1, CASH, 0.5),
+        best(2, CASH, 1.0),
+        # not part of the course
+        best(2, "hsddigitallabor/problems/adg2025/other", 1.0),
+    ])
+
+
+def best_submission_lookup(pipeline):
+    return next(
+        stage["$lookup"]
+        for stage in pipeline
+        if "$lookup" in stage and stage["$lookup"]["as"] == "best"
+    )
+
+
+def _bind(expr, let, joined):
+    """Rewrites a lookup ``$expr`` into a ``$filter`` condition over the joined documents."""
+    if isinstance(expr, dict):
+        return {key: _bind(value, let, joined) for key, value in expr.items()}
+    if isinstance(expr, list):
+        return [_bind(value, let, joined) for value in expr]
+    if isinstance(expr, str) and expr.startswith("$$"):
+        return let[expr[2:]]
+    if isinstance(expr, str) and expr.startswith("$"):
+        return f"$${joined}.{expr[1:]}"
+    return expr
+
+
+def without_pipeline_lookup(pipeline):
+    """
+    Runs the best submission lookup the way mongomock supports, which has no
+    pipeline lookups: an equality join on ``github_id`` whose documents are then
+    filtered with the lookup's own ``$match`` expression.
+    """
+    lookup = best_submission_lookup(pipeline)
+    index = pipeline.index({"$lookup": lookup})
+    condition = _bind(lookup["pipeline"][0]["$match"]["$expr"], lookup["let"], "joined")
+    return [
+        *pipeline[:index],
+        {
+            "$lookup": {
+                "from": lookup["from"],
+                "localField": lookup["let"]["github_id"].removeprefix("$"),
+                "foreignField": "github_id",
+                "as": lookup["as"],
+            }
+        },
+        {
+            "$set": {
+                lookup["as"]: {
+                    "$filter": {"input": f"${lookup['as']}", "as": "joined", "cond": condition}
+                }
+            }
+        },
+        *pipeline[index + 1 :],
+    ]
+
+
+class MongomockCollection:
+    """Collection that rewrites aggregations into stages mongomock can run."""
+
+    def __init__(self, collection):
+        self._collection = collection
+
+    def aggregate(self, pipeline, *args, **kwargs):
+        return self._collection.aggregate(without_pipeline_lookup(pipeline), *args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._collection, name)
+
+
+@pytest.fixture
+def mongo_db():
+    client = MongoClient(os.environ["MONGO_TEST_URI"])
+    db = client["course_overview_test"]
+    client.drop_database(db.name)
+    try:
+        seed(db)
+        yield db
+    finally:
+        client.drop_database(db.name)
+        client.close()
+
+
+@pytest.fixture(params=["mongomock", pytest.param("mongo", marks=requires_mongo)])
+def courses(request):
+    if request.param == "mongo":
+        return request.getfixturevalue("mongo_db")["courses"]
+
+    db = mongomock.MongoClient()["test_db"]
+    seed(db)
+    return MongomockCollection(db["courses"])
+
+
+@pytest.fixture
+def repo(courses):
+    return MongoCourseOverviewRepository(courses)
+
+
+def test_best_submission_lookup_is_limited_to_course_exercises():
+    lookup = best_submission_lookup(course_overview_pipeline("c1", 1.0))
+
+    assert lookup["let"] == {"github_id": "$student.github_id", "exercise_ids": "$exercise_ids"}
+    assert lookup["pipeline"][0] == {
+        "$match": {
+            "$expr": {
+                "$and": [
+                    {"$eq": ["$github_id", "$$github_id"]},
+                    {"$in": ["$slug", "$$exercise_ids"]},
+                ]
+            }
+        }
+    }
+
+
+def test_best_submission_lookup_skips_other_courses(courses):
+    pipeline = course_overview_pipeline("c1", 1.0)
+    until_lookup = pipeline[: pipeline.index({"$lookup": best_submission_lookup(pipeline)}) + 1]
+
+    joined = {best["slug"] for row in courses.aggregate(until_lookup) for best in row["best"]}
+
+    assert joined == {MARIO, CASH}
+
+
+def test_get_overview_lists_students_with_passed_exercises(repo):
+    overview = repo.get_overview("c1")
+
+    assert overview.course_id == "c1"
+    assert overview.exercise_ids == [MARIO, CASH]
+    assert [s.email for s in overview.students] == [
+        "a@example.com",
+        "b@example.com",
+        "c@example.com",
+    ]
+    by_id = {s.student_id: s for s in overview.students}
+    assert by_id["s1"].passed_exercise_ids == [MARIO]
+    assert by_id["s2"].passed_exercise_ids == [CASH]
+    assert by_id["s3"].passed_exercise_ids == []
+    assert by_id["s3"].github_id is None
+
+
+def test_get_overview_respects_pass_threshold(repo):
+    overview = repo.get_overview("c1", pass_threshold=0.5)
+
+    by_id = {s.student_id: s for s in overview.students}
+    assert by_id["s1"].passed_exercise_ids == [MARIO, CASH]
+    assert by_id["s1"].passed_count == 2
+
+
+def test_get_overview_without_enrollments(repo):
+    overview = repo.get_overview("c2")
+
+    assert overview.exercise_ids == [MARIO]
+    assert overview.students == []
+
+
+def test_get_overview_not_found(repo):
+    assert repo.get_overview("missing") is None
+
+
+@requires_mongo
+def test_course_overview_pipeline_uses_indexes(mongo_db):
+    mongo_db["courses"].create_index("id", unique=True)
+
+    explain = mongo_db.command(
+        "explain",
+        {"aggregate": "courses", "pipeline": course_overview_pipeline("c1", 1.0), "cursor": {}},
+        verbosity="executionStats",
+    )
+
+    assert "COLLSCAN" not in str(explain)
+    for stage in explain.get("stages", []):
+        lookup = stage.get("$lookup")
+        if lookup and "collectionScans" in stage:
+            assert stage["collectionScans"] == 0
@@ -83,3 +83,66 @@ def test_delete_course(course_repository):
 def test_delete_course_not_found(course_repository):
     deleted = course_repository.delete("missing")
     assert deleted is False
+
+
+def test_patch_course_sets_only_given_fields(course_repository):
+    course = Course(name="Course 1", cs50_id=50, exercise_ids=["ex1"])
+    course_repository.create(course)
+
+    result = course_repository.patch(course.id, {"name": "Renamed"})
+
+    assert result.name == "Renamed"
+    assert result.cs50_id == 50
+    assert result.exercise_ids == ["ex1"]
+    assert course_repository.get(course.id) == result
+
+
+def test_patch_course_adds_exercise_ids_once(course_repository):
+    course = Course(name="Course 1", exercise_ids=["ex1"])
+    course_repository.create(course)
+
+    result = course_repository.patch(course.id, {}, add_exercise_ids=["ex1", "ex2"])
+
+    assert result.exercise_ids == ["ex1", "ex2"]
+
+
+def test_patch_course_removes_exercise_ids(course_repository):
+    course = Course(name="Course 1", exercise_ids=["ex1", "ex2", "ex3"])
+    course_repository.create(course)
+
+    result = course_repository.patch(
+        course.id, {"name": "Renamed"}, remove_exercise_ids=["ex1", "ex3"]
+    )
+
+    assert result.name == "Renamed"
+    assert result.exercise_ids == ["ex2"]
+
+
+def test_patch_course_without_changes_returns_course(course_repository):
+    course = Course(name="Course 1")
+    course_repository.create(course)
+
+    assert course_repository.patch(course.id, {}) == course
+
+
+def test_patch_course_not_found(course_repository):
+    assert course_repository.patch("missing", {"name": "Renamed"}) is None
+
+
+def test_patch_course_rejects_id_and_unknown_fields(course_repository):
+    course = Course(name="Course 1")
+    course_repository.create(course)
+
+    with pytest.raises(ValueError, match="id, unknown"):
+        course_repository.patch(course.id, {"id": "other", "unknown": 1})
+
+
+def test_patch_course_rejects_conflicting_exercise_changes(course_repository):
+    course = Course(name="Course 1")
+    course_repository.create(course)
+
+    with pytest.raises(ValueError):
+        course_repository.patch(course.id, {}, add_exercise_ids=["a"], remove_exercise_ids=["b"])
+
+    with pytest.raises(ValueError):
+        course_repository.patch(course.id, {"exercise_ids": []}, add_exercise_ids=["a"])
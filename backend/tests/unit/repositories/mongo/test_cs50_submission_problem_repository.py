@@ -149,3 +149,89 @@ def test_upload_and_get_with_sample_cs50_json(repo):
     assert loaded is not None
     assert loaded.slug == slug
     assert len(loaded.submissions) == len(items)
+
+
+def make_me50_submission(slug: str, username: str, github_id: int, commit: str, name=None):
+    return SubmissionModel.model_validate({
+        "archive": f"https://github.com/me50/{username}/archive/{commit}.zip",
+        "checks_passed": 13,
+        "checks_run": 13,
+        "github_id": github_id,
+        "github_url": f"https://github.com/me50/{username}/tree/{commit}",
+        "github_username": username,
+        "name": name,
+        "slug": slug,
+        "style50_score": 1.0,
+        "timestamp": "2025-12-01T20:53:16+01:00",
+    })
+
+
+def test_upload_stores_compact_layout(repo, collection):
+    slug = "hsddigitallabor/problems/adg2025/intervals"
+    submissions = [
+        make_me50_submission(slug, "octocat", 1, "a" * 40),
+        make_me50_submission(slug, "octocat", 1, "b" * 40, name="Octo Cat"),
+        make_me50_submission(slug, "hubot", 2, "c" * 40),
+    ]
+
+    repo.upload_submissions(CS50SubmissionProblemModel(slug=slug, submissions=submissions))
+
+    doc = collection.find_one({"slug": slug})
+    assert "submissions" not in doc
+    assert doc["users"] == ["octocat", "hubot"]
+    assert doc["s"]["h"] == ["a" * 40, "b" * 40, "c" * 40]
+    assert doc["x"] == {}
+    assert doc["n"] == {"1": "Octo Cat"}
+
+
+def test_compact_layout_roundtrip_restores_derived_fields(repo):
+    slug = "hsddigitallabor/problems/adg2025/intervals"
+    submissions = [
+        make_me50_submission(slug, "octocat", 1, "a" * 40),
+        make_me50_submission(slug, "hubot", 2, "c" * 40, name="Hubot"),
+    ]
+
+    repo.upload_submissions(CS50SubmissionProblemModel(slug=slug, submissions=submissions))
+
+    loaded = repo.get_submissions(slug)
+    assert loaded.submissions == submissions
+
+
+def test_get_submissions_reads_legacy_layout(repo, collection):
+    slug = "legacy/slug"
+    submission = make_me50_submission(slug, "octocat", 1, "a" * 40)
+    legacy = CS50SubmissionProblemModel(slug=slug, submissions=[submission])
+    collection.insert_one(legacy.model_dump())
+
+    loaded = repo.get_submissions(slug)
+
+    assert loaded is not None
+    assert loaded.id == legacy.id
+    assert loaded.submissions[0].github_url == submission.github_url
+    assert loaded.submissions[0].timestamp == submission.timestamp
+
+
+def test_upload_replaces_legacy_layout(repo, collection):
+    slug = "legacy/slug"
+    submission = make_me50_submission(slug, "octocat", 1, "a" * 40)
+    collection.insert_one(
+        CS50SubmissionProblemModel(slug=slug, submissions=[submission]).model_dump()
+    )
+
+    repo.upload_submissions(CS50SubmissionProblemModel(slug=slug, submissions=[submission]))
+
+    doc = collection.find_one({"slug": slug})
+    assert "submissions" not in doc
+    assert len(repo.get_submissions(slug).submissions) == 1
+
+
+def test_get_submissions_for_slugs(repo):
+    slugs = [f"hsddigitallabor/problems/adg2025/problem{i}" for i in range(3)]
+    for i, slug in enumerate(slugs):
+        submission = make_me50_submission(slug, "octocat", 1, str(i) * 40)
+        repo.upload_submissions(CS50SubmissionProblemModel(slug=slug, submissions=[submission]))
+
+    loaded = repo.get_submissions_for_slugs([slugs[0], slugs[2], "unknown"])
+
+    assert sorted(p.slug for p in loaded) == [slugs[0], slugs[2]]
+    assert repo.get_submissions_for_slugs([]) == []
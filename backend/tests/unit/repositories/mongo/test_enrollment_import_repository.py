@@ -0,0 +1,103 @@
+import mongomock
+import pytest
+
+from models.student import StudentModel
+from repositories.mongo.enrollment_import_repository import MongoEnrollmentImportRepository
+from repositories.mongo.migration import (
+    init_enrollment_collection,
+    init_enrollment_import_collection,
+    init_student_collection,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def db():
+    db = mongomock.MongoClient()["test_db"]
+    init_student_collection(db["students"])
+    init_enrollment_collection(db["enrollments"])
+    init_enrollment_import_collection(db["enrollment_imports"])
+    return db
+
+
+@pytest.fixture
+def repo(db):
+    return MongoEnrollmentImportRepository(
+        db["enrollment_imports"], db["students"], db["enrollments"]
+    )
+
+
+def students(*emails):
+    return [StudentModel(email=email, name=email.split("@")[0]) for email in emails]
+
+
+def test_import_batch_creates_students_enrollments_and_checkpoint(db, repo):
+    result = repo.import_batch("imp", "c1", students("a@example.com", "b@example.com"), 3)
+
+    assert result.students_created == 2
+    assert result.enrollments_created == 2
+    assert {s.email for s in result.students} == {"a@example.com", "b@example.com"}
+    assert db["enrollments"].count_documents({"course_id": "c1"}) == 2
+    assert repo.get_checkpoint("imp") == 3
+
+
+def test_import_batch_keeps_existing_students(db, repo):
+    existing = StudentModel(email="a@example.com", name="Existing")
+    db["students"].insert_one(existing.model_dump())
+
+    result = repo.import_batch("imp", "c1", students("a@example.com"), 1)
+
+    assert result.students_created == 0
+    assert result.students[0].id == existing.id
+    assert result.students[0].name == "Existing"
+
+
+def test_retried_batch_does_not_duplicate(db, repo):
+    batch = students("a@example.com", "b@example.com")
+    repo.import_batch("imp", "c1", batch, 2)
+
+    result = repo.import_batch("imp", "c1", students("a@example.com", "b@example.com"), 2)
+
+    assert result.students_created == 0
+    assert result.enrollments_created == 0
+    assert db["students"].count_documents({}) == 2
+    assert db["enrollments"].count_documents({}) == 2
+
+
+def test_batch_of_skipped_rows_only_moves_checkpoint(repo):
+    result = repo.import_batch("imp", "c1", [], 5)
+
+    assert result.students == []
+    assert repo.get_checkpoint("imp") == 5
+
+
+def test_finish_removes_checkpoint(repo):
+    repo.import_batch("imp", "c1", students("a@example.com"), 1)
+
+    repo.finish("imp")
+
+    assert repo.get_checkpoint("imp") == 0
+
+
+def test_abandoned_checkpoints_expire(db, repo):
+    repo.import_batch("imp", "c1", students("a@example.com"), 1)
+
+    index = db["enrollment_imports"].index_information()["updated_at_ttl_idx"]
+
+    assert index["key"] == [("updated_at", 1)]
+    assert index["expireAfterSeconds"] > 0
+    assert "updated_at" in db["enrollment_imports"].find_one({"_id": "imp"})
+
+
+def test_import_batch_matches_students_not_yet_backfilled(db, repo):
+    # stored before the email_key backfill (schema migration 3) has run
+    legacy = StudentModel(email="a@example.com", name="Existing")
+    db["students"].insert_one(legacy.model_dump(exclude={"email_key"}))
+
+    result = repo.import_batch("imp", "c1", students("a@example.com"), 1)
+
+    assert result.students_created == 0
+    assert [s.id for s in result.students] == [legacy.id]
+    assert db["students"].count_documents({}) == 1
+    assert db["enrollments"].count_documents({"student_id": legacy.id, "course_id": "c1"}) == 1
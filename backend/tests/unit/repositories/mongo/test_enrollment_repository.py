@@ -1,6 +1,11 @@
+import os
+
 import pytest
+from pymongo import MongoClient
 
 from models.enrollment import EnrollmentModel
+from repositories.mongo.enrollment_repository import ID_PROJECTION
+from repositories.mongo.migration import init_enrollment_collection
 
 pytestmark = pytest.mark.unit
 
@@ -93,7 +98,77 @@ def test_add_bulk_enrollments(enrollment_repository):
     }
 
 
+def test_add_bulk_enrollments_again_adds_no_duplicates(enrollment_repository):
+    enrollments = [
+        EnrollmentModel(student_id="student_1", course_id="course_1"),
+        EnrollmentModel(student_id="student_2", course_id="course_1"),
+    ]
+    enrollment_repository.add_bulk_enrollments(enrollments)
+
+    enrollment_repository.add_bulk_enrollments(enrollments)
+
+    assert sorted(enrollment_repository.get_students_for_course("course_1")) == [
+        "student_1",
+        "student_2",
+    ]
+
+
 def test_add_bulk_enrollments_empty_list(enrollment_repository):
     enrollment_repository.add_bulk_enrollments([])
 
     assert enrollment_repository.get_courses_for_student("student_1") == []
+
+
+BULK_ENROLLMENTS = [
+    EnrollmentModel(student_id="student_1", course_id="course_1"),
+    EnrollmentModel(student_id="student_1", course_id="course_2"),
+    EnrollmentModel(student_id="student_2", course_id="course_1"),
+    EnrollmentModel(student_id="student_3", course_id="course_3"),
+]
+
+
+def test_get_courses_for_students(enrollment_repository):
+    enrollment_repository.add_bulk_enrollments(BULK_ENROLLMENTS)
+
+    courses = enrollment_repository.get_courses_for_students(["student_1", "student_2", "nobody"])
+
+    assert set(courses) == {"student_1", "student_2", "nobody"}
+    assert set(courses["student_1"]) == {"course_1", "course_2"}
+    assert courses["student_2"] == ["course_1"]
+    assert courses["nobody"] == []
+
+
+def test_get_students_for_courses(enrollment_repository):
+    enrollment_repository.add_bulk_enrollments(BULK_ENROLLMENTS)
+
+    students = enrollment_repository.get_students_for_courses(["course_1", "course_3", "empty"])
+
+    assert set(students["course_1"]) == {"student_1", "student_2"}
+    assert students["course_3"] == ["student_3"]
+    assert students["empty"] == []
+
+
+def test_batch_lookups_with_no_ids(enrollment_repository):
+    assert enrollment_repository.get_courses_for_students([]) == {}
+    assert enrollment_repository.get_students_for_courses([]) == {}
+
+
+@pytest.mark.skipif("MONGO_TEST_URI" not in os.environ, reason="explain plans need a real MongoDB")
+@pytest.mark.parametrize(
+    ("field", "values"),
+    [("student_id", ["student_1", "student_2"]), ("course_id", ["course_1", "course_3"])],
+)
+def test_batch_lookups_are_covered_queries(field, values):
+    client = MongoClient(os.environ["MONGO_TEST_URI"])
+    collection = client["enrollment_explain_test"]["enrollments"]
+    try:
+        init_enrollment_collection(collection)
+        collection.insert_many([e.model_dump() for e in BULK_ENROLLMENTS])
+
+        explain = collection.find({field: {"$in": values}}, ID_PROJECTION).explain()
+
+        assert explain["executionStats"]["totalDocsExamined"] == 0
+        assert "FETCH" not in str(explain["queryPlanner"]["winningPlan"])
+    finally:
+        client.drop_database("enrollment_explain_test")
+        client.close()
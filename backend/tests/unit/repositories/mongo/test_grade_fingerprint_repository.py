@@ -0,0 +1,49 @@
+import mongomock
+import pytest
+
+from models.grade_fingerprint import GradeFingerprintModel
+from repositories.mongo.grade_fingerprint_repository import MongoGradeFingerprintRepository
+from repositories.mongo.migration import init_grade_fingerprint_collection
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def repo():
+    collection = mongomock.MongoClient()["test_db"]["grade_fingerprints"]
+    init_grade_fingerprint_collection(collection)
+    return MongoGradeFingerprintRepository(collection)
+
+
+def make_fingerprint(course_id="c1", student_id="s1", slug="mario", fingerprint="a", passed=False):
+    return GradeFingerprintModel(
+        course_id=course_id,
+        student_id=student_id,
+        slug=slug,
+        fingerprint=fingerprint,
+        passed=passed,
+    )
+
+
+def test_save_and_get_for_course(repo):
+    repo.save([make_fingerprint(), make_fingerprint(slug="cash"), make_fingerprint(course_id="c2")])
+
+    result = repo.get_for_course("c1")
+
+    assert sorted(f.slug for f in result) == ["cash", "mario"]
+
+
+def test_save_replaces_fingerprint_of_same_pair(repo):
+    repo.save([make_fingerprint()])
+
+    repo.save([make_fingerprint(fingerprint="b", passed=True)])
+
+    (stored,) = repo.get_for_course("c1")
+    assert stored.fingerprint == "b"
+    assert stored.passed is True
+
+
+def test_save_nothing(repo):
+    repo.save([])
+
+    assert repo.get_for_course("c1") == []
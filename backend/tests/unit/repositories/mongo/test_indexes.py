@@ -0,0 +1,144 @@
+import mongomock
+import pytest
+from pymongo.errors import OperationFailure
+
+from repositories.mongo.indexes import (
+    INDEX_VERSIONS_COLLECTION,
+    REBUILD_SUFFIX,
+    CollectionIndexes,
+    IndexSpec,
+    ensure_indexes,
+)
+
+pytestmark = pytest.mark.unit
+
+ID_INDEX = IndexSpec("id_unique_idx", (("id", 1),), unique=True)
+
+
+@pytest.fixture
+def collection():
+    client = mongomock.MongoClient()
+    return client["test_db"]["items"]
+
+
+def test_ensure_indexes_creates_missing_indexes(collection):
+    report = ensure_indexes(collection, CollectionIndexes(version=1, indexes=(ID_INDEX,)))
+
+    assert report.created == ["id_unique_idx"]
+    assert report.changed
+    assert collection.index_information()["id_unique_idx"]["unique"] is True
+
+
+def test_ensure_indexes_is_idempotent(collection):
+    declaration = CollectionIndexes(version=1, indexes=(ID_INDEX,))
+    ensure_indexes(collection, declaration)
+
+    report = ensure_indexes(collection, declaration)
+
+    assert report.unchanged == ["id_unique_idx"]
+    assert report.previous_version == 1
+    assert not report.changed
+
+
+def test_ensure_indexes_rebuilds_changed_definition(collection):
+    collection.create_index("id", name="id_unique_idx")
+
+    report = ensure_indexes(collection, CollectionIndexes(version=2, indexes=(ID_INDEX,)))
+
+    assert report.rebuilt == ["id_unique_idx"]
+    assert collection.index_information()["id_unique_idx"]["unique"] is True
+
+
+def test_ensure_indexes_drops_retired_indexes(collection):
+    collection.create_index("legacy", name="legacy_idx")
+
+    report = ensure_indexes(
+        collection, CollectionIndexes(version=2, indexes=(ID_INDEX,), retired=("legacy_idx",))
+    )
+
+    assert report.dropped == ["legacy_idx"]
+    assert "legacy_idx" not in collection.index_information()
+
+
+def test_ensure_indexes_rebuilds_changed_expiry(collection):
+    ttl = IndexSpec("created_ttl_idx", (("created", 1),), expire_after_seconds=60)
+    ensure_indexes(collection, CollectionIndexes(version=1, indexes=(ttl,)))
+
+    longer = IndexSpec("created_ttl_idx", (("created", 1),), expire_after_seconds=3600)
+    report = ensure_indexes(collection, CollectionIndexes(version=2, indexes=(longer,)))
+
+    assert report.rebuilt == ["created_ttl_idx"]
+    assert collection.index_information()["created_ttl_idx"]["expireAfterSeconds"] == 3600
+
+
+def test_ensure_indexes_records_version(collection):
+    ensure_indexes(collection, CollectionIndexes(version=3, indexes=(ID_INDEX,)))
+
+    recorded = collection.database[INDEX_VERSIONS_COLLECTION].find_one({"_id": "items"})
+
+    assert recorded["version"] == 3
+    assert recorded["indexes"] == ["id_unique_idx"]
+
+
+def test_ensure_indexes_reports_failed_unique_index(collection):
+    collection.insert_many([{"id": "same"}, {"id": "same"}])
+
+    report = ensure_indexes(collection, CollectionIndexes(version=1, indexes=(ID_INDEX,)))
+
+    assert "id_unique_idx" in report.failed
+    assert report.created == []
+
+
+def test_failed_rebuild_keeps_the_existing_index(collection):
+    collection.create_index("id", name="id_unique_idx")
+    collection.insert_many([{"id": "same"}, {"id": "same"}])
+
+    report = ensure_indexes(collection, CollectionIndexes(version=2, indexes=(ID_INDEX,)))
+
+    assert "id_unique_idx" in report.failed
+    assert report.rebuilt == []
+    indexes = collection.index_information()
+    assert indexes["id_unique_idx"]["key"] == [("id", 1)]
+    assert not indexes["id_unique_idx"].get("unique")
+    assert "id_unique_idx_rebuild" not in indexes
+
+
+def test_retired_indexes_are_kept_while_a_declared_index_fails(collection):
+    collection.create_index("legacy", name="legacy_idx")
+    collection.insert_many([{"id": "same"}, {"id": "same"}])
+
+    report = ensure_indexes(
+        collection, CollectionIndexes(version=2, indexes=(ID_INDEX,), retired=("legacy_idx",))
+    )
+
+    assert "id_unique_idx" in report.failed
+    assert report.dropped == []
+    assert "legacy_idx" in collection.index_information()
+
+
+class ConflictingTemporaryIndex:
+    """Collection that rejects the temporary index like a server does for an option conflict."""
+
+    def __init__(self, collection):
+        self._collection = collection
+
+    def create_index(self, keys, **options):
+        if options["name"].endswith(REBUILD_SUFFIX):
+            msg = "Index already exists with different options"
+            raise OperationFailure(msg, code=85)
+        return self._collection.create_index(keys, **options)
+
+    def __getattr__(self, name):
+        return getattr(self._collection, name)
+
+
+def test_rebuild_without_temporary_index_restores_old_index_on_failure(collection):
+    collection.create_index("id", name="id_unique_idx")
+    collection.insert_many([{"id": "same"}, {"id": "same"}])
+
+    report = ensure_indexes(
+        ConflictingTemporaryIndex(collection), CollectionIndexes(version=2, indexes=(ID_INDEX,))
+    )
+
+    assert "id_unique_idx" in report.failed
+    assert collection.index_information()["id_unique_idx"]["key"] == [("id", 1)]
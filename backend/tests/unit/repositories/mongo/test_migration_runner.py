@@ -0,0 +1,321 @@
+from typing import ClassVar
+
+import mongomock
+import pytest
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from models.cs50_submission_problem import CS50SubmissionProblemModel
+from models.submission import SubmissionModel
+from repositories.mongo.best_submission_repository import MongoBestSubmissionRepository
+from repositories.mongo.cs50_submission_problem_repository import (
+    MongoSubmissionProblemRepository,
+)
+from repositories.mongo.migration import init_enrollment_collection, init_student_collection
+from repositories.mongo.migration_runner import (
+    MIGRATIONS_COLLECTION,
+    BackfillMigration,
+    MigrationRunner,
+)
+from repositories.mongo.schema_migrations import (
+    BestSubmissionsBackfill,
+    CompactSubmissionLayoutMigration,
+    StudentEmailKeyBackfill,
+)
+from repositories.mongo.submission_codec import COMPACT_LAYOUT
+
+pytestmark = pytest.mark.unit
+
+
+class AddFlagMigration(BackfillMigration):
+    version = 1
+    name = "add_flag"
+    collection = "items"
+    query: ClassVar[dict] = {"flag": {"$exists": False}}
+
+    def __init__(self):
+        self.finalized = False
+
+    def transform(self, document):
+        return [UpdateOne({"_id": document["_id"]}, {"$set": {"flag": True}})]
+
+    def finalize(self, database):
+        self.finalized = True
+
+
+@pytest.fixture
+def database():
+    return mongomock.MongoClient()["test_db"]
+
+
+@pytest.fixture
+def sleeps():
+    return []
+
+
+def make_runner(database, migrations, sleeps, batch_size=2):
+    return MigrationRunner(
+        database, migrations, batch_size=batch_size, throttle_seconds=0.5, sleep=sleeps.append
+    )
+
+
+def test_backfill_runs_in_batches_and_records_version(database, sleeps):
+    database["items"].insert_many([{"n": i} for i in range(5)])
+    migration = AddFlagMigration()
+
+    results = make_runner(database, [migration], sleeps).run()
+
+    assert results[0].status == "applied"
+    assert results[0].processed == 5
+    assert results[0].batches == 3
+    assert sleeps == [0.5, 0.5]
+    assert migration.finalized
+    assert database["items"].count_documents({"flag": True}) == 5
+
+    state = database[MIGRATIONS_COLLECTION].find_one({"_id": 1})
+    assert state["status"] == "applied"
+    assert state["processed"] == 5
+
+
+def test_applied_migration_is_skipped(database, sleeps):
+    database["items"].insert_one({"n": 1})
+    make_runner(database, [AddFlagMigration()], sleeps).run()
+
+    results = make_runner(database, [AddFlagMigration()], sleeps).run()
+
+    assert results[0].status == "skipped"
+
+
+def test_interrupted_migration_resumes_from_checkpoint(database, sleeps):
+    database["items"].insert_many([{"n": i} for i in range(5)])
+    runner = make_runner(database, [AddFlagMigration()], sleeps)
+
+    def stop_after_first_batch(_seconds):
+        runner.stop()
+
+    runner._sleep = stop_after_first_batch
+    first = runner.run()
+
+    assert first[0].status == "interrupted"
+    assert database["items"].count_documents({"flag": True}) == 2
+
+    database["items"].update_many({}, {"$unset": {"flag": ""}})
+    second = make_runner(database, [AddFlagMigration()], sleeps).run()
+
+    # documents before the checkpoint are not visited again
+    assert second[0].status == "applied"
+    assert second[0].processed == 3
+    assert database["items"].count_documents({"flag": True}) == 3
+
+
+def test_migration_leased_by_other_runner_is_not_run(database, sleeps):
+    database["items"].insert_one({"n": 1})
+    other = make_runner(database, [AddFlagMigration()], sleeps)
+    assert other._acquire(AddFlagMigration())
+
+    results = make_runner(database, [AddFlagMigration()], sleeps).run()
+
+    assert results[0].status == "locked"
+    assert database["items"].count_documents({"flag": True}) == 0
+
+
+def test_compact_submission_layout_migration(database, sleeps):
+    slug = "hsddigitallabor/problems/adg2025/intervals"
+    submission = SubmissionModel(
+        archive="https://github.com/me50/octocat/archive/abc.zip",
+        checks_passed=13,
+        checks_run=13,
+        github_id=1,
+        github_url="https://github.com/me50/octocat/tree/abc",
+        github_username="octocat",
+        name=None,
+        slug=slug,
+        timestamp="2025-12-01T20:53:16+01:00",
+    )
+    legacy = CS50SubmissionProblemModel(slug=slug, submissions=[submission])
+    collection = database["cs50_submissions"]
+    collection.insert_one(legacy.model_dump())
+
+    results = make_runner(database, [CompactSubmissionLayoutMigration()], sleeps).run()
+
+    assert results[0].status == "applied"
+    document = collection.find_one({"slug": slug})
+    assert document["layout"] == COMPACT_LAYOUT
+    assert "submissions" not in document
+
+    loaded = MongoSubmissionProblemRepository(collection).get_submissions(slug)
+    assert loaded.id == legacy.id
+    assert loaded.submissions == [submission]
+
+
+def test_compact_submission_layout_migration_keeps_concurrent_upload(database, sleeps):
+    slug = "hsddigitallabor/problems/adg2025/intervals"
+    collection = database["cs50_submissions"]
+    legacy = CS50SubmissionProblemModel(slug=slug, submissions=[])
+    collection.insert_one(legacy.model_dump())
+    uploaded = CS50SubmissionProblemModel(
+        slug=slug,
+        submissions=[
+            SubmissionModel(
+                archive="https://github.com/me50/octocat/archive/def.zip",
+                checks_passed=13,
+                checks_run=13,
+                github_id=1,
+                github_url="https://github.com/me50/octocat/tree/def",
+                github_username="octocat",
+                name=None,
+                slug=slug,
+                timestamp="2025-12-02T10:00:00+01:00",
+            )
+        ],
+    )
+
+    class UploadDuringBatch(CompactSubmissionLayoutMigration):
+        def transform(self, document):
+            operations = super().transform(document)
+            # an import lands between the batch read and its bulk write
+            MongoSubmissionProblemRepository(collection).upload_submissions(uploaded)
+            return operations
+
+    results = make_runner(database, [UploadDuringBatch()], sleeps).run()
+
+    assert results[0].status == "applied"
+    loaded = MongoSubmissionProblemRepository(collection).get_submissions(slug)
+    assert loaded.submissions == uploaded.submissions
+
+
+def test_best_submissions_backfill(database, sleeps):
+    slug = "hsddigitallabor/problems/adg2025/intervals"
+    submissions = [
+        SubmissionModel(
+            archive=f"https://github.com/me50/octocat/archive/{commit}.zip",
+            checks_passed=checks_passed,
+            checks_run=13,
+            github_id=1,
+            github_url=f"https://github.com/me50/octocat/tree/{commit}",
+            github_username="octocat",
+            name=None,
+            slug=slug,
+            timestamp=timestamp,
+        )
+        for commit, checks_passed, timestamp in [
+            ("abc", 13, "2025-12-01T20:53:16+01:00"),
+            ("def", 9, "2025-12-02T20:53:16+01:00"),
+        ]
+    ]
+    MongoSubmissionProblemRepository(database["cs50_submissions"]).upload_submissions(
+        CS50SubmissionProblemModel(slug=slug, submissions=submissions)
+    )
+
+    results = make_runner(database, [BestSubmissionsBackfill()], sleeps).run()
+
+    assert results[0].status == "applied"
+    (best,) = MongoBestSubmissionRepository(database["best_submissions"]).get_for_slugs([slug])
+    assert best.checks_passed == 13
+    assert best.last_timestamp == submissions[1].timestamp
+
+
+def test_student_email_key_backfill_merges_case_duplicates(database, sleeps):
+    database["students"].insert_many([
+        {"id": "s1", "email": "Max.Mustermann@mail.de", "name": "Max Mustermann"},
+        {"id": "s2", "email": "max.mustermann@mail.de ", "name": "", "github_id": 7},
+        {"id": "s3", "email": "erika@mail.de", "name": "Erika"},
+    ])
+    init_enrollment_collection(database["enrollments"])
+    database["enrollments"].insert_many([
+        {"student_id": "s1", "course_id": "c1"},
+        {"student_id": "s1", "course_id": "c2"},
+        {"student_id": "s2", "course_id": "c1"},
+    ])
+    database["grade_fingerprints"].insert_one({"student_id": "s1", "course_id": "c1"})
+
+    results = make_runner(database, [StudentEmailKeyBackfill()], sleeps).run()
+
+    assert results[0].status == "applied"
+    students = {doc["id"]: doc for doc in database["students"].find({}, {"_id": 0})}
+    assert set(students) == {"s2", "s3"}
+    assert students["s2"]["email_key"] == "max.mustermann@mail.de"
+    assert students["s2"]["name"] == "Max Mustermann"
+    assert students["s3"]["email_key"] == "erika@mail.de"
+    enrollments = database["enrollments"].find({}, {"_id": 0})
+    assert sorted((e["student_id"], e["course_id"]) for e in enrollments) == [
+        ("s2", "c1"),
+        ("s2", "c2"),
+    ]
+    assert database["grade_fingerprints"].count_documents({}) == 0
+
+    # the unique key index can be built over the backfilled collection
+    assert init_student_collection(database["students"]).failed == {}
+
+
+def test_student_email_key_backfill_merges_into_student_holding_the_key(database, sleeps):
+    init_student_collection(database["students"])
+    init_enrollment_collection(database["enrollments"])
+    # created by the app after the deployment, legacy student from before it
+    database["students"].insert_many([
+        {"id": "new", "email": "max@mail.de", "email_key": "max@mail.de", "name": "Max"},
+        {"id": "old", "email": "Max@Mail.de", "name": "", "github_id": 7},
+    ])
+    database["enrollments"].insert_one({"student_id": "old", "course_id": "c1"})
+
+    results = make_runner(database, [StudentEmailKeyBackfill()], sleeps).run()
+
+    assert results[0].status == "applied"
+    (student,) = database["students"].find({}, {"_id": 0})
+    assert student["id"] == "new"
+    assert student["github_id"] == 7
+    assert student["name"] == "Max"
+    enrollments = database["enrollments"].find({}, {"_id": 0})
+    assert [(e["student_id"], e["course_id"]) for e in enrollments] == [("new", "c1")]
+
+
+def test_student_email_key_backfill_merges_duplicates_across_batches(database, sleeps):
+    class RecordingBackfill(StudentEmailKeyBackfill):
+        def __init__(self):
+            self.seen = []
+
+        def transform_batch(self, database, batch):
+            self.seen.extend(doc["id"] for doc in batch)
+            return super().transform_batch(database, batch)
+
+    init_student_collection(database["students"])
+    database["students"].insert_many([
+        {"id": "keyed", "email": "erika@mail.de", "email_key": "erika@mail.de"},
+        {"id": "s1", "email": "max@mail.de"},
+        {"id": "s2", "email": "moritz@mail.de"},
+        {"id": "s3", "email": "MAX@mail.de", "github_id": 7},
+    ])
+    migration = RecordingBackfill()
+
+    results = make_runner(database, [migration], sleeps).run()
+
+    assert results[0].status == "applied"
+    assert migration.seen == ["s1", "s2", "s3"]
+    students = {doc["id"]: doc for doc in database["students"].find({}, {"_id": 0})}
+    assert set(students) == {"keyed", "s1", "s2"}
+    assert students["s1"]["github_id"] == 7
+
+
+def test_duplicate_key_writes_are_skipped_if_the_migration_allows_it(database, sleeps):
+    class DuplicateFlagMigration(AddFlagMigration):
+        skip_duplicate_keys = True
+
+    database["items"].create_index("flag", unique=True, sparse=True)
+    database["items"].insert_many([{"n": i} for i in range(3)])
+
+    (result,) = make_runner(database, [DuplicateFlagMigration()], sleeps, batch_size=5).run()
+
+    assert result.status == "applied"
+    assert result.skipped == 2
+    assert database["items"].count_documents({"flag": True}) == 1
+
+
+def test_duplicate_key_writes_abort_the_migration_by_default(database, sleeps):
+    database["items"].create_index("flag", unique=True, sparse=True)
+    database["items"].insert_many([{"n": i} for i in range(3)])
+
+    with pytest.raises(BulkWriteError):
+        make_runner(database, [AddFlagMigration()], sleeps, batch_size=5).run()
+
+    state = database[MIGRATIONS_COLLECTION].find_one({"_id": 1})
+    assert state["status"] == "running"
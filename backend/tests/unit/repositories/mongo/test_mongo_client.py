@@ -0,0 +1,73 @@
+import pytest
+from pymongo import ReadPreference
+
+from repositories.mongo.client import create_mongo_client, read_collection
+from repositories.mongo.mongo_settings import MongoSettings
+from repositories.mongo.pool_metrics import PoolMetrics
+
+pytestmark = pytest.mark.unit
+
+
+def test_create_mongo_client_applies_pool_settings():
+    client = create_mongo_client(
+        "mongodb://localhost:27017",
+        max_pool_size=20,
+        min_pool_size=2,
+        max_idle_time_ms=60_000,
+        wait_queue_timeout_ms=500,
+        server_selection_timeout_ms=1_000,
+        read_preference="secondaryPreferred",
+    )
+    try:
+        options = client.options
+        assert options.pool_options.max_pool_size == 20
+        assert options.pool_options.min_pool_size == 2
+        assert options.pool_options.max_idle_time_seconds == 60
+        assert options.pool_options.wait_queue_timeout == pytest.approx(0.5)
+        assert options.server_selection_timeout == 1
+        assert client.read_preference == ReadPreference.SECONDARY_PREFERRED
+    finally:
+        client.close()
+
+
+def test_create_mongo_client_keeps_pymongo_defaults_for_unset_options():
+    client = create_mongo_client("mongodb://localhost:27017/?maxIdleTimeMS=1000")
+    try:
+        assert client.options.pool_options.max_idle_time_seconds == 1
+        assert client.options.pool_options.wait_queue_timeout is None
+    finally:
+        client.close()
+
+
+def test_create_mongo_client_registers_listeners():
+    metrics = PoolMetrics()
+    client = create_mongo_client("mongodb://localhost:27017", event_listeners=[metrics])
+    try:
+        assert metrics in client.options.pool_options._event_listeners.event_listeners()
+    finally:
+        client.close()
+
+
+def test_mongo_settings_rejects_unknown_read_preference():
+    with pytest.raises(ValueError):
+        MongoSettings(read_preference="anywhere")
+
+
+def test_read_collection_uses_secondaries_with_max_staleness():
+    client = create_mongo_client("mongodb://localhost:27017")
+    try:
+        collection = client["test_db"]["students"]
+
+        reads = read_collection(collection, "secondaryPreferred", max_staleness_seconds=120)
+
+        assert reads.read_preference.mode == ReadPreference.SECONDARY_PREFERRED.mode
+        assert reads.read_preference.max_staleness == 120
+        assert reads.full_name == collection.full_name
+        assert collection.read_preference == ReadPreference.PRIMARY
+    finally:
+        client.close()
+
+
+def test_mongo_settings_rejects_too_small_max_staleness():
+    with pytest.raises(ValueError):
+        MongoSettings(max_staleness_seconds=10)
@@ -0,0 +1,69 @@
+import mongomock
+import pytest
+
+from repositories.mongo.orphan_sweeper import OrphanSweeper
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def db():
+    db = mongomock.MongoClient()["test_db"]
+    db["courses"].insert_many([{"id": "c1"}, {"id": "c2"}])
+    db["students"].insert_many([{"id": f"s{i}", "email": f"s{i}@example.com"} for i in range(3)])
+    db["enrollments"].insert_many([
+        {"student_id": "s0", "course_id": "c1"},
+        {"student_id": "s1", "course_id": "c1"},
+        {"student_id": "gone", "course_id": "c1"},
+        {"student_id": "s2", "course_id": "c2"},
+        {"student_id": "s2", "course_id": "gone"},
+    ])
+    return db
+
+
+def remaining(db):
+    return sorted(
+        (doc["student_id"], doc["course_id"]) for doc in db["enrollments"].find({}, {"_id": 0})
+    )
+
+
+def test_sweep_removes_orphans_in_batches(db):
+    sleeps = []
+    sweeper = OrphanSweeper(db, batch_size=2, throttle_seconds=0.5, sleep=sleeps.append)
+
+    report = sweeper.run()
+
+    assert report.scanned == 5
+    assert report.orphaned == 2
+    assert report.removed == 2
+    assert report.batches == 3
+    assert sleeps == [0.5, 0.5]
+    assert remaining(db) == [("s0", "c1"), ("s1", "c1"), ("s2", "c2")]
+
+
+def test_dry_run_only_reports(db):
+    report = OrphanSweeper(db, sleep=lambda _: None).run(dry_run=True)
+
+    assert report.orphaned == 2
+    assert report.removed == 0
+    assert len(remaining(db)) == 5
+
+
+def test_second_sweep_finds_nothing(db):
+    sweeper = OrphanSweeper(db, sleep=lambda _: None)
+    sweeper.run()
+
+    report = sweeper.run()
+
+    assert report.orphaned == 0
+    assert report.scanned == 3
+
+
+def test_stopped_sweep_is_interrupted(db):
+    sweeper = OrphanSweeper(db, batch_size=1, sleep=lambda _: None)
+    sweeper.stop()
+
+    report = sweeper.run()
+
+    assert report.interrupted
+    assert report.scanned == 0
@@ -0,0 +1,37 @@
+import pytest
+from pymongo import monitoring
+
+from repositories.mongo.pool_metrics import PoolMetrics
+
+pytestmark = pytest.mark.unit
+
+ADDRESS = ("localhost", 27017)
+
+
+def test_pool_metrics_tracks_checkouts_and_wait_time():
+    metrics = PoolMetrics()
+
+    metrics.connection_checked_out(monitoring.ConnectionCheckedOutEvent(ADDRESS, 1, 0.02))
+    metrics.connection_checked_out(monitoring.ConnectionCheckedOutEvent(ADDRESS, 2, 0.04))
+    metrics.connection_checked_in(monitoring.ConnectionCheckedInEvent(ADDRESS, 1))
+
+    snapshot = metrics.snapshot()
+    assert snapshot.checked_out == 1
+    assert snapshot.checkouts == 2
+    assert snapshot.wait_seconds_total == pytest.approx(0.06)
+    assert snapshot.wait_seconds_max == pytest.approx(0.04)
+    assert snapshot.wait_seconds_avg == pytest.approx(0.03)
+
+
+def test_pool_metrics_counts_failed_checkouts():
+    metrics = PoolMetrics()
+
+    metrics.connection_check_out_failed(
+        monitoring.ConnectionCheckOutFailedEvent(ADDRESS, "timeout", 0.5)
+    )
+
+    snapshot = metrics.snapshot()
+    assert snapshot.checkout_failures == 1
+    assert snapshot.checked_out == 0
+    assert snapshot.wait_seconds_max == pytest.approx(0.5)
+    assert snapshot.wait_seconds_avg == pytest.approx(0.0)
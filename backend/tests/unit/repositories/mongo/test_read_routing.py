@@ -0,0 +1,91 @@
+import os
+
+import mongomock
+import pytest
+from pymongo import MongoClient
+
+from models.course import Course
+from models.cs50_submission_problem import CS50SubmissionProblemModel
+from models.student import StudentModel
+from repositories.mongo.client import read_collection
+from repositories.mongo.course_repository import MongoCourseRepository
+from repositories.mongo.cs50_submission_problem_repository import (
+    MongoSubmissionProblemRepository,
+)
+from repositories.mongo.student_repository import MongoStudentRepository
+
+pytestmark = pytest.mark.unit
+
+SLUG = "hsddigitallabor/problems/adg2025/mario"
+
+
+@pytest.fixture
+def client():
+    return mongomock.MongoClient()
+
+
+def test_list_reads_use_read_collection(client):
+    primary = client["primary"]["courses"]
+    replica = client["replica"]["courses"]
+    replica.insert_one(Course(id="from-replica", name="Replica", cs50_id=1).model_dump())
+    repo = MongoCourseRepository(primary, read_collection=replica)
+
+    repo.create(Course(id="c1", name="Course", cs50_id=1))
+
+    assert [c.id for c in repo.get_all()] == ["from-replica"]
+    # lookups used by writes stay on the primary
+    assert repo.get("c1") is not None
+    assert primary.count_documents({}) == 1
+
+
+def test_student_bulk_reads_use_read_collection(client):
+    primary = client["primary"]["students"]
+    replica = client["replica"]["students"]
+    replica.insert_one(StudentModel(id="s1", email="replica@example.com").model_dump())
+    repo = MongoStudentRepository(primary, read_collection=replica)
+
+    repo.create(StudentModel(id="s1", email="primary@example.com"))
+
+    assert [s.email for s in repo.get_many(["s1"])] == ["replica@example.com"]
+    assert [s.email for s in repo.get_all()] == ["replica@example.com"]
+    assert repo.get_by_email("primary@example.com") is not None
+
+
+def test_submission_reads_use_read_collection(client):
+    primary = client["primary"]["cs50_submissions"]
+    replica = client["replica"]["cs50_submissions"]
+    repo = MongoSubmissionProblemRepository(primary, read_collection=replica)
+
+    repo.upload_submissions(CS50SubmissionProblemModel(slug=SLUG, submissions=[]))
+
+    assert repo.get_submissions(SLUG) is None
+    assert repo.get_submissions_for_slugs([SLUG]) == []
+    assert primary.count_documents({"slug": SLUG}) == 1
+
+
+def test_without_read_collection_reads_use_primary(client):
+    repo = MongoCourseRepository(client["primary"]["courses"])
+
+    repo.create(Course(id="c1", name="Course", cs50_id=1))
+
+    assert [c.id for c in repo.get_all()] == ["c1"]
+
+
+@pytest.mark.skipif(
+    "MONGO_TEST_URI" not in os.environ, reason="read preferences need a real replica set"
+)
+def test_secondary_preferred_reads_on_replica_set():
+    client = MongoClient(os.environ["MONGO_TEST_URI"])
+    collection = client["read_routing_test"]["courses"]
+    try:
+        repo = MongoCourseRepository(
+            collection, read_collection=read_collection(collection, "secondaryPreferred")
+        )
+        repo.create(Course(id="c1", name="Course", cs50_id=1))
+
+        # a single host replica set has no secondary, secondaryPreferred falls back
+        # to the primary; with secondaries the read may lag behind the write
+        assert [c.id for c in repo.get_all()] in (["c1"], [])
+    finally:
+        client.drop_database("read_routing_test")
+        client.close()
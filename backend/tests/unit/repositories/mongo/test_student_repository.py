@@ -108,3 +108,85 @@ def test_delete_non_existing_student(student_repository):
     deleted = student_repository.delete("non_existing")
 
     assert deleted is False
+
+
+def test_patch_student(student_repository):
+    student = StudentModel(email="first.last@email.com", name="Name")
+    student_repository.create(student)
+
+    result = student_repository.patch(student.id, {"github_id": 1, "github_username": "octocat"})
+
+    assert result.github_id == 1
+    assert result.github_username == "octocat"
+    assert result.name == "Name"
+
+
+def test_patch_student_not_found(student_repository):
+    assert student_repository.patch("non_existing", {"name": "Name"}) is None
+
+
+def test_patch_student_duplicate_email(student_repository):
+    s1 = StudentModel(email="first.last@email.com")
+    s2 = StudentModel(email="second.last@email.com")
+    student_repository.create(s1)
+    student_repository.create(s2)
+
+    with pytest.raises(StudentEmailAlreadyExists):
+        student_repository.patch(s2.id, {"email": s1.email})
+
+
+def test_get_many_students(student_repository):
+    s1 = StudentModel(email="first.last@email.com")
+    s2 = StudentModel(email="second.last@email.com")
+    student_repository.create(s1)
+    student_repository.create(s2)
+
+    result = student_repository.get_many([s1.id, "non_existing", s2.id])
+
+    assert sorted(s.email for s in result) == [s1.email, s2.email]
+    assert student_repository.get_many([]) == []
+
+
+def test_student_collection_indexes_github_id(student_repository):
+    indexes = student_repository._collection.index_information()
+
+    assert indexes["github_id_idx"]["key"] == [("github_id", 1)]
+    assert indexes["github_id_idx"]["partialFilterExpression"] == {"github_id": {"$type": "number"}}
+
+
+def test_get_by_email_ignores_case_and_whitespace(student_repository):
+    student = student_repository.create(StudentModel(email="Max.Mustermann@mail.de"))
+
+    found = student_repository.get_by_email(" max.mustermann@MAIL.de")
+
+    assert found is not None
+    assert found.id == student.id
+    assert found.email == "Max.Mustermann@mail.de"
+
+
+def test_create_rejects_email_differing_only_in_case(student_repository):
+    student_repository.create(StudentModel(email="max@mail.de"))
+
+    with pytest.raises(StudentEmailAlreadyExists):
+        student_repository.create(StudentModel(email="MAX@mail.de"))
+
+
+def test_patch_email_updates_email_key(student_repository):
+    student = student_repository.create(StudentModel(email="old@mail.de"))
+
+    student_repository.patch(student.id, {"email": "New@Mail.de"})
+
+    assert student_repository.get_by_email("new@mail.de").id == student.id
+    assert student_repository.get_by_email("old@mail.de") is None
+
+
+def _insert_without_email_key(repository, student: StudentModel) -> None:
+    # as stored before the email_key backfill (schema migration 3) has run
+    repository._collection.insert_one(student.model_dump(exclude={"email_key"}))
+
+
+def test_get_by_email_finds_students_not_yet_backfilled(student_repository):
+    legacy = StudentModel(email="max@mail.de")
+    _insert_without_email_key(student_repository, legacy)
+
+    assert student_repository.get_by_email("max@mail.de").id == legacy.id
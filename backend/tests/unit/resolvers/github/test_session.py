@@ -0,0 +1,40 @@
+from datetime import timedelta
+
+import pytest
+import requests
+from requests.hooks import dispatch_hook
+
+from request_timing import start_request_timing, stop_request_timing
+from resolvers.github.session import create_github_session
+
+pytestmark = pytest.mark.unit
+
+
+def _response(method: str, elapsed: float) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.request = requests.Request(method, "https://api.github.com/users/octocat").prepare()
+    response.elapsed = timedelta(seconds=elapsed)
+    return response
+
+
+def test_github_session_records_calls_of_the_current_request():
+    session = create_github_session()
+    timing, token = start_request_timing()
+    try:
+        dispatch_hook("response", session.hooks, _response("GET", 0.2))
+        dispatch_hook("response", session.hooks, _response("POST", 0.1))
+    finally:
+        stop_request_timing(token)
+
+    segment = timing.segments()["github"]
+    assert segment.count == 2
+    assert segment.seconds == pytest.approx(0.3)
+    assert timing.operations("github") == {"GET": 1, "POST": 1}
+
+
+def test_github_session_returns_the_response_unchanged():
+    session = create_github_session()
+    response = _response("GET", 0.2)
+
+    assert dispatch_hook("response", session.hooks, response) is response
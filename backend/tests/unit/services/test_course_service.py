@@ -1,8 +1,12 @@
 import pytest
 
 from models.course import Course
+from models.enrollment import EnrollmentModel
+from models.student import StudentModel
 from services.course import CourseService
 from tests.mocks.repositories.course_repository_mock import MockCourseRepository
+from tests.mocks.repositories.enrollment_repository_mock import MockEnrollmentRepository
+from tests.mocks.repositories.student_repository_mock import MockStudentRepository
 
 pytestmark = pytest.mark.unit
 
@@ -111,3 +115,67 @@ def test_delete_course_returns_false_when_course_does_not_exist(course_service):
     result = course_service.delete_course("missing")
 
     assert result is False
+
+
+class CountingStudentRepository(MockStudentRepository):
+    def __init__(self):
+        super().__init__()
+        self.get_many_calls: list[list[str]] = []
+
+    def get_many(self, item_ids):
+        self.get_many_calls.append(list(item_ids))
+        return super().get_many(item_ids)
+
+
+@pytest.fixture
+def roster():
+    courses = MockCourseRepository()
+    course = courses.create(Course(name="some course", cs50_id=50, exercise_ids=[]))
+    students = CountingStudentRepository()
+    enrollments = MockEnrollmentRepository()
+    for i in range(5):
+        student = students.create(StudentModel(id=f"s{i}", email=f"s{i}@example.com"))
+        enrollments.add_enrollment(EnrollmentModel(student_id=student.id, course_id=course.id))
+
+    service = CourseService(
+        courses,
+        enrollment_repository=enrollments,
+        student_repository=students,
+        student_batch_size=2,
+    )
+    return service, course, students
+
+
+def test_get_students_in_course_fetches_in_batches(roster):
+    service, course, students = roster
+
+    page = service.get_students_in_course(course.id)
+
+    assert page.total == 5
+    assert [s.id for s in page.students] == ["s0", "s1", "s2", "s3", "s4"]
+    assert students.get_many_calls == [["s0", "s1"], ["s2", "s3"], ["s4"]]
+
+
+def test_get_students_in_course_paginates(roster):
+    service, course, students = roster
+
+    page = service.get_students_in_course(course.id, offset=1, limit=2)
+
+    assert page.total == 5
+    assert [s.email for s in page.students] == ["s1@example.com", "s2@example.com"]
+    assert students.get_many_calls == [["s1", "s2"]]
+
+
+def test_get_students_in_course_skips_deleted_students(roster):
+    service, course, students = roster
+    students.delete("s1")
+
+    page = service.get_students_in_course(course.id)
+
+    assert [s.id for s in page.students] == ["s0", "s2", "s3", "s4"]
+
+
+def test_get_students_in_course_returns_none_for_unknown_course(roster):
+    service, _, _ = roster
+
+    assert service.get_students_in_course("missing") is None
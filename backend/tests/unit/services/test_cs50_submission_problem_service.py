@@ -4,7 +4,9 @@ import json
 import pytest
 
 from exceptions.exceptions import InvalidJsonFormat
+from models.cs50_submission_problem import CS50SubmissionProblemModel
 from services.cs50_submission_problem import CS50SubmissionProblemService
+from tests.mocks.repositories.best_submission_repository_mock import MockBestSubmissionRepository
 from tests.mocks.repositories.cs50_submission_problem_repository_mock import (
     MockCS50SubmissionProblemRepository,
 )
@@ -107,3 +109,35 @@ def test_import_raises_invalidjsonformat_for_invalid_json_text(service):
     f = io.BytesIO(b"{ this is not valid json")
     with pytest.raises(InvalidJsonFormat):
         service.import_submissions_from_json("any/slug", f)
+
+
+def test_import_records_best_submissions(repo):
+    best_repo = MockBestSubmissionRepository()
+    service = CS50SubmissionProblemService(repo, best_repo)
+    slug = "hsddigitallabor/problems/adg2025/intervals"
+    submission = {
+        "archive": "https://github.com/me50/octocat/archive/abc.zip",
+        "checks_passed": 13,
+        "checks_run": 13,
+        "github_id": 1,
+        "github_url": "https://github.com/me50/octocat/tree/abc",
+        "github_username": "octocat",
+        "name": None,
+        "slug": slug,
+        "timestamp": "2025-12-01T20:53:16+01:00",
+    }
+
+    first = service.import_submissions_from_json(slug, make_file({slug: [submission]}))
+    second = service.import_submissions_from_json(slug, make_file({slug: [submission]}))
+
+    assert first.best_submissions_updated == 1
+    assert second.best_submissions_updated == 0
+    assert best_repo.get_for_slugs([slug])[0].checks_passed == 13
+
+
+def test_get_submissions_returns_stored_problem(service, repo):
+    slug = "hsddigitallabor/problems/adg2025/intervals"
+    repo.upload_submissions(CS50SubmissionProblemModel(slug=slug, submissions=[]))
+
+    assert service.get_submissions(slug).slug == slug
+    assert service.get_submissions("missing/slug") is None
@@ -1,5 +1,4 @@
 import io
-from unittest.mock import Mock
 
 import pytest
 
@@ -8,6 +7,10 @@ from models.course import Course
 from models.student import StudentModel
 from services.enrollment import EnrollmentService
 from tests.mocks.repositories.course_repository_mock import MockCourseRepository
+from tests.mocks.repositories.enrollment_import_repository_mock import (
+    MockEnrollmentImportRepository,
+)
+from tests.mocks.repositories.enrollment_repository_mock import MockEnrollmentRepository
 from tests.mocks.repositories.student_repository_mock import MockStudentRepository
 
 pytestmark = pytest.mark.unit
@@ -17,15 +20,12 @@ pytestmark = pytest.mark.unit
 def enrollment_context():
     student_repo = MockStudentRepository()
     course_repo = MockCourseRepository()
-    enrollment_repo = Mock()
+    enrollment_repo = MockEnrollmentRepository()
+    import_repo = MockEnrollmentImportRepository(student_repo, enrollment_repo)
 
     course_repo.create(Course(id="course_id", name="Course name", cs50_id=50))
 
-    service = EnrollmentService(
-        student_repo,
-        course_repo,
-        enrollment_repo,
-    )
+    service = EnrollmentService(student_repo, course_repo, enrollment_repo, import_repo)
 
     return {
         "service": service,
@@ -165,3 +165,78 @@ Max,Doe,max@study.hs-duesseldorf.de,
     assert result.students_created == 3
     assert result.enrollments_created == 3
     assert result.rows_skipped == 0
+
+
+CLASS_CSV = """Vorname,Nachname,E-Mail-Adresse
+A,One,a@example.com
+B,Two,
+C,Three,c@example.com
+D,Four,d@example.com
+E,Five,e@example.com
+"""
+
+
+@pytest.fixture
+def batched_context():
+    student_repo = MockStudentRepository()
+    course_repo = MockCourseRepository()
+    enrollment_repo = MockEnrollmentRepository()
+    import_repo = MockEnrollmentImportRepository(student_repo, enrollment_repo)
+
+    course_repo.create(Course(id="course_id", name="Course name", cs50_id=50))
+
+    service = EnrollmentService(
+        student_repo,
+        course_repo,
+        enrollment_repo,
+        import_repository=import_repo,
+        import_batch_size=2,
+    )
+    return service, import_repo, enrollment_repo
+
+
+def test_batched_import_commits_every_n_rows(batched_context):
+    service, import_repo, enrollment_repo = batched_context
+
+    result = service.import_students_from_csv("course_id", io.BytesIO(CLASS_CSV.encode()))
+
+    assert result.students_created == 4
+    assert result.enrollments_created == 4
+    assert result.rows_skipped == 1
+    assert result.rows_resumed == 0
+    assert import_repo.batches == [
+        ["a@example.com"],
+        ["c@example.com", "d@example.com"],
+        ["e@example.com"],
+    ]
+    assert len(enrollment_repo.get_students_for_course("course_id")) == 4
+
+
+def test_interrupted_import_resumes_after_last_committed_batch(batched_context):
+    service, import_repo, enrollment_repo = batched_context
+    import_repo.fail_after_batches = 2
+
+    with pytest.raises(ConnectionError):
+        service.import_students_from_csv("course_id", io.BytesIO(CLASS_CSV.encode()))
+    assert len(enrollment_repo.get_students_for_course("course_id")) == 3
+
+    import_repo.fail_after_batches = None
+    import_repo.batches.clear()
+    result = service.import_students_from_csv("course_id", io.BytesIO(CLASS_CSV.encode()))
+
+    assert result.rows_resumed == 4
+    assert result.students_created == 1
+    assert import_repo.batches == [["e@example.com"]]
+    assert len(enrollment_repo.get_students_for_course("course_id")) == 4
+
+
+def test_finished_import_can_run_again_without_duplicates(batched_context):
+    service, _, enrollment_repo = batched_context
+    service.import_students_from_csv("course_id", io.BytesIO(CLASS_CSV.encode()))
+
+    result = service.import_students_from_csv("course_id", io.BytesIO(CLASS_CSV.encode()))
+
+    assert result.rows_resumed == 0
+    assert result.students_created == 0
+    assert result.enrollments_created == 0
+    assert len(enrollment_repo.get_students_for_course("course_id")) == 4
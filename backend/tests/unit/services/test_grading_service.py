@@ -0,0 +1,242 @@
+from datetime import UTC, datetime
+from unittest.mock import Mock
+
+import pytest
+
+from exceptions.exceptions import CourseDoesNotExistException, MissingMoodleParticipant
+from models.course import Course
+from models.cs50_submission_problem import CS50SubmissionProblemModel
+from models.enrollment import EnrollmentModel
+from models.moodle_worksheet import GradeType, PassFailGrade
+from models.student import StudentModel
+from models.submission import SubmissionModel
+from services.grading import GradingService
+from services.grading_strategies.cs50_assignment import CS50Assignment
+from tests.mocks.repositories.best_submission_repository_mock import MockBestSubmissionRepository
+from tests.mocks.repositories.course_repository_mock import MockCourseRepository
+from tests.mocks.repositories.cs50_submission_problem_repository_mock import (
+    MockCS50SubmissionProblemRepository,
+)
+from tests.mocks.repositories.enrollment_repository_mock import MockEnrollmentRepository
+from tests.mocks.repositories.grade_fingerprint_repository_mock import (
+    MockGradeFingerprintRepository,
+)
+from tests.mocks.repositories.student_repository_mock import MockStudentRepository
+
+pytestmark = pytest.mark.unit
+
+NOW = datetime(2025, 12, 24, 12, 0, tzinfo=UTC)
+MARIO = "hsddigitallabor/problems/adg2025/mario"
+CASH = "hsddigitallabor/problems/adg2025/cash"
+
+
+def make_submission(slug, github_id, checks_passed, day):
+    return SubmissionModel(
+        archive=f"https://github.com/me50/user{github_id}/archive/abc.zip",
+        checks_passed=checks_passed,
+        checks_run=13,
+        github_id=github_id,
+        github_url=f"https://github.com/me50/user{github_id}/tree/abc",
+        github_username=f"user{github_id}",
+        name=None,
+        slug=slug,
+        timestamp=datetime(2025, 12, day, tzinfo=UTC),
+    )
+
+
+@pytest.fixture
+def grading_context():
+    course_repo = MockCourseRepository()
+    student_repo = MockStudentRepository()
+    enrollment_repo = MockEnrollmentRepository()
+    submission_repo = MockCS50SubmissionProblemRepository()
+
+    course_repo.create(Course(id="course_id", name="ADG", exercise_ids=[MARIO, CASH]))
+
+    students = {
+        "passed": StudentModel(email="a@example.com", github_id=1),
+        "failed": StudentModel(email="b@example.com", github_id=2),
+        "no_github": StudentModel(email="c@example.com"),
+    }
+    for student in students.values():
+        student_repo.create(student)
+        enrollment_repo.add_enrollment(
+            EnrollmentModel(student_id=student.id, course_id="course_id")
+        )
+
+    # not enrolled, must not show up in the worksheet
+    student_repo.create(StudentModel(email="d@example.com", github_id=4))
+
+    submission_repo.upload_submissions(
+        CS50SubmissionProblemModel(
+            slug=MARIO,
+            submissions=[
+                make_submission(MARIO, 1, 13, 1),
+                make_submission(MARIO, 2, 13, 2),
+                make_submission(MARIO, 4, 13, 3),
+            ],
+        )
+    )
+    submission_repo.upload_submissions(
+        CS50SubmissionProblemModel(
+            slug=CASH,
+            submissions=[
+                make_submission(CASH, 1, 5, 4),
+                make_submission(CASH, 1, 13, 5),
+                make_submission(CASH, 2, 12, 6),
+            ],
+        )
+    )
+
+    service = GradingService(
+        course_repo, student_repo, enrollment_repo, submission_repo, clock=lambda: NOW
+    )
+    return service, students
+
+
+def test_grade_course_emits_row_for_every_enrolled_student(grading_context):
+    service, students = grading_context
+
+    rows = service.grade_course("course_id")
+
+    assert [row.email for row in rows] == ["a@example.com", "b@example.com", "c@example.com"]
+    assert {row.email for row in rows} == {s.email for s in students.values()}
+    # the internal student id means nothing to Moodle
+    assert all(row.submission_id == "" for row in rows)
+    assert all(row.grade_type == GradeType.pass_fail for row in rows)
+
+
+def test_iter_course_grades_writes_moodle_participant_ids(grading_context):
+    service, _ = grading_context
+    participant_ids = {
+        "a@example.com": "Teilnehmer/in1",
+        "b@example.com": "Teilnehmer/in2",
+        "c@example.com": "Teilnehmer/in3",
+    }
+
+    rows = service.iter_course_grades("course_id", participant_ids)
+
+    assert [row.submission_id for row in rows] == [
+        "Teilnehmer/in1",
+        "Teilnehmer/in2",
+        "Teilnehmer/in3",
+    ]
+
+
+def test_iter_course_grades_fails_for_student_missing_from_worksheet(grading_context):
+    service, _ = grading_context
+
+    with pytest.raises(MissingMoodleParticipant) as exc_info:
+        service.iter_course_grades("course_id", {"a@example.com": "Teilnehmer/in1"})
+
+    assert exc_info.value.emails == ["b@example.com", "c@example.com"]
+
+
+def test_grade_course_requires_all_problems_passed(grading_context):
+    service, _ = grading_context
+
+    passed, failed, no_github = service.grade_course("course_id")
+
+    assert passed.grade_pass_fail == PassFailGrade.passed
+    assert passed.last_submission == datetime(2025, 12, 5, tzinfo=UTC)
+    assert passed.feedback_comment == "2/2 Aufgaben bestanden"
+
+    assert failed.grade_pass_fail == PassFailGrade.failed
+    assert failed.feedback_comment == "1/2 Aufgaben bestanden, offen: cash"
+
+    assert no_github.grade_pass_fail == PassFailGrade.failed
+    assert no_github.last_submission is None
+    assert no_github.submission_last_modified == NOW
+
+
+def test_grade_unknown_course(grading_context):
+    service, _ = grading_context
+
+    with pytest.raises(CourseDoesNotExistException):
+        service.grade_course("unknown")
+
+
+def test_grade_course_uses_strategy_and_course_deadline(grading_context):
+    service, _ = grading_context
+    course = service._course_repo.get("course_id")
+    service._course_repo.update(
+        "course_id", course.model_copy(update={"deadline": datetime(2025, 12, 4, tzinfo=UTC)})
+    )
+    service._strategy = CS50Assignment(late_penalty_per_day=0.5)
+
+    passed, _, _ = service.grade_course("course_id")
+
+    # cash was only solved on the 5th, one day late
+    assert passed.grade_pass_fail == PassFailGrade.failed
+    assert passed.deadline == datetime(2025, 12, 4, tzinfo=UTC)
+
+
+def test_grade_course_without_deadline_reads_best_submissions(grading_context):
+    service, _ = grading_context
+    best_repo = MockBestSubmissionRepository()
+    for slug in (MARIO, CASH):
+        best_repo.record(slug, service._submission_repo.get_submissions(slug).submissions)
+    service._best_repo = best_repo
+    service._submission_repo = Mock()
+
+    passed, failed, _ = service.grade_course("course_id")
+
+    service._submission_repo.get_submissions_for_slugs.assert_not_called()
+    assert passed.grade_pass_fail == PassFailGrade.passed
+    assert passed.last_submission == datetime(2025, 12, 5, tzinfo=UTC)
+    assert failed.feedback_comment == "1/2 Aufgaben bestanden, offen: cash"
+
+
+def test_regrade_only_recomputes_changed_inputs(grading_context):
+    service, students = grading_context
+    service._fingerprint_repo = MockGradeFingerprintRepository()
+
+    first = service.regrade_course("course_id")
+
+    assert first.recomputed == 6
+    assert first.skipped == 0
+    assert len(first.rows) == 3
+
+    unchanged = service.regrade_course("course_id")
+
+    assert unchanged.recomputed == 0
+    assert unchanged.skipped == 6
+    assert unchanged.rows == []
+
+    # student 2 solves cash, only that pair changes
+    cash = service._submission_repo.get_submissions(CASH)
+    service._submission_repo.upload_submissions(
+        cash.model_copy(
+            update={"submissions": [*cash.submissions, make_submission(CASH, 2, 13, 7)]}
+        )
+    )
+    changed = service.regrade_course("course_id")
+
+    assert changed.recomputed == 1
+    assert changed.skipped == 5
+    (row,) = changed.rows
+    assert row.email == students["failed"].email
+    assert row.grade_pass_fail == PassFailGrade.passed
+
+
+def test_regrade_recomputes_everything_when_config_changes(grading_context):
+    service, _ = grading_context
+    service._fingerprint_repo = MockGradeFingerprintRepository()
+    service.regrade_course("course_id")
+
+    service._strategy = CS50Assignment(pass_threshold=0.5)
+    result = service.regrade_course("course_id")
+
+    assert result.recomputed == 6
+    assert result.skipped == 0
+
+
+def test_regrade_without_fingerprint_repository_regrades_everything(grading_context):
+    service, _ = grading_context
+
+    first = service.regrade_course("course_id")
+    second = service.regrade_course("course_id")
+
+    assert first.recomputed == second.recomputed == 6
+    assert second.skipped == 0
+    assert len(second.rows) == 3
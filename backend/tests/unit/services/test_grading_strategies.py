@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from interfaces.services.grading_strategy import IGradingStrategy, SubmissionBatch
+from services.grading_strategies.cs50_assignment import SECONDS_PER_DAY, CS50Assignment
+from services.grading_strategies.github_name_assignment import GithubNameAssignment
+from services.grading_strategies.registry import (
+    GRADING_STRATEGIES,
+    create_strategy,
+    register_strategy,
+)
+
+pytestmark = pytest.mark.unit
+
+DEADLINE = 1_000_000.0
+
+
+def make_batch(student_index, checks_passed, checks_run, timestamps, num_students=3):
+    return SubmissionBatch(
+        student_index=np.array(student_index, dtype=np.int64),
+        checks_passed=np.array(checks_passed, dtype=np.float64),
+        checks_run=np.array(checks_run, dtype=np.float64),
+        timestamps=np.array(timestamps, dtype=np.float64),
+        deadlines=np.array([DEADLINE, DEADLINE, np.inf][:num_students]),
+        has_github=np.array([True, True, False][:num_students]),
+    )
+
+
+def test_cs50_assignment_takes_best_score_per_student():
+    batch = make_batch(
+        student_index=[0, 0, 1],
+        checks_passed=[5, 10, 13],
+        checks_run=[10, 10, 13],
+        timestamps=[DEADLINE - 10, DEADLINE - 5, DEADLINE - 1],
+    )
+
+    scores = CS50Assignment().grade(batch)
+
+    assert scores.tolist() == [1.0, 1.0, 0.0]
+
+
+def test_cs50_assignment_applies_late_penalty_per_started_day():
+    batch = make_batch(
+        student_index=[0, 1, 1, 2],
+        checks_passed=[10, 10, 6, 10],
+        checks_run=[10, 10, 10, 10],
+        timestamps=[
+            DEADLINE + 1,
+            DEADLINE + 2 * SECONDS_PER_DAY,
+            DEADLINE,
+            DEADLINE + 100 * SECONDS_PER_DAY,
+        ],
+    )
+
+    scores = CS50Assignment(late_penalty_per_day=0.25).grade(batch)
+
+    # student 1 keeps the on-time 0.6 over the late 1.0 * 0.5; student 2 has no deadline
+    np.testing.assert_allclose(scores, [0.75, 0.6, 1.0])
+
+
+def test_cs50_assignment_ignores_submissions_without_checks():
+    batch = make_batch(
+        student_index=[0],
+        checks_passed=[np.nan],
+        checks_run=[np.nan],
+        timestamps=[DEADLINE],
+    )
+
+    assert CS50Assignment().grade(batch).tolist() == [0.0, 0.0, 0.0]
+
+
+def test_github_name_assignment_passes_students_with_github_account():
+    batch = make_batch([], [], [], [])
+
+    strategy = GithubNameAssignment()
+
+    assert strategy.passed(strategy.grade(batch)).tolist() == [True, True, False]
+
+
+def test_create_strategy_by_name():
+    strategy = create_strategy("cs50", pass_threshold=0.5)
+
+    assert isinstance(strategy, CS50Assignment)
+    assert strategy.pass_threshold == pytest.approx(0.5)
+
+
+def test_create_unknown_strategy():
+    with pytest.raises(ValueError, match="Unknown grading strategy"):
+        create_strategy("mathworks_grader")
+
+
+def test_register_strategy():
+    @register_strategy
+    class AlwaysPass(IGradingStrategy):
+        name = "always_pass"
+
+        def grade(self, batch):
+            return np.ones(batch.num_students)
+
+    try:
+        assert isinstance(create_strategy("always_pass"), AlwaysPass)
+    finally:
+        GRADING_STRATEGIES.pop("always_pass")
@@ -0,0 +1,112 @@
+import io
+from datetime import UTC, datetime
+
+import pytest
+
+from exceptions.exceptions import InvalidCsvFormat
+from models.moodle_worksheet import GradeType, MoodleWorksheetRowModel, PassFailGrade
+from services.moodle_worksheet_export import (
+    format_moodle_date,
+    iter_worksheet_csv,
+    read_participant_ids,
+    worksheet_filename,
+    worksheet_line,
+)
+
+pytestmark = pytest.mark.unit
+
+HEADER = (
+    'ID,"Vollständiger Name",E-Mail-Adresse,Status,Bewertung,Skala,'
+    '"Bewertung kann geändert werden","Zuletzt geändert (Abgabe)","Texteingabe online",'
+    '"Zuletzt geändert (Bewertung)","Feedback als Kommentar"'
+)
+
+
+def make_row(**overrides):
+    values = {
+        "submission_id": "Teilnehmer/in1234567",
+        "full_name": "Max Mustermann",
+        "email": "max.mustermann@mail.de",
+        "status": "Zur Bewertung abgegeben - Bewertet -  - ",
+        "grade_type": GradeType.pass_fail,
+        "grade_pass_fail": PassFailGrade.passed,
+        "grade_scale": "nicht bestanden    bestanden",
+        "submission_last_modified": datetime(2025, 12, 2, 9, 37, tzinfo=UTC),
+        "online_text": "octocat   ",
+        "grade_last_modified": datetime(2025, 12, 2, 9, 37, tzinfo=UTC),
+        "feedback_comment": "This is feedback",
+    }
+    values.update(overrides)
+    return MoodleWorksheetRowModel(**values)
+
+
+def test_format_moodle_date_uses_german_names_and_local_time():
+    assert format_moodle_date(datetime(2025, 12, 2, 9, 37, tzinfo=UTC)) == (
+        "Dienstag, 2. Dezember 2025, 10:37"
+    )
+    assert format_moodle_date(datetime(2025, 3, 30, 22, 5, tzinfo=UTC)) == (
+        "Montag, 31. März 2025, 00:05"
+    )
+
+
+def test_worksheet_line_matches_moodle_export():
+    assert worksheet_line(make_row()) == (
+        'Teilnehmer/in1234567,"Max Mustermann",max.mustermann@mail.de,'
+        '"Zur Bewertung abgegeben - Bewertet -  - ",bestanden,"nicht bestanden    bestanden",'
+        'Ja,"Dienstag, 2. Dezember 2025, 10:37","octocat   ",'
+        '"Dienstag, 2. Dezember 2025, 10:37","This is feedback"'
+    )
+
+
+def test_worksheet_line_formats_numeric_grade_and_escapes_quotes():
+    row = make_row(
+        grade_type=GradeType.numeric,
+        grade_pass_fail=None,
+        grade_numeric=87.5,
+        grade_can_be_changed=False,
+        feedback_comment='Sehr "gut"',
+    )
+
+    line = worksheet_line(row)
+
+    assert ',"87,50","nicht bestanden    bestanden",Nein,' in line
+    assert line.endswith(',"Sehr ""gut"""')
+
+
+def test_iter_worksheet_csv_starts_with_bom_and_header():
+    chunks = iter_worksheet_csv(iter([make_row(), make_row(email="b@mail.de")]))
+
+    assert next(chunks) == "\ufeff" + HEADER
+    assert next(chunks).startswith("\nTeilnehmer/in1234567,")
+    assert "b@mail.de" in next(chunks)
+    assert next(chunks, None) is None
+
+
+def test_worksheet_filename_replaces_header_breaking_characters():
+    assert worksheet_filename("adg-2025") == "Bewertungen-adg-2025.csv"
+    assert worksheet_filename('a"; filename=x.exe\r\n') == "Bewertungen-a_filename_x.exe_.csv"
+
+
+def test_worksheet_line_requires_participant_id():
+    with pytest.raises(ValueError, match="participant identifier"):
+        worksheet_line(make_row(submission_id=""))
+
+
+def test_read_participant_ids_keys_by_normalized_email():
+    worksheet = (HEADER + "\n" + worksheet_line(make_row(email=" Max.Mustermann@Mail.de"))).encode()
+
+    assert read_participant_ids(io.BytesIO(b"\xef\xbb\xbf" + worksheet)) == {
+        "max.mustermann@mail.de": "Teilnehmer/in1234567"
+    }
+
+
+@pytest.mark.parametrize(
+    "worksheet",
+    [
+        b"Vorname,Nachname,E-Mail-Adresse\nMax,Mustermann,max@mail.de\n",
+        b"ID,E-Mail-Adresse\n,max@mail.de\n",
+    ],
+)
+def test_read_participant_ids_rejects_worksheet_without_ids(worksheet):
+    with pytest.raises(InvalidCsvFormat):
+        read_participant_ids(io.BytesIO(worksheet))
@@ -0,0 +1,143 @@
+import pytest
+
+from models.course import Course
+from models.enrollment import EnrollmentModel
+from models.student import StudentModel
+from services.course import CourseService
+from services.enrollment import EnrollmentService
+from services.roster_index import RosterIndex, RosterIndexRegistry
+from services.student import StudentService
+from tests.mocks.repositories.course_repository_mock import MockCourseRepository
+from tests.mocks.repositories.enrollment_import_repository_mock import (
+    MockEnrollmentImportRepository,
+)
+from tests.mocks.repositories.enrollment_repository_mock import MockEnrollmentRepository
+from tests.mocks.repositories.student_repository_mock import MockStudentRepository
+
+pytestmark = pytest.mark.unit
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_roster_index_owner_lookup():
+    octocat = StudentModel(email="a@example.com", github_id=1)
+    index = RosterIndex("course", [octocat, StudentModel(email="b@example.com")])
+
+    assert index.owner(1) == octocat
+    assert index.owner(2) is None
+    assert len(index) == 2
+
+
+def test_roster_index_add_replaces_changed_github_id():
+    student = StudentModel(email="a@example.com", github_id=1)
+    index = RosterIndex("course", [student])
+
+    index.add(student.model_copy(update={"github_id": 2}))
+
+    assert index.owner(1) is None
+    assert index.owner(2).id == student.id
+
+
+def test_roster_index_remove():
+    student = StudentModel(email="a@example.com", github_id=1)
+    index = RosterIndex("course", [student])
+
+    index.remove(student.id)
+
+    assert index.owner(1) is None
+    assert student.id not in index
+
+
+@pytest.fixture
+def registry_context():
+    student_repo = MockStudentRepository()
+    enrollment_repo = MockEnrollmentRepository()
+    clock = FakeClock()
+    registry = RosterIndexRegistry(enrollment_repo, student_repo, ttl_seconds=60, clock=clock)
+
+    student = student_repo.create(StudentModel(email="a@example.com", github_id=1))
+    enrollment_repo.add_enrollment(EnrollmentModel(student_id=student.id, course_id="course"))
+
+    return registry, student_repo, enrollment_repo, clock
+
+
+def test_registry_builds_index_once(registry_context):
+    registry, _, enrollment_repo, _ = registry_context
+
+    first = registry.get("course")
+    enrollment_repo.add_enrollment(EnrollmentModel(student_id="other", course_id="course"))
+
+    assert registry.get("course") is first
+    assert first.owner(1) is not None
+
+
+def test_registry_hooks_update_index_incrementally(registry_context):
+    registry, student_repo, _, _ = registry_context
+    index = registry.get("course")
+
+    hubot = student_repo.create(StudentModel(email="b@example.com"))
+    registry.enrolled("course", hubot)
+    registry.student_changed(hubot.model_copy(update={"github_id": 2}))
+
+    assert index.owner(2).id == hubot.id
+
+    registry.unenrolled("course", hubot.id)
+
+    assert index.owner(2) is None
+
+
+def test_registry_rebuilds_after_ttl(registry_context):
+    registry, _, _, clock = registry_context
+    first = registry.get("course")
+
+    clock.now = 61
+
+    assert registry.get("course") is not first
+
+
+def test_deleted_student_leaves_cached_rosters(registry_context):
+    registry, student_repo, _, _ = registry_context
+    [student] = registry.get("course").students()
+
+    StudentService(student_repo, roster_indexes=registry).delete_student(student.id)
+
+    roster = registry.get("course")
+    assert student.id not in roster
+    assert roster.owner(1) is None
+
+
+def test_deleted_course_drops_its_roster(registry_context):
+    registry, _, enrollment_repo, _ = registry_context
+    course_repo = MockCourseRepository()
+    course_repo.create(Course(id="course", name="Course"))
+    first = registry.get("course")
+    service = CourseService(
+        course_repo, enrollment_repository=enrollment_repo, roster_indexes=registry
+    )
+
+    service.delete_course("course")
+
+    assert registry.get("course") is not first
+
+
+def test_removed_enrollment_leaves_roster(registry_context):
+    registry, student_repo, enrollment_repo, _ = registry_context
+    [student] = registry.get("course").students()
+    service = EnrollmentService(
+        student_repo,
+        MockCourseRepository(),
+        enrollment_repo,
+        MockEnrollmentImportRepository(student_repo, enrollment_repo),
+        roster_indexes=registry,
+    )
+
+    assert service.remove_enrollment("course", student.id) is True
+
+    assert student.id not in registry.get("course")
+    assert enrollment_repo.get_students_for_course("course") == []